@@ -1,13 +1,33 @@
-from typing import Literal
+from typing import Any, TYPE_CHECKING
 
-from src.anomaly_detection.models.detectors.detector import FactoryAnomalyDetector
+from src.anomaly_detection.models.detectors.detector import DetectorName, FactoryAnomalyDetector, register_detector
 from src.anomaly_detection.utils.types import AnomalyDetector
 
+if TYPE_CHECKING:
+    from src.anomaly_detection.utils.ingestion import ColumnarDataset
 
-def get_detector(
-    detector: Literal["autoencoder", "block_maxima", "dbscan", "iso_forest", "mad", "1_class_svm", "pot", "z_score"]
-) -> AnomalyDetector:
-    return FactoryAnomalyDetector(detector=detector)()
+
+def get_detector(detector: DetectorName | str, cached: bool = False, **params: Any) -> AnomalyDetector:
+    """Get a detector by name, configured with the given parameters.
+
+    Args:
+        :detector (str): The name of a built-in detector or of one registered with `register_detector` or an entry
+            point of the `detecto.detectors` group.
+        :cached (bool): Whether to copy the cached, ready prototype of this configuration instead of building the
+            detector from scratch. Every call still gets its own detector.
+        :params (Any): The parameters to set on the detector, e.g. `pot_th=0.99`.
+
+    Returns:
+        :AnomalyDetector (AnomalyDetector): The configured detector.
+    """
+    return FactoryAnomalyDetector(detector, **params)(cached=cached)
+
+
+def read_dataset(path: str, features: list[str] | None = None) -> "ColumnarDataset":
+    # Ingestion needs pandas, which is only imported once a dataset is actually read.
+    from src.anomaly_detection.utils.ingestion import read_columnar
+
+    return read_columnar(path=path, features=features)
 
 
 if __name__ == "__main__":
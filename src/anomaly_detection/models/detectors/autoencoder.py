@@ -1,14 +1,93 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from pandas import DataFrame
 
 from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.utils.ingestion import ColumnarDataset, to_columnar_dataset
+from src.anomaly_detection.utils.moments import standardize
+from src.anomaly_detection.utils.network import DenseAutoencoder
 
 
 class AutoencoderAnomalyDetector(AnomalyDetector):
-    def compute_anomaly_score(self, dataset: DataFrame) -> DataFrame:
-        pass
+    def __init__(self):
+        super().__init__()
+        self.__window = 16
+        self.__latent_size = 4
+        self.__ae_quantile = 0.99
+        self.total_epochs = 20
+        self.batch_size = 256
+        self.learning_rate = 1e-2
+        self.seed: int | None = None
+        self.autoencoders: dict[str, DenseAutoencoder] = {}
 
-    def detect_anomaly(self, dataset: DataFrame) -> DataFrame:
-        pass
+    @property
+    def window(self) -> int:
+        return self.__window
+
+    @window.setter
+    def window(self, window: int) -> None:
+        if window < 2:
+            raise ValueError("Autoencoder window needs at least 2 rows")
+        self.__window = window
+
+    @property
+    def latent_size(self) -> int:
+        return self.__latent_size
+
+    @latent_size.setter
+    def latent_size(self, latent_size: int) -> None:
+        if latent_size < 1:
+            raise ValueError("Autoencoder latent size can only be a positive number of units")
+        self.__latent_size = latent_size
+
+    @property
+    def ae_quantile(self) -> float:
+        return self.__ae_quantile
+
+    @ae_quantile.setter
+    def ae_quantile(self, quantile: float) -> None:
+        if not 0.0 < quantile < 1.0:
+            raise ValueError("Autoencoder quantile of the calibration errors can only be between 0 and 1")
+        self.__ae_quantile = quantile
+
+    def compute_anomaly_score(self, dataset: DataFrame | ColumnarDataset) -> DataFrame:
+        columnar_dataset = to_columnar_dataset(df=dataset)
+        values = columnar_dataset.values
+        t0 = self._calibration_rows(total_rows=values.shape[0])
+        standardized = standardize(values=values, calibration_rows=t0).astype(np.float32)
+        hidden_size = max(self.window // 2, self.latent_size)
+        layer_sizes = [self.window, hidden_size, self.latent_size, hidden_size, self.window]
+
+        anomaly_score = np.full(values.shape, np.nan)
+        self.autoencoders = {}
+        for idx, feature in enumerate(columnar_dataset.features if values.shape[0] >= self.window else []):
+            # Every row is scored by the reconstruction of the window of the feature's `window` most recent values.
+            windows = sliding_window_view(standardized[:, idx], window_shape=self.window)
+            calibration_windows = windows[: max(t0 - self.window + 1, 1)]
+            autoencoder = DenseAutoencoder(
+                layer_sizes=layer_sizes,
+                learning_rate=self.learning_rate,
+                seed=None if self.seed is None else self.seed + idx,
+            )
+            autoencoder.fit(inputs=calibration_windows, total_epochs=self.total_epochs, batch_size=self.batch_size)
+            self.autoencoders[feature] = autoencoder
+            # The errors are scaled by a high quantile of the calibration errors, so that 1 is the usual worst case.
+            calibration_error = autoencoder.reconstruction_error(inputs=calibration_windows)
+            error_scale = np.nanquantile(calibration_error, self.ae_quantile)
+            first_row = max(t0, self.window - 1)
+            anomaly_score[first_row:, idx] = autoencoder.reconstruction_error(
+                inputs=windows[first_row - self.window + 1 :]
+            ) / np.where(error_scale > 0, error_scale, 1.0)
+        return DataFrame(
+            data=anomaly_score[t0:],
+            index=columnar_dataset.index[t0:],
+            columns=[f"anomaly_score_{feature}" for feature in columnar_dataset.features],
+        )
+
+    @property
+    def anomaly_score_th(self) -> float:
+        # The anomaly score is the reconstruction error in units of the `ae_quantile` of the calibration errors.
+        return 1.0
 
     def __str__(self) -> str:
         return "Autoencoder Anomaly Detector"
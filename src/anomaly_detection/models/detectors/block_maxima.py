@@ -1,14 +1,74 @@
+import numpy as np
+from numpy.typing import NDArray
 from pandas import DataFrame
 
 from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.utils.gev import block_maxima, fit_gev, gev_anomaly_score
+from src.anomaly_detection.utils.ingestion import ColumnarDataset, to_columnar_dataset
 
 
 class BlockMaximaAnomalyDetector(AnomalyDetector):
-    def compute_anomaly_score(self, dataset: DataFrame) -> DataFrame:
-        pass
+    def __init__(self):
+        super().__init__()
+        self.__bm_th = 0.97
+        self.__block_size = 30
+        self.gev_shape: NDArray[np.float64] | None = None
+        self.gev_location: NDArray[np.float64] | None = None
+        self.gev_scale: NDArray[np.float64] | None = None
 
-    def detect_anomaly(self, dataset: DataFrame) -> DataFrame:
-        pass
+    @property
+    def bm_th(self) -> float:
+        return self.__bm_th
+
+    @bm_th.setter
+    def bm_th(self, th: float) -> None:
+        if th < 0.0:
+            raise ValueError("Threshold value can only be between 0. and 1.0")
+        elif th >= 1.0:
+            raise ValueError("Threshold value can only be between 0. and 1.0")
+        self.__bm_th = th
+
+    @property
+    def block_size(self) -> int:
+        return self.__block_size
+
+    @block_size.setter
+    def block_size(self, block_size: int) -> None:
+        if block_size < 1:
+            raise ValueError("Block size can only be a positive number of rows")
+        self.__block_size = block_size
+
+    def compute_block_maxima(self, dataset: DataFrame | ColumnarDataset) -> DataFrame:
+        columnar_dataset = to_columnar_dataset(df=dataset)
+        t0 = self._calibration_rows(total_rows=len(columnar_dataset))
+        return DataFrame(
+            data=block_maxima(values=columnar_dataset.values[:t0], block_size=self.block_size),
+            index=columnar_dataset.index[:t0][:: self.block_size],
+            columns=columnar_dataset.features,
+        )
+
+    def compute_anomaly_score(self, dataset: DataFrame | ColumnarDataset) -> DataFrame:
+        columnar_dataset = to_columnar_dataset(df=dataset)
+        # The GEV is fitted on the maxima of the blocks of the first t0 rows, every later value is scored by how many
+        # blocks it takes until their maximum exceeds it.
+        maxima = self.compute_block_maxima(dataset=columnar_dataset)
+        t0 = self._calibration_rows(total_rows=len(columnar_dataset))
+        self.gev_shape, self.gev_location, self.gev_scale = fit_gev(maxima=maxima.to_numpy())
+        return DataFrame(
+            data=gev_anomaly_score(
+                values=columnar_dataset.values[t0:],
+                shape=self.gev_shape,
+                location=self.gev_location,
+                scale=self.gev_scale,
+            ),
+            index=columnar_dataset.index[t0:],
+            columns=[f"anomaly_score_{feature}" for feature in columnar_dataset.features],
+        )
+
+    @property
+    def anomaly_score_th(self) -> float:
+        # A value is anomalous beyond the `bm_th` quantile of the block maxima, i.e. when P(M > x) < 1 - bm_th.
+        return 1 / (1 - self.bm_th)
 
     def __str__(self) -> str:
         return "Block-Maxima Anomaly Detector"
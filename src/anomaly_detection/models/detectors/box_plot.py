@@ -0,0 +1,60 @@
+import numpy as np
+from pandas import DataFrame
+
+from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.utils.ingestion import ColumnarDataset, to_columnar_dataset
+from src.anomaly_detection.utils.quantile import quartiles
+
+
+class BoxPlotAnomalyDetector(AnomalyDetector):
+    def __init__(self):
+        super().__init__()
+        self.__iqr_th = 1.5
+        self.__window: int | None = None
+
+    @property
+    def iqr_th(self) -> float:
+        return self.__iqr_th
+
+    @iqr_th.setter
+    def iqr_th(self, th: float) -> None:
+        if th < 0.0:
+            raise ValueError("IQR threshold can only be a non-negative number of interquartile ranges")
+        self.__iqr_th = th
+
+    @property
+    def window(self) -> int | None:
+        return self.__window
+
+    @window.setter
+    def window(self, window: int | None) -> None:
+        if window is not None and window < 2:
+            raise ValueError("Box plot window needs at least 2 rows or None for an expanding window")
+        self.__window = window
+
+    def compute_anomaly_score(self, dataset: DataFrame | ColumnarDataset) -> DataFrame:
+        columnar_dataset = to_columnar_dataset(df=dataset)
+        values = columnar_dataset.values
+        t0 = self._calibration_rows(total_rows=values.shape[0])
+        # Every value is compared with the box of the values before it, never with itself.
+        q1, q3 = quartiles(values=values[:-1], window=self.window, min_period=1)
+        q1 = np.concatenate((np.full((1, values.shape[1]), np.nan), q1))[t0:]
+        q3 = np.concatenate((np.full((1, values.shape[1]), np.nan), q3))[t0:]
+        # The score is the distance outside the box in interquartile ranges, 0 inside the box and inf off a flat box.
+        distance = np.maximum(np.maximum(q1 - values[t0:], values[t0:] - q3), 0.0)
+        with np.errstate(divide="ignore"):
+            anomaly_score = np.divide(
+                distance, q3 - q1, out=np.where(np.isnan(distance), np.nan, 0.0), where=distance > 0.0
+            )
+        return DataFrame(
+            data=anomaly_score,
+            index=columnar_dataset.index[t0:],
+            columns=[f"anomaly_score_{feature}" for feature in columnar_dataset.features],
+        )
+
+    @property
+    def anomaly_score_th(self) -> float:
+        return self.iqr_th
+
+    def __str__(self) -> str:
+        return "Box-Plot Anomaly Detector"
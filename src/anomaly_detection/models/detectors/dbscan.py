@@ -1,14 +1,75 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from pandas import DataFrame
 
-from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.models.detectors.interface import ParallelAnomalyDetector
+from src.anomaly_detection.utils.ingestion import ColumnarDataset, to_columnar_dataset
+from src.anomaly_detection.utils.moments import standardize
+from src.anomaly_detection.utils.neighbors import dbscan_core_distance
 
 
-class DBSCANAnomalyDetector(AnomalyDetector):
-    def compute_anomaly_score(self, dataset: DataFrame) -> DataFrame:
-        pass
+class DBSCANAnomalyDetector(ParallelAnomalyDetector):
+    def __init__(self):
+        super().__init__()
+        self.__eps = 0.5
+        self.__min_samples = 5
+        self.__window = 1
 
-    def detect_anomaly(self, dataset: DataFrame) -> DataFrame:
-        pass
+    @property
+    def eps(self) -> float:
+        return self.__eps
+
+    @eps.setter
+    def eps(self, eps: float) -> None:
+        if eps <= 0.0:
+            raise ValueError("DBSCAN eps can only be a positive distance in standard deviations")
+        self.__eps = eps
+
+    @property
+    def min_samples(self) -> int:
+        return self.__min_samples
+
+    @min_samples.setter
+    def min_samples(self, min_samples: int) -> None:
+        if min_samples < 1:
+            raise ValueError("DBSCAN min_samples can only be a positive number of points")
+        self.__min_samples = min_samples
+
+    @property
+    def window(self) -> int:
+        return self.__window
+
+    @window.setter
+    def window(self, window: int) -> None:
+        if window < 1:
+            raise ValueError("DBSCAN window can only be a positive number of rows")
+        self.__window = window
+
+    def compute_anomaly_score(self, dataset: DataFrame | ColumnarDataset) -> DataFrame:
+        columnar_dataset = to_columnar_dataset(df=dataset)
+        values = columnar_dataset.values
+        t0 = self._calibration_rows(total_rows=values.shape[0])
+        # Every feature is standardized on its first t0 rows so that `eps` is a distance in standard deviations.
+        standardized = standardize(values=values, calibration_rows=t0)
+
+        anomaly_score = np.full(values.shape, np.nan)
+        for idx in range(values.shape[1] if values.shape[0] >= self.window else 0):
+            # A point is the feature's `window` most recent values, the earlier rows have no complete point.
+            points = sliding_window_view(standardized[:, idx], window_shape=self.window)
+            anomaly_score[values.shape[0] - points.shape[0] :, idx] = (
+                dbscan_core_distance(points=points, eps=self.eps, min_samples=self.min_samples, n_jobs=self.n_jobs)
+                / self.eps
+            )
+        return DataFrame(
+            data=anomaly_score[t0:],
+            index=columnar_dataset.index[t0:],
+            columns=[f"anomaly_score_{feature}" for feature in columnar_dataset.features],
+        )
+
+    @property
+    def anomaly_score_th(self) -> float:
+        # The anomaly score is the distance to the nearest core point in units of eps, beyond 1 a point is noise.
+        return 1.0
 
     def __str__(self) -> str:
         return "DBSCAN Anomaly Detector"
@@ -1,46 +1,105 @@
-from typing import Literal
+from copy import copy
+from importlib import import_module
+from typing import Any, Literal
 
 from src.anomaly_detection.utils.types import AnomalyDetector
 
+DetectorName = Literal[
+    "autoencoder", "block_maxima", "box_plot", "dbscan", "iso_forest", "mad", "1_class_svm", "pot", "z_score"
+]
+# Third-party packages register detectors under this entry point group, e.g. `my_detector = "my_package.module:Class"`.
+ENTRY_POINT_GROUP = "detecto.detectors"
+# The module of a detector is only imported when the detector is requested, so importing the factory loads neither
+# the detectors nor pandas or scipy. The imported class then replaces its path.
+DETECTOR_REGISTRY: dict[str, str | type] = {
+    "autoencoder": "src.anomaly_detection.models.detectors.autoencoder:AutoencoderAnomalyDetector",
+    "block_maxima": "src.anomaly_detection.models.detectors.block_maxima:BlockMaximaAnomalyDetector",
+    "box_plot": "src.anomaly_detection.models.detectors.box_plot:BoxPlotAnomalyDetector",
+    "dbscan": "src.anomaly_detection.models.detectors.dbscan:DBSCANAnomalyDetector",
+    "iso_forest": "src.anomaly_detection.models.detectors.isolation_forest:IsoForestAnomalyDetector",
+    "mad": "src.anomaly_detection.models.detectors.mad:MADAnomalyDetector",
+    "1_class_svm": "src.anomaly_detection.models.detectors.one_class_svm:OneClassSVMAnomalyDetector",
+    "pot": "src.anomaly_detection.models.detectors.pot:POTAnomalyDetector",
+    "z_score": "src.anomaly_detection.models.detectors.zscore:ZScoreAnomalyDetector",
+}
+# The configured, never fitted prototype of every detector name and parameters that was requested with
+# `cached=True`. Callers get a copy of it, so no state is shared between them.
+DETECTOR_PROTOTYPES: dict[tuple[str, tuple[tuple[str, Any], ...]], AnomalyDetector] = {}
+
+
+def register_detector(name: str, detector: str | type) -> None:
+    """Register a detector class, or its lazy `"module:Class"` path, under a name for `get_detector`.
+
+    Args:
+        :name (str): The name to request the detector by, an existing name is replaced.
+        :detector (str | type): The detector class or the path to import it from on the first request.
+    """
+    DETECTOR_REGISTRY[name] = detector
+    for key in [key for key in DETECTOR_PROTOTYPES if key[0] == name]:
+        del DETECTOR_PROTOTYPES[key]
 
-class FactoryAnomalyDetector:
-    def __init__(
-        self,
-        detector: Literal[
-            "autoencoder", "block_maxima", "dbscan", "iso_forest", "mad", "1_class_svm", "pot", "z_score"
-        ],
-    ):
-        self.detector = detector
 
-    def __call__(self) -> AnomalyDetector:
-        if self.detector == "autoencoder":
-            from src.anomaly_detection.models.detectors.autoencoder import AutoencoderAnomalyDetector
+def clear_detector_cache() -> None:
+    """Drop all cached detector prototypes, the next cached request for every configuration builds a new one."""
+    DETECTOR_PROTOTYPES.clear()
 
-            return AutoencoderAnomalyDetector()
-        elif self.detector == "block_maxima":
-            from src.anomaly_detection.models.detectors.block_maxima import BlockMaximaAnomalyDetector
 
-            return BlockMaximaAnomalyDetector()
-        elif self.detector == "dbscan":
-            from src.anomaly_detection.models.detectors.dbscan import DBSCANAnomalyDetector
+def resolve_detector_class(name: str) -> type:
+    """Find the detector class registered under a name, looking through the installed entry points if needed.
 
-            return DBSCANAnomalyDetector()
-        elif self.detector == "iso_forest":
-            from src.anomaly_detection.models.detectors.isolation_forest import IsoForestAnomalyDetector
+    Args:
+        :name (str): The name of the detector.
 
-            return IsoForestAnomalyDetector()
-        elif self.detector == "mad":
-            from src.anomaly_detection.models.detectors.mad import MADAnomalyDetector
+    Returns:
+        :detector_class (type): The class of the detector, a subclass of `AnomalyDetector`.
+    """
+    if name not in DETECTOR_REGISTRY:
+        from importlib.metadata import entry_points
 
-            return MADAnomalyDetector()
-        elif self.detector == "1_class_svm":
-            from src.anomaly_detection.models.detectors.one_class_svm import OneClassSVMAnomalyDetector
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            DETECTOR_REGISTRY.setdefault(entry_point.name, entry_point.value)
+    if name not in DETECTOR_REGISTRY:
+        raise ValueError(f"Unknown detector {name!r}, the registered detectors are {sorted(DETECTOR_REGISTRY)}")
+    detector = DETECTOR_REGISTRY[name]
+    resolved: Any = detector
+    if isinstance(detector, str):
+        module_name, _, qualname = detector.partition(":")
+        resolved = import_module(module_name)
+        for attribute in qualname.split("."):
+            resolved = getattr(resolved, attribute)
+    from src.anomaly_detection.models.detectors.interface import AnomalyDetector as AnomalyDetectorInterface
 
-            return OneClassSVMAnomalyDetector()
-        elif self.detector == "pot":
-            from src.anomaly_detection.models.detectors.pot import POTAnomalyDetector
+    if not isinstance(resolved, type) or not issubclass(resolved, AnomalyDetectorInterface):
+        raise ValueError(f"Detector {name!r} does not implement the AnomalyDetector interface")
+    DETECTOR_REGISTRY[name] = resolved
+    return resolved
+
+
+class FactoryAnomalyDetector:
+    def __init__(self, detector: DetectorName | str, **params: Any):
+        self.detector = detector
+        self.params = params
 
-            return POTAnomalyDetector()
-        from src.anomaly_detection.models.detectors.zscore import ZScoreAnomalyDetector
+    def build(self) -> AnomalyDetector:
+        detector = resolve_detector_class(name=self.detector)()
+        for name, value in self.params.items():
+            # Only settable properties are parameters, their setters validate every value.
+            parameter = getattr(type(detector), name, None)
+            if name.startswith("_") or not isinstance(parameter, property) or parameter.fset is None:
+                raise ValueError(f"{detector} has no parameter {name!r}")
+            setattr(detector, name, value)
+        return detector
 
-        return ZScoreAnomalyDetector()
+    def __call__(self, cached: bool = False) -> AnomalyDetector:
+        if not cached:
+            return self.build()
+        try:
+            key = (self.detector, tuple(sorted(self.params.items())))
+            hash(key)
+        except TypeError:
+            raise ValueError("A cached detector needs hashable parameters") from None
+        if key not in DETECTOR_PROTOTYPES:
+            DETECTOR_PROTOTYPES[key] = self.build()
+        # The prototype is resolved and validated once and never fitted. Fitting replaces the containers of a detector
+        # instead of changing them in place, so a shallow copy is enough to keep every caller's state its own.
+        return copy(DETECTOR_PROTOTYPES[key])
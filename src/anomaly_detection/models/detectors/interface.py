@@ -1,9 +1,41 @@
 from abc import ABCMeta, abstractmethod
+from typing import cast, TypeVar
 
 from pandas import DataFrame
 
+from src.anomaly_detection.utils.persistence import load_detector, save_detector
+from src.anomaly_detection.utils.timeframe import calculate_timeframe
+
+Detector = TypeVar("Detector", bound="AnomalyDetector")
+
 
 class AnomalyDetector(metaclass=ABCMeta):
+    def __init__(self):
+        self.t0: int | None = None
+        self.t1: int | None = None
+        self.t2: int | None = None
+
+    @property
+    @abstractmethod
+    def anomaly_score_th(self) -> float:
+        """The anomaly score above which `detect_anomaly` flags a data point, every detector defines its own."""
+
+    def set_timeframe(
+        self, total_rows: int, t0_percentage: float = 0.6, t1_percentage: float = 0.25, t2_percentage: float = 0.15
+    ) -> None:
+        self.t0, self.t1, self.t2 = calculate_timeframe(
+            total_rows=total_rows,
+            t0_percentage=t0_percentage,
+            t1_percentage=t1_percentage,
+            t2_percentage=t2_percentage,
+        )
+
+    def _calibration_rows(self, total_rows: int) -> int:
+        # The number of rows t0 the detector calibrates on, the default timeframe of the dataset when none is set.
+        if self.t0 is None:
+            self.set_timeframe(total_rows=total_rows)
+        return cast(int, self.t0)
+
     @abstractmethod
     def compute_anomaly_score(self, dataset: DataFrame) -> DataFrame:
         """A function to prepare the dataset by calculating the anomaly score for a chosen time interval.
@@ -17,9 +49,8 @@ class AnomalyDetector(metaclass=ABCMeta):
             :AnomalyScoreDataset (pd.DataFrame): The processed dataset with anomaly score for each data point.
         """
 
-    @abstractmethod
     def detect_anomaly(self, dataset: DataFrame) -> DataFrame:
-        """A function to detect the anomalous data.
+        """A function to detect the anomalous data, every `anomaly_score_<feature>` above `anomaly_score_th`.
 
         Args:
             :dataset (dict | pd.DataFrame): A Pandas DataFrame of anomaly scores with a certain time interval e.g. daily.
@@ -27,3 +58,53 @@ class AnomalyDetector(metaclass=ABCMeta):
         Returns:
             :AnomalyDataset (pd.DataFrame): The processed dataset that reveals the anomalous data.
         """
+        anomaly_score_columns = [column for column in dataset.columns if str(column).startswith("anomaly_score_")]
+        return DataFrame(
+            data=dataset[anomaly_score_columns].to_numpy(dtype="float64") > self.anomaly_score_th,
+            index=dataset.index,
+            columns=[f"is_anomaly_{str(column)[len('anomaly_score_'):]}" for column in anomaly_score_columns],
+        )
+
+    def save(self, path: str) -> None:
+        """A function to save the detector with its settings and fitted models as a versioned `.npz` bundle.
+
+        Args:
+            :path (str): The file to write the bundle to.
+        """
+        save_detector(path=path, detector=self)
+
+    @classmethod
+    def load(cls: type[Detector], path: str, mmap: bool = True) -> Detector:
+        """A function to load a detector saved with `save`, its arrays memory-mapped by default.
+
+        Args:
+            :path (str): The file to read the bundle from.
+            :mmap (bool): Whether the arrays are memory-mapped copy-on-write instead of read into memory.
+
+        Returns:
+            :AnomalyDetector (AnomalyDetector): The detector with the state it was saved with.
+        """
+        detector = load_detector(path=path, mmap=mmap)
+        if not isinstance(detector, cls):
+            raise ValueError(f"The bundle holds a {type(detector).__name__}, not a {cls.__name__}.")
+        return detector
+
+
+class ParallelAnomalyDetector(AnomalyDetector):
+    """An anomaly detector whose work can be spread over `n_jobs` processes or threads."""
+
+    def __init__(self):
+        super().__init__()
+        self.__n_jobs = 1
+
+    @property
+    def n_jobs(self) -> int:
+        return self.__n_jobs
+
+    @n_jobs.setter
+    def n_jobs(self, n_jobs: int) -> None:
+        if n_jobs == 0:
+            raise ValueError(
+                "Number of jobs can only be a positive number or a negative one counting back from all CPUs"
+            )
+        self.__n_jobs = n_jobs
@@ -1,14 +1,81 @@
+import numpy as np
 from pandas import DataFrame
 
-from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.models.detectors.interface import ParallelAnomalyDetector
+from src.anomaly_detection.utils.ingestion import ColumnarDataset, to_columnar_dataset
+from src.anomaly_detection.utils.isolation import IsolationForest
 
 
-class IsoForestAnomalyDetector(AnomalyDetector):
-    def compute_anomaly_score(self, dataset: DataFrame) -> DataFrame:
-        pass
+class IsoForestAnomalyDetector(ParallelAnomalyDetector):
+    def __init__(self):
+        super().__init__()
+        self.__iso_th = 0.6
+        self.__total_trees = 100
+        self.__sample_size = 256
+        self.seed: int | None = None
+        self.forests: dict[str, IsolationForest] = {}
 
-    def detect_anomaly(self, dataset: DataFrame) -> DataFrame:
-        pass
+    @property
+    def iso_th(self) -> float:
+        return self.__iso_th
+
+    @iso_th.setter
+    def iso_th(self, th: float) -> None:
+        if th <= 0.0 or th >= 1.0:
+            raise ValueError("Isolation Forest threshold can only be a number between 0 and 1")
+        self.__iso_th = th
+
+    @property
+    def total_trees(self) -> int:
+        return self.__total_trees
+
+    @total_trees.setter
+    def total_trees(self, total_trees: int) -> None:
+        if total_trees < 1:
+            raise ValueError("Isolation Forest needs at least 1 tree")
+        self.__total_trees = total_trees
+
+    @property
+    def sample_size(self) -> int:
+        return self.__sample_size
+
+    @sample_size.setter
+    def sample_size(self, sample_size: int) -> None:
+        if sample_size < 2:
+            raise ValueError("Isolation Forest needs at least 2 rows to grow every tree on")
+        self.__sample_size = sample_size
+
+    def fit(self, dataset: DataFrame | ColumnarDataset) -> None:
+        columnar_dataset = to_columnar_dataset(df=dataset)
+        values = columnar_dataset.values
+        t0 = self._calibration_rows(total_rows=values.shape[0])
+        # One forest per feature, grown on the first t0 rows, like the thresholds of every other detector.
+        self.forests = {
+            feature: IsolationForest(
+                total_trees=self.total_trees,
+                sample_size=self.sample_size,
+                seed=None if self.seed is None else self.seed + idx,
+            ).fit(values=values[:t0, idx : idx + 1], n_jobs=self.n_jobs)
+            for idx, feature in enumerate(columnar_dataset.features)
+        }
+
+    def compute_anomaly_score(self, dataset: DataFrame | ColumnarDataset) -> DataFrame:
+        columnar_dataset = to_columnar_dataset(df=dataset)
+        self.fit(dataset=columnar_dataset)
+        t0 = self._calibration_rows(total_rows=len(columnar_dataset))
+        values = columnar_dataset.values[t0:]
+        anomaly_score = np.empty(values.shape)
+        for idx, feature in enumerate(columnar_dataset.features):
+            anomaly_score[:, idx] = self.forests[feature].score(values=values[:, idx : idx + 1], n_jobs=self.n_jobs)
+        return DataFrame(
+            data=anomaly_score,
+            index=columnar_dataset.index[t0:],
+            columns=[f"anomaly_score_{feature}" for feature in columnar_dataset.features],
+        )
+
+    @property
+    def anomaly_score_th(self) -> float:
+        return self.iso_th
 
     def __str__(self) -> str:
         return "Isolation Forest Anomaly Detector"
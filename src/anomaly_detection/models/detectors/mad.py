@@ -1,14 +1,55 @@
+import numpy as np
 from pandas import DataFrame
 
 from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.utils.ingestion import ColumnarDataset, to_columnar_dataset
+from src.anomaly_detection.utils.median import MAD_SCALE, median_absolute_deviation
+from src.anomaly_detection.utils.moments import absolute_z_score
 
 
 class MADAnomalyDetector(AnomalyDetector):
-    def compute_anomaly_score(self, dataset: DataFrame) -> DataFrame:
-        pass
+    def __init__(self):
+        super().__init__()
+        self.__mad_th = 3.5
+        self.__window: int | None = None
 
-    def detect_anomaly(self, dataset: DataFrame) -> DataFrame:
-        pass
+    @property
+    def mad_th(self) -> float:
+        return self.__mad_th
+
+    @mad_th.setter
+    def mad_th(self, th: float) -> None:
+        if th <= 0.0:
+            raise ValueError("MAD threshold can only be a positive number of scaled MADs")
+        self.__mad_th = th
+
+    @property
+    def window(self) -> int | None:
+        return self.__window
+
+    @window.setter
+    def window(self, window: int | None) -> None:
+        if window is not None and window < 2:
+            raise ValueError("MAD window needs at least 2 rows or None for an expanding window")
+        self.__window = window
+
+    def compute_anomaly_score(self, dataset: DataFrame | ColumnarDataset) -> DataFrame:
+        columnar_dataset = to_columnar_dataset(df=dataset)
+        values = columnar_dataset.values
+        t0 = self._calibration_rows(total_rows=values.shape[0])
+        # Every value is compared with the median and MAD of the values before it, never with itself.
+        median, mad = median_absolute_deviation(values=values[:-1], window=self.window)
+        median = np.concatenate((np.full((1, values.shape[1]), np.nan), median))
+        mad = np.concatenate((np.full((1, values.shape[1]), np.nan), mad))
+        return DataFrame(
+            data=absolute_z_score(values=values[t0:], mean=median[t0:], std=MAD_SCALE * mad[t0:]),
+            index=columnar_dataset.index[t0:],
+            columns=[f"anomaly_score_{feature}" for feature in columnar_dataset.features],
+        )
+
+    @property
+    def anomaly_score_th(self) -> float:
+        return self.mad_th
 
     def __str__(self) -> str:
         return "MAD Anomaly Detector"
@@ -1,14 +1,96 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from pandas import DataFrame
 
 from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.utils.ingestion import ColumnarDataset, to_columnar_dataset
+from src.anomaly_detection.utils.kernel import OneClassSVM
+from src.anomaly_detection.utils.moments import standardize
 
 
 class OneClassSVMAnomalyDetector(AnomalyDetector):
-    def compute_anomaly_score(self, dataset: DataFrame) -> DataFrame:
-        pass
+    def __init__(self):
+        super().__init__()
+        self.__nu = 0.05
+        self.__gamma: float | None = None
+        self.__total_components = 256
+        self.__window = 1
+        self.seed: int | None = None
+        self.models: dict[str, OneClassSVM] = {}
 
-    def detect_anomaly(self, dataset: DataFrame) -> DataFrame:
-        pass
+    @property
+    def nu(self) -> float:
+        return self.__nu
+
+    @nu.setter
+    def nu(self, nu: float) -> None:
+        if not 0.0 < nu <= 1.0:
+            raise ValueError("One-Class SVM nu can only be a share of the training rows between 0 and 1")
+        self.__nu = nu
+
+    @property
+    def gamma(self) -> float | None:
+        return self.__gamma
+
+    @gamma.setter
+    def gamma(self, gamma: float | None) -> None:
+        if gamma is not None and gamma <= 0.0:
+            raise ValueError("One-Class SVM gamma can only be a positive number or None for 1 / window")
+        self.__gamma = gamma
+
+    @property
+    def total_components(self) -> int:
+        return self.__total_components
+
+    @total_components.setter
+    def total_components(self, total_components: int) -> None:
+        if total_components < 1:
+            raise ValueError("One-Class SVM needs at least 1 random Fourier feature")
+        self.__total_components = total_components
+
+    @property
+    def window(self) -> int:
+        return self.__window
+
+    @window.setter
+    def window(self, window: int) -> None:
+        if window < 1:
+            raise ValueError("One-Class SVM window can only be a positive number of rows")
+        self.__window = window
+
+    def compute_anomaly_score(self, dataset: DataFrame | ColumnarDataset) -> DataFrame:
+        columnar_dataset = to_columnar_dataset(df=dataset)
+        values = columnar_dataset.values
+        t0 = self._calibration_rows(total_rows=values.shape[0])
+        # The RBF kernel of standardized points with gamma = 1 / window matches the usual `gamma="scale"`.
+        standardized = standardize(values=values, calibration_rows=t0)
+        gamma = 1.0 / self.window if self.gamma is None else self.gamma
+
+        anomaly_score = np.full(values.shape, np.nan)
+        self.models = {}
+        for idx, feature in enumerate(columnar_dataset.features if values.shape[0] >= self.window else []):
+            # A point is the feature's `window` most recent values, the earlier rows have no complete point.
+            points = sliding_window_view(standardized[:, idx], window_shape=self.window)
+            first_row = self.window - 1
+            self.models[feature] = OneClassSVM(
+                nu=self.nu,
+                gamma=gamma,
+                total_components=self.total_components,
+                seed=None if self.seed is None else self.seed + idx,
+            ).fit(values=points[: max(t0 - first_row, 1)])
+            anomaly_score[max(t0, first_row) :, idx] = self.models[feature].score(
+                values=points[max(t0 - first_row, 0) :]
+            )
+        return DataFrame(
+            data=anomaly_score[t0:],
+            index=columnar_dataset.index[t0:],
+            columns=[f"anomaly_score_{feature}" for feature in columnar_dataset.features],
+        )
+
+    @property
+    def anomaly_score_th(self) -> float:
+        # The anomaly score is the signed distance `rho - w z(x)` to the boundary, above 0 a point is outside.
+        return 0.0
 
     def __str__(self) -> str:
         return "One Class SVM Anomaly Detector"
@@ -1,17 +1,37 @@
-from pandas import DataFrame
+import os
+from collections.abc import Hashable, Mapping, Sequence
+from time import perf_counter
 
-from src.anomaly_detection.models.detectors.interface import AnomalyDetector
-from src.anomaly_detection.utils.math import calculate_peak_over_threshold, get_data_over_threshold
-from src.anomaly_detection.utils.timeframe import calculate_timeframe
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from pandas import DataFrame, RangeIndex
 
+from src.anomaly_detection.models.detectors.interface import ParallelAnomalyDetector
+from src.anomaly_detection.utils.batch import batch_pot_anomaly_score, split_long_format, to_series_list
+from src.anomaly_detection.utils.chunked import (
+    CHUNK_SIZE,
+    chunked_gpd_anomaly_score,
+    chunked_peak_over_threshold,
+    open_column_file,
+)
+from src.anomaly_detection.utils.gpd import fit_gpd, gpd_anomaly_score
+from src.anomaly_detection.utils.ingestion import ColumnarDataset, to_columnar_dataset
+from src.anomaly_detection.utils.parallel import parallel_peak_over_threshold_block
+from src.anomaly_detection.utils.results import BatchResult, POTResult
+from src.anomaly_detection.utils.spot import StreamingPOT
 
-class POTAnomalyDetector(AnomalyDetector):
+
+class POTAnomalyDetector(ParallelAnomalyDetector):
     def __init__(self):
-        self.t0: int | None = None
-        self.t1: int | None = None
-        self.t2: int | None = None
+        super().__init__()
         self.__pot_th = 0.97
         self.__t1_th = 0.97
+        self.__quantile_compression: float | None = None
+        self.__pot_window: int | None = None
+        self.pot_rank_error: dict[str, float] = {}
+        self.gpd_shape: NDArray[np.float64] | None = None
+        self.gpd_scale: NDArray[np.float64] | None = None
+        self.stream: StreamingPOT | None = None
 
     @property
     def pot_th(self) -> float:
@@ -37,28 +57,147 @@ class POTAnomalyDetector(AnomalyDetector):
             raise ValueError("Threshold value can only be between 0. and 1.0")
         self.__t1_th = th
 
-    def set_timeframe(
-        self, total_rows: int, t0_percentage: float = 0.6, t1_percentage: float = 0.25, t2_percentage: float = 0.15
-    ) -> None:
-        self.t0, self.t1, self.t2 = calculate_timeframe(
-            total_rows=total_rows,
-            t0_percentage=t0_percentage,
-            t1_percentage=t1_percentage,
-            t2_percentage=t2_percentage,
+    @property
+    def quantile_compression(self) -> float | None:
+        return self.__quantile_compression
+
+    @quantile_compression.setter
+    def quantile_compression(self, compression: float | None) -> None:
+        if compression is not None and compression <= 0.0:
+            raise ValueError("Quantile compression can only be a positive number or None for the exact quantile")
+        self.__quantile_compression = compression
+
+    @property
+    def pot_window(self) -> int | None:
+        return self.__pot_window
+
+    @pot_window.setter
+    def pot_window(self, window: int | None) -> None:
+        if window is not None and window < 1:
+            raise ValueError("POT window can only be a positive number of rows or None for an expanding window")
+        self.__pot_window = window
+
+    def compute_pot_data(self, df: DataFrame | ColumnarDataset) -> POTResult:
+        dataset = to_columnar_dataset(df=df)
+        pot_th, pot_data, rank_error = parallel_peak_over_threshold_block(
+            values=dataset.values,
+            min_period=self._calibration_rows(total_rows=len(dataset)),
+            quantile=self.pot_th,
+            compression=self.quantile_compression,
+            window=self.pot_window,
+            n_jobs=self.n_jobs,
+        )
+        self.pot_rank_error = dict(zip(dataset.features, rank_error.tolist()))
+        return POTResult(
+            features=dataset.features, index=dataset.index, pot_th=pot_th, pot_data=pot_data, rank_error=rank_error
+        )
+
+    def compute_anomaly_score(self, df: DataFrame | ColumnarDataset) -> DataFrame:
+        pot_result = self.compute_pot_data(df=df)
+        t0 = self._calibration_rows(total_rows=len(pot_result.index))
+        self.gpd_shape, self.gpd_scale = fit_gpd(exceedances=pot_result.pot_data[:t0])
+        return DataFrame(
+            data=gpd_anomaly_score(exceedances=pot_result.pot_data[t0:], shape=self.gpd_shape, scale=self.gpd_scale),
+            index=pot_result.index[t0:],
+            columns=[f"anomaly_score_{feature}" for feature in pot_result.features],
+        )
+
+    def compute_anomaly_score_batch(
+        self,
+        series: Mapping[Hashable, ArrayLike] | Sequence[ArrayLike] | DataFrame,
+        t0_percentage: float = 0.6,
+        series_column: str = "series_id",
+        timestamp_column: str = "ts",
+        value_column: str = "value",
+    ) -> BatchResult:
+        start = perf_counter()
+        if isinstance(series, DataFrame):
+            series_ids, timestamps, values = split_long_format(
+                df=series, series_column=series_column, timestamp_column=timestamp_column, value_column=value_column
+            )
+        else:
+            series_ids, values = to_series_list(series=series)
+            timestamps = [np.arange(series_values.shape[0]) for series_values in values]
+        t0 = (t0_percentage * np.fromiter((len(series_values) for series_values in values), dtype=np.int64)).astype(
+            np.int64
+        )
+        anomaly_scores = batch_pot_anomaly_score(
+            series=values,
+            t0=t0,
+            quantile=self.pot_th,
+            compression=self.quantile_compression,
+            window=self.pot_window,
+        )
+        return BatchResult(
+            series_ids=series_ids,
+            timestamps=[series_timestamps[series_t0:] for series_timestamps, series_t0 in zip(timestamps, t0)],
+            anomaly_scores=anomaly_scores,
+            total_seconds=perf_counter() - start,
+        )
+
+    def compute_pot_data_chunked(
+        self,
+        source: ArrayLike | str | os.PathLike,
+        features: list[str],
+        output_dir: str | os.PathLike,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> POTResult:
+        values = open_column_file(source=source)
+        pot_th, pot_data, rank_error = chunked_peak_over_threshold(
+            source=values,
+            output_dir=output_dir,
+            min_period=self._calibration_rows(total_rows=values.shape[0]),
+            quantile=self.pot_th,
+            compression=self.quantile_compression,
+            window=self.pot_window,
+            chunk_size=chunk_size,
+        )
+        self.pot_rank_error = dict(zip(features, rank_error.tolist()))
+        return POTResult(
+            features=features,
+            index=RangeIndex(stop=values.shape[0]),
+            pot_th=pot_th,
+            pot_data=pot_data,
+            rank_error=rank_error,
         )
 
-    def compute_pot_data(self, df: DataFrame) -> DataFrame:
+    def compute_anomaly_score_chunked(
+        self,
+        source: ArrayLike | str | os.PathLike,
+        features: list[str],
+        output_dir: str | os.PathLike,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> NDArray[np.float64]:
+        pot_result = self.compute_pot_data_chunked(
+            source=source, features=features, output_dir=output_dir, chunk_size=chunk_size
+        )
+        anomaly_score, self.gpd_shape, self.gpd_scale = chunked_gpd_anomaly_score(
+            pot_data=pot_result.pot_data,
+            output_dir=output_dir,
+            calibration_rows=self._calibration_rows(total_rows=pot_result.pot_data.shape[0]),
+            chunk_size=chunk_size,
+        )
+        return anomaly_score
+
+    def initialize_stream(self, df: DataFrame, risk: float = 1e-4, drift_depth: int | None = None) -> None:
+        t0 = self._calibration_rows(total_rows=df.shape[0])
         features = [feature for feature in df.columns if df[feature].dtype != object]
-        pot_th_df = calculate_peak_over_threshold(df=df, features=features, min_period=self.t0, quantile=self.pot_th)  # type: ignore
-        pot_data_df = get_data_over_threshold(df=pot_th_df, features=features)
-        return pot_data_df
+        self.stream = StreamingPOT(features=features, quantile=self.pot_th, risk=risk, drift_depth=drift_depth)
+        self.stream.initialize(values=df[features].iloc[:t0].to_numpy(dtype="float64"))
 
-    def compute_anomaly_score(self, df: DataFrame) -> DataFrame:
-        t1t2_df = df.iloc[self.t0 :]
-        pot_t1t2_df = t1t2_df[[feature for feature in t1t2_df.columns[1:] if "pot_data" in feature]]
+    def update(self, batch: DataFrame) -> DataFrame:
+        if self.stream is None:
+            raise ValueError("The stream must be initialized with `initialize_stream` before calling `update`")
+        return DataFrame(
+            data=self.stream.update(values=batch[self.stream.features].to_numpy(dtype="float64")),
+            index=batch.index,
+            columns=[f"is_anomaly_{feature}" for feature in self.stream.features],
+        )
 
-    def detect_anomaly(self, df: DataFrame) -> DataFrame:
-        pass
+    @property
+    def anomaly_score_th(self) -> float:
+        # A value is anomalous beyond the `t1_th` quantile of the GPD tail, i.e. when P(Y > y) < 1 - t1_th.
+        return np.inf if self.t1_th == 1.0 else 1 / (1 - self.t1_th)
 
     def __str__(self) -> str:
         return "POT Anomaly Detector"
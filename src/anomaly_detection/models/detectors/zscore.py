@@ -1,14 +1,76 @@
+import numpy as np
 from pandas import DataFrame
 
 from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.utils.ingestion import ColumnarDataset, to_columnar_dataset
+from src.anomaly_detection.utils.moments import absolute_z_score, rolling_mean_std, RunningMoments
 
 
 class ZScoreAnomalyDetector(AnomalyDetector):
-    def compute_anomaly_score(self, dataset: DataFrame) -> DataFrame:
-        pass
+    def __init__(self):
+        super().__init__()
+        self.__z_th = 3.0
+        self.__window: int | None = None
+        self.features: list[str] = []
+        self.moments: RunningMoments | None = None
 
-    def detect_anomaly(self, dataset: DataFrame) -> DataFrame:
-        pass
+    @property
+    def z_th(self) -> float:
+        return self.__z_th
+
+    @z_th.setter
+    def z_th(self, th: float) -> None:
+        if th <= 0.0:
+            raise ValueError("Z-Score threshold can only be a positive number of standard deviations")
+        self.__z_th = th
+
+    @property
+    def window(self) -> int | None:
+        return self.__window
+
+    @window.setter
+    def window(self, window: int | None) -> None:
+        if window is not None and window < 2:
+            raise ValueError("Z-Score window needs at least 2 rows or None for an expanding window")
+        self.__window = window
+
+    def compute_anomaly_score(self, dataset: DataFrame | ColumnarDataset) -> DataFrame:
+        columnar_dataset = to_columnar_dataset(df=dataset)
+        values = columnar_dataset.values
+        t0 = self._calibration_rows(total_rows=values.shape[0])
+        # Every value is compared with the moments of the values before it, never with itself.
+        if self.window is None:
+            mean, std = RunningMoments(total_features=values.shape[1]).update(values=values)
+        else:
+            mean, std = rolling_mean_std(values=values, window=self.window)
+            mean = np.concatenate((np.full((1, values.shape[1]), np.nan), mean[:-1]))
+            std = np.concatenate((np.full((1, values.shape[1]), np.nan), std[:-1]))
+        return DataFrame(
+            data=absolute_z_score(values=values[t0:], mean=mean[t0:], std=std[t0:]),
+            index=columnar_dataset.index[t0:],
+            columns=[f"anomaly_score_{feature}" for feature in columnar_dataset.features],
+        )
+
+    @property
+    def anomaly_score_th(self) -> float:
+        return self.z_th
+
+    def initialize_stream(self, df: DataFrame) -> None:
+        t0 = self._calibration_rows(total_rows=df.shape[0])
+        self.features = [feature for feature in df.columns if df[feature].dtype != object]
+        self.moments = RunningMoments(total_features=len(self.features))
+        self.moments.update(values=df[self.features].iloc[:t0].to_numpy(dtype="float64"))
+
+    def update(self, batch: DataFrame) -> DataFrame:
+        if self.moments is None:
+            raise ValueError("The stream must be initialized with `initialize_stream` before calling `update`")
+        values = batch[self.features].to_numpy(dtype="float64")
+        mean, std = self.moments.update(values=values)
+        return DataFrame(
+            data=absolute_z_score(values=values, mean=mean, std=std) > self.z_th,
+            index=batch.index,
+            columns=[f"is_anomaly_{feature}" for feature in self.features],
+        )
 
     def __str__(self) -> str:
         return "Z-Score Anomaly Detector"
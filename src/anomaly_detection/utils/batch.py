@@ -0,0 +1,113 @@
+from collections.abc import Hashable, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from pandas import DataFrame, factorize
+
+from src.anomaly_detection.utils.gpd import fit_gpd, gpd_anomaly_score
+from src.anomaly_detection.utils.math import compute_peak_over_threshold_block
+
+BATCH_BLOCK_SIZE = 2**22
+
+
+def split_long_format(
+    df: DataFrame, series_column: str = "series_id", timestamp_column: str = "ts", value_column: str = "value"
+) -> tuple[list[Hashable], list[NDArray], list[NDArray[np.float64]]]:
+    """Split a long-format (series id, timestamp, value) frame into one time-ordered array per series.
+
+    Returns:
+        :ids_timestamps_values (tuple[list, list[np.ndarray], list[np.ndarray]]): The series ids in order of first
+            appearance, and the timestamps and float64 values of every series.
+    """
+    codes, series_ids = factorize(df[series_column], sort=False)
+    timestamps = df[timestamp_column].to_numpy()
+    values = df[value_column].to_numpy(dtype="float64")
+    order = np.lexsort((timestamps, codes))
+    splits = np.flatnonzero(np.diff(codes[order])) + 1
+    return (
+        list(series_ids),
+        np.split(timestamps[order], splits),
+        np.split(values[order], splits),
+    )
+
+
+def group_by_length(
+    lengths: ArrayLike, max_padding: float = 0.25, max_block_size: int = BATCH_BLOCK_SIZE
+) -> list[NDArray[np.int64]]:
+    """Group series of similar length so that each group fits one NaN-padded block.
+
+    The series are taken from the longest to the shortest, a group is closed as soon as the next series would be
+    padded by more than `max_padding` of the group's longest series or the block would exceed `max_block_size` values.
+
+    Returns:
+        :groups (list[np.ndarray]): The positions of the series in every group, longest first.
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    order = np.argsort(-lengths, kind="stable")
+    groups = []
+    start = 0
+    while start < order.shape[0]:
+        longest = max(int(lengths[order[start]]), 1)
+        candidates = -lengths[order[start : start + max(max_block_size // longest, 1)]]
+        stop = start + max(int(np.searchsorted(candidates, -(1 - max_padding) * longest, side="right")), 1)
+        groups.append(order[start:stop])
+        start = stop
+    return groups
+
+
+def pad_series(series: Sequence[NDArray[np.float64]]) -> NDArray[np.float64]:
+    """Lay the series side by side in a (longest x n_series) block, the shorter ones padded with trailing NaN."""
+    lengths = np.fromiter((len(values) for values in series), dtype=np.int64, count=len(series))
+    block = np.full((int(lengths.max(initial=0)), len(series)), np.nan)
+    if lengths.sum() > 0:
+        row_idx = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        block[row_idx, np.repeat(np.arange(len(series)), lengths)] = np.concatenate(series)
+    return block
+
+
+def batch_pot_anomaly_score(
+    series: Sequence[NDArray[np.float64]],
+    t0: ArrayLike,
+    quantile: float,
+    compression: float | None = None,
+    window: int | None = None,
+    max_padding: float = 0.25,
+) -> list[NDArray[np.float64]]:
+    """Calculate the POT anomaly scores of many independent series, one padded block of similar lengths at a time.
+
+    Trailing NaN padding never changes the thresholds of the rows before it, so every series gets the same result
+    as on its own: its own `t0` is the minimum period of its thresholds and the calibration rows of its GPD.
+
+    Args:
+        :series (Sequence[np.ndarray]): The 1-D float64 values of every series in time order.
+        :t0 (ArrayLike): The number of calibration rows of every series.
+        :quantile (float): The quantile that is used as threshold.
+        :compression (float | None): The `TDigest` compression for approximate thresholds, None for exact ones.
+        :window (int | None): The number of most recent rows for sliding-window thresholds, None for expanding ones.
+        :max_padding (float): The largest share of padding in a block, see `group_by_length`.
+
+    Returns:
+        :anomaly_scores (list[np.ndarray]): The anomaly score of every row after `t0`, one array per series.
+    """
+    t0 = np.asarray(t0, dtype=np.int64)
+    anomaly_scores: list[NDArray[np.float64]] = [np.empty(0)] * len(series)
+    for group in group_by_length(lengths=[len(values) for values in series], max_padding=max_padding):
+        block = pad_series(series=[np.asarray(series[idx], dtype=np.float64) for idx in group])
+        _, pot_data, _ = compute_peak_over_threshold_block(
+            values=block, min_period=t0[group], quantile=quantile, compression=compression, window=window
+        )
+        is_calibration = np.arange(block.shape[0])[:, None] < t0[group][None, :]
+        shape, scale = fit_gpd(exceedances=np.where(is_calibration, pot_data, 0.0))
+        block_anomaly_score = gpd_anomaly_score(exceedances=pot_data, shape=shape, scale=scale)
+        for column, idx in enumerate(group):
+            anomaly_scores[idx] = block_anomaly_score[t0[idx] : len(series[idx]), column].copy()
+    return anomaly_scores
+
+
+def to_series_list(
+    series: Mapping[Hashable, ArrayLike] | Sequence[ArrayLike],
+) -> tuple[list[Hashable], list[NDArray[np.float64]]]:
+    """Turn a mapping of series id to values, or a plain sequence of series, into ids and float64 arrays."""
+    if isinstance(series, Mapping):
+        return list(series.keys()), [np.asarray(values, dtype=np.float64) for values in series.values()]
+    return list(range(len(series))), [np.asarray(values, dtype=np.float64) for values in series]
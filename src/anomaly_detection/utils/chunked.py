@@ -0,0 +1,183 @@
+import os
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from numpy.typing import ArrayLike, NDArray
+
+from src.anomaly_detection.utils.gpd import fit_gpd, gpd_anomaly_score
+from src.anomaly_detection.utils.math import _shift_and_bfill
+from src.anomaly_detection.utils.quantile import rolling_quantile, StreamingQuantile
+
+CHUNK_SIZE = 2**16
+
+
+def open_column_file(source: ArrayLike | str | os.PathLike) -> NDArray[np.float64]:
+    """Open a `.npy` column file read-only as a memory map, or take an in-memory or `np.memmap` block as it is."""
+    values = np.load(source, mmap_mode="r") if isinstance(source, (str, os.PathLike)) else np.asarray(source)
+    if values.ndim != 2:
+        raise ValueError("Parameter `source` must hold a 2-D (n_rows x n_features) block.")
+    return values
+
+
+def _backfill(
+    values: NDArray[np.float64],
+    pot_th: NDArray[np.float64],
+    pot_data: NDArray[np.float64],
+    feature_idx: int,
+    start: int,
+    stop: int,
+    th: float,
+    chunk_size: int,
+) -> None:
+    # The rows [start, stop) of one feature only got their threshold in a later chunk, rewrite them on disk.
+    for chunk_start in range(start, stop, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, stop)
+        pot_th[chunk_start:chunk_stop, feature_idx] = th
+        pot_data[chunk_start:chunk_stop, feature_idx] = np.clip(
+            np.asarray(values[chunk_start:chunk_stop, feature_idx], dtype=np.float64) - th, 0, None
+        )
+
+
+def chunked_peak_over_threshold(
+    source: ArrayLike | str | os.PathLike,
+    output_dir: str | os.PathLike,
+    min_period: int,
+    quantile: float,
+    compression: float | None = None,
+    window: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Calculate the POT thresholds and the data over them chunk by chunk into `pot_th.npy` and `pot_data.npy`.
+
+    Only `chunk_size` rows of the source are in memory at a time. The threshold state that crosses the chunk
+    boundaries is either the last `window - 1` rows for sliding-window thresholds, or one `StreamingQuantile` per
+    feature for approximate expanding thresholds, so the memory stays bounded however long the series is. The exact
+    expanding quantile needs the whole history and is not available here.
+
+    Args:
+        :source (ArrayLike | str | os.PathLike): The 2-D (n_rows x n_features) block, an `np.memmap` or a `.npy` file.
+        :output_dir (str | os.PathLike): The directory that receives the memory-mapped result files.
+        :min_period (int): The minimum number of observations before the threshold starts.
+        :quantile (float): The quantile that is used as threshold.
+        :compression (float | None): The `TDigest` compression for approximate expanding thresholds.
+        :window (int | None): The number of most recent rows for exact sliding-window thresholds.
+        :chunk_size (int): The number of rows read, processed and written at a time.
+
+    Returns:
+        :pot_th_data_rank_error (tuple[np.ndarray, np.ndarray, np.ndarray]): The same as
+            `compute_peak_over_threshold_block`, the first two as read-only memory maps of the result files.
+    """
+    if (window is None) == (compression is None):
+        raise ValueError("Chunked thresholds need either a `window` or a `compression`, but not both.")
+    if chunk_size < 1:
+        raise ValueError("Parameter `chunk_size` must be a positive integer.")
+    values = open_column_file(source=source)
+    total_rows, total_features = values.shape
+    os.makedirs(output_dir, exist_ok=True)
+    pot_th_path = os.path.join(output_dir, "pot_th.npy")
+    pot_data_path = os.path.join(output_dir, "pot_data.npy")
+    pot_th = open_memmap(pot_th_path, mode="w+", dtype=np.float64, shape=values.shape)
+    pot_data = open_memmap(pot_data_path, mode="w+", dtype=np.float64, shape=values.shape)
+
+    rank_error = np.zeros(total_features) if compression is None else np.full(total_features, np.nan)
+    quantiles: list[StreamingQuantile] = (
+        []
+        if compression is None
+        else [
+            StreamingQuantile(quantile=quantile, min_period=min_period, compression=compression)
+            for _ in range(total_features)
+        ]
+    )
+    tail = np.empty((0, total_features))
+    total_valid = np.zeros(total_features, dtype=np.int64)
+    last_raw_th = np.full(total_features, np.nan)
+    waiting_since = np.full(total_features, -1)
+
+    for start in range(0, total_rows, chunk_size):
+        stop = min(start + chunk_size, total_rows)
+        chunk = np.asarray(values[start:stop], dtype=np.float64)
+        if window is not None:
+            stacked = np.concatenate((tail, chunk))
+            raw_th = rolling_quantile(values=stacked, quantile=quantile, window=window, min_period=1)[tail.shape[0] :]
+            counts = total_valid + np.cumsum(~np.isnan(chunk), axis=0)
+            raw_th[counts < max(min_period, 1)] = np.nan
+            total_valid = counts[-1]
+            tail = stacked[stacked.shape[0] - min(window - 1, stacked.shape[0]) :]
+        else:
+            raw_th = np.empty(chunk.shape)
+            for idx, streaming in enumerate(quantiles):
+                raw_th[:, idx], feature_rank_error = streaming.update(values=chunk[:, idx], is_last=stop == total_rows)
+                if not np.isnan(feature_rank_error).all():
+                    rank_error[idx] = np.fmax(rank_error[idx], np.nanmax(feature_rank_error))
+
+        # The threshold of a row is the one of the row before it, backfilled where that does not exist yet.
+        th = _shift_and_bfill(block=np.concatenate((last_raw_th[None, :], raw_th)))[1:]
+        last_raw_th = raw_th[-1]
+        for idx in np.flatnonzero((waiting_since >= 0) & ~np.isnan(th[0])):
+            _backfill(
+                values=values,
+                pot_th=pot_th,
+                pot_data=pot_data,
+                feature_idx=idx,
+                start=waiting_since[idx],
+                stop=start,
+                th=th[0, idx],
+                chunk_size=chunk_size,
+            )
+            waiting_since[idx] = -1
+        is_valid = ~np.isnan(th)
+        last_valid = np.where(is_valid.any(axis=0), th.shape[0] - 1 - np.argmax(is_valid[::-1], axis=0), -1)
+        starts_waiting = (waiting_since < 0) & (last_valid < th.shape[0] - 1)
+        waiting_since[starts_waiting] = start + last_valid[starts_waiting] + 1
+
+        pot_th[start:stop] = th
+        pot_data[start:stop] = np.clip(chunk - th, 0, None)
+
+    pot_th.flush()
+    pot_data.flush()
+    del pot_th, pot_data
+    return np.load(pot_th_path, mmap_mode="r"), np.load(pot_data_path, mmap_mode="r"), rank_error
+
+
+def chunked_gpd_anomaly_score(
+    pot_data: NDArray[np.float64],
+    output_dir: str | os.PathLike,
+    calibration_rows: int,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Fit the GPD on the first `calibration_rows` of the data over threshold, score the rest into a memory map.
+
+    Only the exceedances of the calibration rows are gathered, chunk by chunk, and the scores are written one chunk
+    at a time, so besides the peaks no more than `chunk_size` rows are in memory.
+
+    Args:
+        :pot_data (np.ndarray): The (n_rows x n_features) data over threshold, usually a memory map.
+        :output_dir (str | os.PathLike): The directory that receives the memory-mapped result file.
+        :calibration_rows (int): The number of leading rows the GPD is fitted on.
+        :chunk_size (int): The number of rows read, processed and written at a time.
+
+    Returns:
+        :anomaly_score_shape_scale (tuple[np.ndarray, np.ndarray, np.ndarray]): The read-only memory map of the
+            anomaly scores of the rows after `calibration_rows`, and the GPD shape and scale of every feature.
+    """
+    peaks = []
+    for start in range(0, calibration_rows, chunk_size):
+        chunk = np.asarray(pot_data[start : min(start + chunk_size, calibration_rows)], dtype=np.float64)
+        chunk = np.where(chunk > 0, chunk, 0.0)
+        # Sorting every column in descending order moves its exceedances to the top rows, the rest is zero padding.
+        total_peaks = int((chunk > 0).sum(axis=0).max(initial=0))
+        peaks.append(-np.sort(-chunk, axis=0)[:total_peaks])
+    shape, scale = fit_gpd(exceedances=np.concatenate(peaks) if peaks else np.zeros((0, pot_data.shape[1])))
+
+    os.makedirs(output_dir, exist_ok=True)
+    anomaly_score_path = os.path.join(output_dir, "anomaly_score.npy")
+    total_rows = max(pot_data.shape[0] - calibration_rows, 0)
+    anomaly_score = open_memmap(anomaly_score_path, mode="w+", dtype=np.float64, shape=(total_rows, pot_data.shape[1]))
+    for start in range(0, total_rows, chunk_size):
+        stop = min(start + chunk_size, total_rows)
+        anomaly_score[start:stop] = gpd_anomaly_score(
+            exceedances=pot_data[calibration_rows + start : calibration_rows + stop], shape=shape, scale=scale
+        )
+    anomaly_score.flush()
+    del anomaly_score
+    return np.load(anomaly_score_path, mmap_mode="r"), shape, scale
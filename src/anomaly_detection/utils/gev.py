@@ -0,0 +1,196 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from scipy.optimize import minimize
+from scipy.special import gamma as gamma_function
+
+EULER_GAMMA = 0.5772156649015329
+MIN_BLOCK_MAXIMA = 3
+# Below this |shape| the GEV is evaluated as the Gumbel distribution, which it converges to.
+GUMBEL_SHAPE = 1e-6
+# Below a shape of -1 the likelihood is unbounded and the fit degenerates, so the shape is kept just above it.
+MIN_SHAPE = -0.999
+# The fitted scale stays within this many orders of e of the L-moment scale, so it never underflows to 0.
+MAX_LOG_SCALE = 20.0
+
+
+def block_maxima(values: ArrayLike, block_size: int) -> NDArray[np.float64]:
+    """Take the maximum of every block of `block_size` consecutive rows of every column, NaN values are skipped.
+
+    All blocks are reduced in one `np.fmax.reduceat` call, the last block may be shorter than the others.
+
+    Args:
+        :values (ArrayLike): The 2-D (n_rows x n_features) block.
+        :block_size (int): The number of rows of every block.
+
+    Returns:
+        :maxima (np.ndarray): The (n_blocks x n_features) maxima, NaN for blocks without any value.
+    """
+    if block_size < 1:
+        raise ValueError("Parameter `block_size` must be a positive integer.")
+    data = np.asarray(values, dtype=np.float64)
+    if data.ndim != 2:
+        raise ValueError("Parameter `values` must be 2-dimensional.")
+    if data.shape[0] == 0:
+        return np.empty((0, data.shape[1]))
+    return np.fmax.reduceat(data, np.arange(0, data.shape[0], block_size), axis=0)
+
+
+def _l_moment_estimate(
+    sorted_maxima: NDArray[np.float64], counts: NDArray[np.int64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    # Hosking's probability-weighted moment estimates of every column, sorted ascending with the NaN at the end.
+    rank = np.arange(sorted_maxima.shape[0])[:, None]
+    n = counts.astype(np.float64)
+    is_valid = rank < counts
+    values = np.where(is_valid, sorted_maxima, 0.0)
+    b0 = values.sum(axis=0) / n
+    b1 = (values * rank / (n - 1)).sum(axis=0) / n
+    b2 = (values * rank * (rank - 1) / ((n - 1) * (n - 2))).sum(axis=0) / n
+    l1, l2, l3 = b0, 2 * b1 - b0, 6 * b2 - 6 * b1 + b0
+    c = 2 / (3 + l3 / l2) - np.log(2) / np.log(3)
+    k = 7.8590 * c + 2.9554 * c * c
+    is_gumbel = np.abs(k) < GUMBEL_SHAPE
+    safe_k = np.where(is_gumbel, 1.0, k)
+    scale = np.where(is_gumbel, l2 / np.log(2), l2 * safe_k / ((1 - 2 ** (-safe_k)) * gamma_function(1 + safe_k)))
+    location = np.where(is_gumbel, l1 - EULER_GAMMA * scale, l1 - scale * (1 - gamma_function(1 + safe_k)) / safe_k)
+    return -k, location, scale
+
+
+def _negative_log_likelihood(
+    parameters: NDArray[np.float64], maxima: NDArray[np.float64], is_valid: NDArray[np.bool_]
+) -> tuple[float, NDArray[np.float64]]:
+    # The summed GEV negative log-likelihood of all columns and its gradient with respect to (location, log scale,
+    # shape) of every column. The columns are independent, so one optimizer call fits all of them.
+    location, log_scale, shape = parameters.reshape(3, -1)
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        scale = np.exp(log_scale)
+        z = np.where(is_valid, (maxima - location) / scale, 0.0)
+        is_gumbel = np.abs(shape) < GUMBEL_SHAPE
+        safe_shape = np.where(is_gumbel, 1.0, shape)
+        t = 1 + safe_shape * z
+        is_feasible = is_gumbel | (t > 0).all(axis=0, where=is_valid)
+        t = np.where(is_valid & (t > 0), t, 1.0)
+        log_t = np.log(t)
+        s = np.where(is_gumbel, np.exp(-z), np.exp(-log_t / safe_shape))
+
+        likelihood = np.where(is_gumbel, log_scale + z + s, log_scale + (1 + 1 / safe_shape) * log_t + s)
+        d_dt = np.where(is_gumbel, 1 - s, ((safe_shape + 1) - s) / t)
+        d_location = -d_dt / scale
+        d_log_scale = 1 - z * d_dt
+        d_shape = np.where(
+            is_gumbel,
+            0.0,
+            log_t / safe_shape**2 * (s - 1) + z / t * (1 + (1 - s) / safe_shape),
+        )
+        gradient = np.stack([np.where(is_valid, term, 0.0).sum(axis=0) for term in (d_location, d_log_scale, d_shape)])
+        total = np.where(is_valid, likelihood, 0.0).sum(axis=0)
+    # A column whose likelihood overflows is treated like an infeasible one.
+    is_feasible &= np.isfinite(total) & np.isfinite(gradient).all(axis=0)
+    # An infeasible column, where some maximum lies beyond the end of the support, gets a large but finite value so
+    # that the line search steps back.
+    total = np.where(is_feasible, total, 1e10)
+    gradient = np.where(is_feasible, gradient, 0.0)
+    return float(total.sum()), gradient.ravel()
+
+
+def fit_gev(maxima: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Fit a Generalised Extreme Value distribution to the block maxima of every column by maximum likelihood.
+
+    Every column is standardized by its L-moment location and scale estimates, which also give the starting point,
+    and then all columns are refined together in a single L-BFGS-B call on their summed negative log-likelihood with
+    its analytic gradient, the shape bounded above -1. If that call does not converge, every column is refitted on its
+    own. The shape follows the sign convention of the GPD fit: positive for heavy tails.
+
+    Args:
+        :maxima (ArrayLike): The (n_blocks x n_features) block maxima, NaN for missing ones.
+
+    Returns:
+        :shape_location_scale (tuple[np.ndarray, np.ndarray, np.ndarray]): The GEV shape, location and scale of every
+            feature, NaN for features with fewer than `MIN_BLOCK_MAXIMA` maxima, without any spread or whose fit does
+            not converge.
+    """
+    data = np.asarray(maxima, dtype=np.float64)
+    if data.ndim != 2:
+        raise ValueError("Parameter `maxima` must be 2-dimensional.")
+    shape = np.full(data.shape[1], np.nan)
+    location = np.full(data.shape[1], np.nan)
+    scale = np.full(data.shape[1], np.nan)
+    counts = (~np.isnan(data)).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        start_shape, start_location, start_scale = _l_moment_estimate(
+            sorted_maxima=np.sort(data, axis=0), counts=counts
+        )
+    fitted = np.flatnonzero((counts >= MIN_BLOCK_MAXIMA) & (start_scale > 0) & np.isfinite(start_shape))
+    if fitted.shape[0] == 0:
+        return shape, location, scale
+
+    standardized = (data[:, fitted] - start_location[fitted]) / start_scale[fitted]
+    is_valid = ~np.isnan(standardized)
+    # The L-moment shape may put the smallest or largest maximum outside the support, the start is pulled back inside.
+    with np.errstate(divide="ignore"):
+        lowest_shape = np.where(np.nanmax(standardized, axis=0) > 0, -0.9 / np.nanmax(standardized, axis=0), -np.inf)
+        highest_shape = np.where(np.nanmin(standardized, axis=0) < 0, -0.9 / np.nanmin(standardized, axis=0), np.inf)
+    start = np.stack(
+        (
+            np.zeros(fitted.shape[0]),
+            np.zeros(fitted.shape[0]),
+            np.clip(start_shape[fitted], np.maximum(lowest_shape, MIN_SHAPE), highest_shape),
+        )
+    )
+    standardized = np.where(is_valid, standardized, 0.0)
+    parameters, is_converged = _minimize_negative_log_likelihood(start=start, maxima=standardized, is_valid=is_valid)
+    if not is_converged:
+        # One column can stall the joint fit, so every column gets its own fit and only the failing ones stay NaN.
+        for idx in range(fitted.shape[0]):
+            parameters[:, idx : idx + 1], is_converged = _minimize_negative_log_likelihood(
+                start=start[:, idx : idx + 1],
+                maxima=standardized[:, idx : idx + 1],
+                is_valid=is_valid[:, idx : idx + 1],
+            )
+            if not is_converged:
+                parameters[:, idx] = np.nan
+    fitted_location, fitted_log_scale, fitted_shape = parameters
+    shape[fitted] = fitted_shape
+    location[fitted] = start_location[fitted] + start_scale[fitted] * fitted_location
+    scale[fitted] = start_scale[fitted] * np.exp(fitted_log_scale)
+    return shape, location, scale
+
+
+def _minimize_negative_log_likelihood(
+    start: NDArray[np.float64], maxima: NDArray[np.float64], is_valid: NDArray[np.bool_]
+) -> tuple[NDArray[np.float64], bool]:
+    # Fit the (3 x n_features) standardized parameters of all columns in one bounded L-BFGS-B call, the shape above
+    # MIN_SHAPE and the log scale finite.
+    total_features = start.shape[1]
+    result = minimize(
+        _negative_log_likelihood,
+        x0=start.ravel(),
+        args=(maxima, is_valid),
+        jac=True,
+        method="L-BFGS-B",
+        bounds=[(None, None)] * total_features
+        + [(-MAX_LOG_SCALE, MAX_LOG_SCALE)] * total_features
+        + [(MIN_SHAPE, None)] * total_features,
+    )
+    return result.x.reshape(3, -1), bool(result.success)
+
+
+def gev_survival_probability(
+    values: ArrayLike, shape: ArrayLike, location: ArrayLike, scale: ArrayLike
+) -> NDArray[np.float64]:
+    """Calculate `P(M > x)` of every value under each feature's fitted GEV of the block maxima."""
+    data = np.asarray(values, dtype=np.float64)
+    shape = np.asarray(shape, dtype=np.float64)
+    z = (data - np.asarray(location, dtype=np.float64)) / np.asarray(scale, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        base = np.maximum(1 + shape * z, 0.0)
+        cumulative = np.where(np.abs(shape) < GUMBEL_SHAPE, np.exp(-np.exp(-z)), np.exp(-(base ** (-1 / shape))))
+    return 1.0 - cumulative
+
+
+def gev_anomaly_score(
+    values: ArrayLike, shape: NDArray[np.float64], location: NDArray[np.float64], scale: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Calculate the anomaly score `1 / P(M > x)` of every value, the number of blocks until a maximum beyond it."""
+    with np.errstate(divide="ignore"):
+        return 1 / gev_survival_probability(values=values, shape=shape, location=location, scale=scale)
@@ -0,0 +1,140 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+GRIMSHAW_GRID_SIZE = 64
+GRIMSHAW_ITERATIONS = 24
+
+
+def _pack_exceedances(exceedances: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+    # Left-align the positive exceedances of every feature into a (n_features x max_exceedances) block padded with 0.
+    # A zero pad contributes 1 / (1 + theta * 0) = 1 and log(1 + theta * 0) = 0, which the sums below correct for.
+    block = np.asarray(exceedances, dtype=np.float64)
+    if block.ndim != 2:
+        raise ValueError("Parameter `exceedances` must be 2-dimensional.")
+    feature_idx, row_idx = np.nonzero((block > 0).T)
+    counts = np.bincount(feature_idx, minlength=block.shape[1])
+    slot_idx = np.arange(feature_idx.shape[0]) - np.repeat(np.cumsum(counts) - counts, counts)
+    packed = np.zeros((block.shape[1], max(int(counts.max(initial=0)), 1)))
+    packed[feature_idx, slot_idx] = block[row_idx, feature_idx]
+    return packed, counts
+
+
+def _grimshaw_uv(
+    packed: NDArray[np.float64], counts: NDArray[np.int64], theta: NDArray[np.float64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    s = 1 + theta[:, None] * packed
+    u = (np.sum(1 / s, axis=1) - (packed.shape[1] - counts)) / counts
+    v = 1 + np.sum(np.log(s), axis=1) / counts
+    return u, v
+
+
+def _grimshaw_w(
+    packed: NDArray[np.float64], counts: NDArray[np.int64], theta: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    u, v = _grimshaw_uv(packed=packed, counts=counts, theta=theta)
+    return u * v - 1
+
+
+def fit_gpd(exceedances: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Fit a Generalised Pareto Distribution to the exceedances of every feature with Grimshaw's method.
+
+    Grimshaw reduces the two-parameter maximum likelihood to the roots of `w(theta) = u(theta) * v(theta) - 1` with
+    `theta = shape / scale`. All features are solved together: `w` is scanned on a grid over both root intervals,
+    every sign change is refined by a vectorized regula falsi, and per feature the root (or the exponential fit at
+    `theta = 0`) with the highest log-likelihood wins. Like Grimshaw's method itself, it only covers shapes above -1.0,
+    where the maximum likelihood estimate exists.
+
+    Args:
+        :exceedances (ArrayLike): The (n_rows x n_features) data over threshold, values <= 0 or NaN are no
+            exceedance.
+
+    Returns:
+        :shape_and_scale (tuple[np.ndarray, np.ndarray]): The GPD shape and scale of every feature, NaN for
+            features without any exceedance.
+    """
+    packed, counts = _pack_exceedances(exceedances=exceedances)
+    shape = np.full(packed.shape[0], np.nan)
+    scale = np.full(packed.shape[0], np.nan)
+    fitted = np.flatnonzero(counts > 0)
+    if fitted.shape[0] == 0:
+        return shape, scale
+    packed, counts = packed[fitted], counts[fitted]
+
+    y_max = packed.max(axis=1)
+    y_min = np.where(packed > 0, packed, np.inf).min(axis=1)
+    y_mean = packed.sum(axis=1) / counts
+
+    # Negative roots lie in (-1 / y_max, 0), positive ones in (0, 2 * (y_mean - y_min) / y_min**2]. Both grids are
+    # geometric towards their ends, where the roots of heavy- and light-tailed data sit.
+    half_grid = np.geomspace(1e-8, 0.5, GRIMSHAW_GRID_SIZE // 2)
+    left_steps = np.concatenate((half_grid, 1 - half_grid[::-1]))
+    left_grid = -left_steps[None, :] / y_max[:, None]
+    right_start = np.log10(1e-6 / y_max)
+    right_end = np.log10(np.maximum(2 * (y_mean - y_min) / y_min**2, 2e-6 / y_max))
+    right_grid = 10 ** (
+        right_start[:, None] + (right_end - right_start)[:, None] * np.linspace(0.0, 1.0, GRIMSHAW_GRID_SIZE)
+    )
+    grid = np.concatenate((left_grid[:, ::-1], right_grid), axis=1)
+
+    grid_w = np.empty(grid.shape)
+    for idx in range(grid.shape[1]):
+        grid_w[:, idx] = _grimshaw_w(packed=packed, counts=counts, theta=grid[:, idx])
+
+    # Every sign change between two neighbouring grid points (but not across the two intervals) brackets a root.
+    is_bracket = np.sign(grid_w[:, :-1]) * np.sign(grid_w[:, 1:]) < 0
+    is_bracket[:, GRIMSHAW_GRID_SIZE - 1] = False
+    bracket_feature, bracket_idx = np.nonzero(is_bracket)
+    low = grid[bracket_feature, bracket_idx]
+    high = grid[bracket_feature, bracket_idx + 1]
+    low_w = grid_w[bracket_feature, bracket_idx]
+    high_w = grid_w[bracket_feature, bracket_idx + 1]
+    # The Illinois variant of regula falsi converges superlinearly, which needs far fewer passes than bisection.
+    for _ in range(GRIMSHAW_ITERATIONS):
+        mid = (low * high_w - high * low_w) / (high_w - low_w)
+        mid_w = _grimshaw_w(packed=packed[bracket_feature], counts=counts[bracket_feature], theta=mid)
+        is_low_side = np.sign(mid_w) == np.sign(low_w)
+        low_w = np.where(is_low_side, mid_w, low_w / 2)
+        high_w = np.where(is_low_side, high_w / 2, mid_w)
+        low = np.where(is_low_side, mid, low)
+        high = np.where(is_low_side, high, mid)
+    roots = np.where(np.abs(low_w) < np.abs(high_w), low, high)
+
+    _, v = _grimshaw_uv(packed=packed[bracket_feature], counts=counts[bracket_feature], theta=roots)
+    root_shape = v - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root_scale = root_shape / roots
+        root_log_likelihood = -counts[bracket_feature] * np.log(root_scale) - (1 + 1 / root_shape) * (
+            counts[bracket_feature] * (v - 1)
+        )
+    root_log_likelihood = np.where((root_scale > 0) & (root_shape != 0), root_log_likelihood, -np.inf)
+
+    candidate_feature = np.concatenate((np.arange(packed.shape[0]), bracket_feature))
+    candidate_shape = np.concatenate((np.zeros(packed.shape[0]), root_shape))
+    candidate_scale = np.concatenate((y_mean, root_scale))
+    candidate_log_likelihood = np.concatenate((-counts * np.log(y_mean) - counts, root_log_likelihood))
+
+    best = np.lexsort((-candidate_log_likelihood, candidate_feature))
+    best = best[np.r_[True, candidate_feature[best][1:] != candidate_feature[best][:-1]]]
+    shape[fitted] = candidate_shape[best]
+    scale[fitted] = candidate_scale[best]
+    return shape, scale
+
+
+def gpd_survival_probability(exceedances: ArrayLike, shape: ArrayLike, scale: ArrayLike) -> NDArray[np.float64]:
+    """Calculate `P(Y > y)` of every exceedance under each feature's fitted GPD, 1.0 where there is no exceedance."""
+    data = np.asarray(exceedances, dtype=np.float64)
+    shape = np.asarray(shape, dtype=np.float64)
+    scale = np.asarray(scale, dtype=np.float64)
+    y = np.where(data > 0, data, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        base = np.maximum(1 + shape * y / scale, 0.0)
+        survival = np.where(shape == 0, np.exp(-y / scale), base ** (-1 / shape))
+    return np.where(data > 0, survival, 1.0)
+
+
+def gpd_anomaly_score(exceedances: ArrayLike, shape: ArrayLike, scale: ArrayLike) -> NDArray[np.float64]:
+    """Calculate the anomaly score `1 / P(Y > y)` of every exceedance, 0. where there is no exceedance."""
+    data = np.asarray(exceedances, dtype=np.float64)
+    with np.errstate(divide="ignore"):
+        anomaly_score = 1 / gpd_survival_probability(exceedances=data, shape=shape, scale=scale)
+    return np.where(data > 0, anomaly_score, 0.0)
@@ -0,0 +1,114 @@
+import os
+from importlib import import_module
+from types import ModuleType
+
+import numpy as np
+from numpy.typing import NDArray
+from pandas import DataFrame, Index, RangeIndex
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+ARROW_FILE_SUFFIXES = (".arrow", ".feather", ".ipc")
+ARROW_STREAM_SUFFIXES = (".arrows",)
+
+
+def _import_pyarrow() -> ModuleType:
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Reading Parquet or Arrow files requires `pyarrow`, install it with `pip install detecto[arrow]`."
+        ) from error
+    return pyarrow
+
+
+class ColumnarDataset:
+    """The numeric feature columns of a dataset as one float64 block, without a pandas DataFrame in between.
+
+    Args:
+        :features (list[str]): The feature names, one per column of `values`.
+        :values (np.ndarray): The (n_rows x n_features) float64 block.
+        :index (pd.Index | None): The row index, a `RangeIndex` by default.
+    """
+
+    def __init__(self, features: list[str], values: NDArray[np.float64], index: Index | None = None):
+        if values.ndim != 2 or values.shape[1] != len(features):
+            raise ValueError("Parameter `values` must be a 2-D block with one column per feature.")
+        self.features: list[str] = list(features)
+        self.values: NDArray[np.float64] = values
+        self.index: Index = RangeIndex(stop=values.shape[0]) if index is None else index
+        if len(self.index) != values.shape[0]:
+            raise ValueError("Parameter `index` must have one label per row of `values`.")
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+
+def to_columnar_dataset(df: DataFrame | ColumnarDataset) -> ColumnarDataset:
+    """Take the non-object columns of a DataFrame as features, a `ColumnarDataset` is passed through as it is."""
+    if isinstance(df, ColumnarDataset):
+        return df
+    features = [feature for feature in df.columns if df[feature].dtype != object]
+    return ColumnarDataset(features=features, values=df[features].to_numpy(dtype="float64"), index=df.index)
+
+
+def _numeric_features(schema, pyarrow: ModuleType) -> list[str]:
+    # The Arrow counterpart of `df[feature].dtype != object`, decided on the schema before any column is read.
+    return [
+        field.name
+        for field in schema
+        if pyarrow.types.is_integer(field.type)
+        or pyarrow.types.is_floating(field.type)
+        or pyarrow.types.is_boolean(field.type)
+    ]
+
+
+def _column_to_numpy(column, pyarrow: ModuleType) -> NDArray[np.float64]:
+    if pyarrow.types.is_float64(column.type) and column.num_chunks == 1 and column.null_count == 0:
+        # A single null-free float64 chunk already is the NumPy buffer, only a view on it is made.
+        return column.chunk(0).to_numpy(zero_copy_only=True)
+    return np.asarray(column.cast(pyarrow.float64()).to_numpy(), dtype=np.float64)
+
+
+def read_columnar(path: str | os.PathLike, features: list[str] | None = None) -> ColumnarDataset:
+    """Read the numeric feature columns of a Parquet or Arrow IPC file straight into a `ColumnarDataset`.
+
+    Only the numeric columns (or the given `features`) are read, the column selection happens on the file schema.
+    Arrow IPC files are memory-mapped. A single null-free float64 column is handed over without any copy, several
+    columns are copied once from their Arrow buffers into the Fortran-ordered block, so every feature stays one
+    contiguous run of memory. Integer and boolean columns are cast to float64 with nulls as NaN.
+
+    Args:
+        :path (str | os.PathLike): The `.parquet`/`.pq`, `.arrow`/`.feather`/`.ipc` (file) or `.arrows` (stream) file.
+        :features (list[str] | None): The columns to read, None for all numeric columns.
+
+    Returns:
+        :dataset (ColumnarDataset): The feature names and their float64 block.
+    """
+    pyarrow = _import_pyarrow()
+    suffix = os.path.splitext(os.fspath(path))[1].lower()
+    if suffix in PARQUET_SUFFIXES:
+        parquet = import_module("pyarrow.parquet")
+        schema = parquet.read_schema(path)
+        selected = _numeric_features(schema=schema, pyarrow=pyarrow) if features is None else list(features)
+        table = parquet.read_table(path, columns=selected, memory_map=True)
+    elif suffix in ARROW_FILE_SUFFIXES + ARROW_STREAM_SUFFIXES:
+        ipc = import_module("pyarrow.ipc")
+        source = pyarrow.memory_map(os.fspath(path), "r")
+        if suffix in ARROW_STREAM_SUFFIXES:
+            reader = ipc.open_stream(source)
+        else:
+            reader = ipc.open_file(source)
+        selected = _numeric_features(schema=reader.schema, pyarrow=pyarrow) if features is None else list(features)
+        # The record batches point into the memory map, so leaving out columns means their pages are never read.
+        table = reader.read_all().select(selected)
+    else:
+        raise ValueError(f"Unsupported file type `{suffix}`, expected Parquet or Arrow IPC.")
+
+    columns = [_column_to_numpy(column=table.column(feature), pyarrow=pyarrow) for feature in selected]
+    if len(columns) == 1:
+        values = columns[0].reshape(-1, 1)
+    else:
+        values = np.empty((table.num_rows, len(columns)), dtype=np.float64, order="F")
+        for idx, column in enumerate(columns):
+            values[:, idx] = column
+    return ColumnarDataset(features=selected, values=values)
@@ -0,0 +1,213 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from src.anomaly_detection.utils.parallel import resolve_n_jobs
+
+EULER_GAMMA = 0.5772156649015329
+SCORE_CHUNK_SIZE = 2**14
+
+
+def average_path_length(size: ArrayLike) -> NDArray[np.float64]:
+    """Calculate `c(n)`, the average path length of an unsuccessful search in a binary search tree of `n` points."""
+    size = np.asarray(size, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        path_length = 2.0 * (np.log(size - 1.0) + EULER_GAMMA) - 2.0 * (size - 1.0) / size
+    return np.where(size > 2, path_length, np.where(size == 2, 1.0, 0.0))
+
+
+def build_isolation_tree(
+    sample: NDArray[np.float64], max_depth: int, seed: np.random.SeedSequence
+) -> tuple[NDArray[np.int32], NDArray[np.float64], NDArray[np.int32], NDArray[np.int32], NDArray[np.int32]]:
+    """Grow one isolation tree breadth-first into flat node arrays.
+
+    The two children of a split node are stored next to each other, the right one is always `left + 1`. A leaf is
+    its own left child with a NaN split, so `left[node] + (x >= split[node])` walks every sample one level down and
+    keeps it in place once it reached a leaf.
+
+    Args:
+        :sample (np.ndarray): The (sample_size x n_features) rows the tree isolates.
+        :max_depth (int): The depth at which every node becomes a leaf.
+        :seed (np.random.SeedSequence): The seed of the random features and splits.
+
+    Returns:
+        :feature_split_left_size_depth (tuple[np.ndarray, ...]): The split feature and value, the left child, the
+            number of sample rows and the depth of every node.
+    """
+    rng = np.random.default_rng(seed)
+    max_nodes = max(2 * sample.shape[0] - 1, 1)
+    feature = np.zeros(max_nodes, dtype=np.int32)
+    split = np.full(max_nodes, np.nan)
+    left = np.arange(max_nodes, dtype=np.int32)
+    size = np.zeros(max_nodes, dtype=np.int32)
+    depth = np.zeros(max_nodes, dtype=np.int32)
+
+    size[0] = sample.shape[0]
+    pending = [(0, np.arange(sample.shape[0]))]
+    total_nodes = 1
+    for node, rows in pending:
+        if depth[node] >= max_depth or rows.shape[0] <= 1:
+            continue
+        node_sample = sample[rows]
+        low, high = node_sample.min(axis=0), node_sample.max(axis=0)
+        candidates = np.flatnonzero(high > low)
+        if candidates.shape[0] == 0:
+            continue
+        feature[node] = candidates[rng.integers(candidates.shape[0])]
+        split[node] = rng.uniform(low[feature[node]], high[feature[node]])
+        left[node] = total_nodes
+        is_left = node_sample[:, feature[node]] < split[node]
+        for child, child_rows in ((total_nodes, rows[is_left]), (total_nodes + 1, rows[~is_left])):
+            size[child] = child_rows.shape[0]
+            depth[child] = depth[node] + 1
+            pending.append((child, child_rows))
+        total_nodes += 2
+    return feature[:total_nodes], split[:total_nodes], left[:total_nodes], size[:total_nodes], depth[:total_nodes]
+
+
+def _build_trees(samples: list[NDArray[np.float64]], max_depth: int, seeds: list[np.random.SeedSequence]) -> list:
+    return [
+        build_isolation_tree(sample=sample, max_depth=max_depth, seed=seed) for sample, seed in zip(samples, seeds)
+    ]
+
+
+class IsolationForest:
+    """An isolation forest whose trees are laid end to end in flat NumPy arrays instead of Python node objects.
+
+    All trees share one set of `feature`, `split`, `left`, `size` and `path_length` arrays, the node indices of every
+    tree are offset by the nodes of the trees before it, and `roots` holds the root of every tree. Scoring moves a
+    whole chunk of rows through all trees at once, one vectorized gather per tree level, and a forest over a single
+    feature is compiled into a step function of its split values.
+
+    Args:
+        :total_trees (int): The number of trees.
+        :sample_size (int): The number of rows every tree is grown on.
+        :seed (int | None): The seed of the subsamples, features and splits, the forest does not depend on `n_jobs`.
+    """
+
+    def __init__(self, total_trees: int = 100, sample_size: int = 256, seed: int | None = None):
+        if total_trees < 1 or sample_size < 1:
+            raise ValueError("Parameters `total_trees` and `sample_size` must be positive integers.")
+        self.total_trees = total_trees
+        self.sample_size = sample_size
+        self.seed = seed
+        self.max_depth = 0
+        self.c_sample_size = 1.0
+        self.total_features = 0
+        self.roots = np.zeros(0, dtype=np.intp)
+        self.feature = np.zeros(0, dtype=np.intp)
+        self.split = np.zeros(0)
+        self.left = np.zeros(0, dtype=np.intp)
+        self.size = np.zeros(0, dtype=np.int32)
+        self.path_length = np.zeros(0)
+        self.breakpoints = np.zeros(0)
+        self.interval_score = np.zeros(0)
+
+    def fit(self, values: ArrayLike, n_jobs: int = 1) -> "IsolationForest":
+        """Grow the trees on subsamples of the rows without NaN, spread over a process pool for `n_jobs` > 1.
+
+        Args:
+            :values (ArrayLike): The 2-D (n_rows x n_features) training block.
+            :n_jobs (int): The number of worker processes, negative values count back from the number of CPUs.
+        """
+        data = np.asarray(values, dtype=np.float64)
+        if data.ndim != 2:
+            raise ValueError("Parameter `values` must be 2-dimensional.")
+        data = data[~np.isnan(data).any(axis=1)]
+        if data.shape[0] == 0:
+            raise ValueError("Parameter `values` needs at least one row without NaN.")
+        sample_size = min(self.sample_size, data.shape[0])
+        self.max_depth = int(np.ceil(np.log2(max(sample_size, 2))))
+        self.c_sample_size = max(float(average_path_length(sample_size)), 1.0)
+
+        sample_seeds, tree_seeds = zip(
+            *(seed.spawn(2) for seed in np.random.SeedSequence(self.seed).spawn(self.total_trees))
+        )
+        samples = [
+            data[np.random.default_rng(seed).choice(data.shape[0], size=sample_size, replace=False)]
+            for seed in sample_seeds
+        ]
+        total_jobs = min(resolve_n_jobs(n_jobs=n_jobs), self.total_trees)
+        if total_jobs <= 1:
+            trees = _build_trees(samples=samples, max_depth=self.max_depth, seeds=list(tree_seeds))
+        else:
+            bounds = np.linspace(0, self.total_trees, total_jobs + 1).astype(int)
+            with ProcessPoolExecutor(max_workers=total_jobs) as executor:
+                futures = [
+                    executor.submit(_build_trees, samples[start:stop], self.max_depth, list(tree_seeds[start:stop]))
+                    for start, stop in zip(bounds[:-1], bounds[1:])
+                ]
+                trees = [tree for future in futures for tree in future.result()]
+
+        total_nodes = np.array([tree[0].shape[0] for tree in trees])
+        self.total_features = data.shape[1]
+        self.roots = (np.cumsum(total_nodes) - total_nodes).astype(np.intp)
+        self.feature = np.concatenate([tree[0] for tree in trees]).astype(np.intp)
+        self.split = np.concatenate([tree[1] for tree in trees])
+        self.left = np.concatenate([tree[2] + root for tree, root in zip(trees, self.roots)]).astype(np.intp)
+        self.size = np.concatenate([tree[3] for tree in trees])
+        # The expected path length of a sample ending in a node: its depth plus the average depth of the subtree the
+        # depth limit cut off.
+        self.path_length = np.concatenate([tree[4] for tree in trees]) + average_path_length(self.size)
+        if self.total_features == 1:
+            self._compile_step_function()
+        return self
+
+    def _mean_path_length(self, chunk: NDArray[np.float64]) -> NDArray[np.float64]:
+        flat = np.ascontiguousarray(chunk).ravel()
+        row_offset = (np.arange(chunk.shape[0]) * chunk.shape[1])[:, None]
+        node = np.broadcast_to(self.roots, (chunk.shape[0], self.roots.shape[0])).astype(np.intp)
+        # `np.take` in clip mode skips the bounds checks of fancy indexing, every node index is valid by construction.
+        for _ in range(self.max_depth):
+            feature_idx = np.take(self.feature, node, mode="clip")
+            feature_idx += row_offset
+            is_right = np.take(flat, feature_idx, mode="clip") >= np.take(self.split, node, mode="clip")
+            node = np.take(self.left, node, mode="clip")
+            node += is_right
+        return np.take(self.path_length, node, mode="clip").mean(axis=1)
+
+    def _compile_step_function(self) -> None:
+        # With a single feature every tree, and so the whole forest, is a step function of x that only changes at the
+        # split values. Every interval between two splits is traversed once through its lower end.
+        self.breakpoints = np.unique(self.split[~np.isnan(self.split)])
+        self.interval_score = np.power(
+            2.0,
+            -self._mean_path_length(chunk=np.concatenate((np.array([-np.inf]), self.breakpoints))[:, None])
+            / self.c_sample_size,
+        )
+
+    def score(self, values: ArrayLike, n_jobs: int = 1) -> NDArray[np.float64]:
+        """Calculate the anomaly score `2 ** (-E[h(x)] / c(sample_size))` of every row, NaN for rows with NaN.
+
+        A forest over a single feature is looked up in its step function with one binary search per row. Otherwise
+        the rows are moved through all trees in chunks of `SCORE_CHUNK_SIZE`, spread over a thread pool for
+        `n_jobs` > 1 since NumPy's gathers release the GIL.
+
+        Args:
+            :values (ArrayLike): The 2-D (n_rows x n_features) block with the features the forest was grown on.
+            :n_jobs (int): The number of threads, negative values count back from the number of CPUs.
+
+        Returns:
+            :anomaly_score (np.ndarray): The score of every row in (0, 1], above 0.5 the more isolated.
+        """
+        if self.roots.shape[0] == 0:
+            raise ValueError("The isolation forest has to be fitted before scoring.")
+        data = np.asarray(values, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != self.total_features:
+            raise ValueError("Parameter `values` must be a 2-D block with the features the forest was grown on.")
+        if self.total_features == 1:
+            interval = np.searchsorted(self.breakpoints, data[:, 0], side="right")
+            anomaly_score = np.take(self.interval_score, interval, mode="clip")
+        else:
+            starts = range(0, data.shape[0], SCORE_CHUNK_SIZE)
+            chunks = (data[start : start + SCORE_CHUNK_SIZE] for start in starts)
+            total_jobs = resolve_n_jobs(n_jobs=n_jobs)
+            if total_jobs <= 1:
+                chunk_path_lengths = [self._mean_path_length(chunk=chunk) for chunk in chunks]
+            else:
+                with ThreadPoolExecutor(max_workers=total_jobs) as executor:
+                    chunk_path_lengths = list(executor.map(self._mean_path_length, chunks))
+            anomaly_score = np.power(2.0, -np.concatenate([np.zeros(0), *chunk_path_lengths]) / self.c_sample_size)
+        anomaly_score[np.isnan(data).any(axis=1)] = np.nan
+        return anomaly_score
@@ -0,0 +1,151 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+KERNEL_CHUNK_SIZE = 2**14
+MIN_SGD_STEPS = 500
+
+
+class RandomFourierFeatures:
+    """A random map `z(x)` whose inner products approximate the RBF kernel `exp(-gamma * ||x - y||^2)`.
+
+    `z(x) = sqrt(2 / D) * cos(x W + b)` with `W ~ N(0, 2 gamma)` and `b ~ U(0, 2 pi)`, so a linear model on the `D`
+    components behaves like a kernel model, without the O(n^2) Gram matrix.
+
+    Args:
+        :total_dimensions (int): The number of input dimensions.
+        :total_components (int): The number of random components `D`.
+        :gamma (float): The RBF kernel coefficient.
+        :seed (int | np.random.SeedSequence | None): The seed of `W` and `b`.
+    """
+
+    def __init__(
+        self,
+        total_dimensions: int,
+        total_components: int = 256,
+        gamma: float = 1.0,
+        seed: int | np.random.SeedSequence | None = None,
+    ):
+        if total_components < 1 or gamma <= 0.0:
+            raise ValueError("Parameter `total_components` must be a positive integer and `gamma` positive.")
+        rng = np.random.default_rng(seed)
+        self.weights = rng.normal(scale=np.sqrt(2.0 * gamma), size=(total_dimensions, total_components))
+        self.offsets = rng.uniform(0.0, 2.0 * np.pi, size=total_components)
+        self.scale = np.sqrt(2.0 / total_components)
+
+    def transform(self, values: NDArray[np.float64]) -> NDArray[np.float64]:
+        components = values @ self.weights
+        components += self.offsets
+        np.cos(components, out=components)
+        components *= self.scale
+        return components
+
+
+class OneClassSVM:
+    """A one-class SVM with an approximate RBF kernel, trained by minibatch SGD on random Fourier features.
+
+    It minimizes `||w||^2 / 2 - rho + mean(max(0, rho - w z(x))) / nu` over `w` and `rho`, one minibatch at a time with
+    a decaying step, and keeps the average of the iterates of the second half of the steps. Training and scoring are
+    linear in the number of rows and only ever hold one minibatch or one chunk of components in memory.
+
+    Args:
+        :nu (float): The upper bound of the share of training rows outside the boundary.
+        :gamma (float): The RBF kernel coefficient.
+        :total_components (int): The number of random Fourier features.
+        :total_epochs (int): The number of passes over the training rows.
+        :batch_size (int): The number of rows of every minibatch.
+        :learning_rate (float): The initial step size.
+        :seed (int | None): The seed of the features and the minibatch order.
+    """
+
+    def __init__(
+        self,
+        nu: float = 0.05,
+        gamma: float = 1.0,
+        total_components: int = 256,
+        total_epochs: int = 5,
+        batch_size: int = 256,
+        learning_rate: float = 0.1,
+        seed: int | None = None,
+    ):
+        if not 0.0 < nu <= 1.0:
+            raise ValueError("Parameter `nu` must be in (0, 1].")
+        if total_epochs < 1 or batch_size < 1 or learning_rate <= 0.0:
+            raise ValueError("Parameters `total_epochs`, `batch_size` and `learning_rate` must be positive.")
+        self.nu = nu
+        self.gamma = gamma
+        self.total_components = total_components
+        self.total_epochs = total_epochs
+        self.batch_size = batch_size
+        self.learning_rate = learning_rate
+        self.seed = seed
+        self.features: RandomFourierFeatures | None = None
+        self.coefficients = np.zeros(0)
+        self.rho = 0.0
+
+    def fit(self, values: ArrayLike) -> "OneClassSVM":
+        """Train on the rows without NaN of the 2-D (n_rows x n_dimensions) block."""
+        data = np.asarray(values, dtype=np.float64)
+        if data.ndim != 2:
+            raise ValueError("Parameter `values` must be 2-dimensional.")
+        data = data[~np.isnan(data).any(axis=1)]
+        if data.shape[0] == 0:
+            raise ValueError("Parameter `values` needs at least one row without NaN.")
+        feature_seed, order_seed = np.random.SeedSequence(self.seed).spawn(2)
+        self.features = RandomFourierFeatures(
+            total_dimensions=data.shape[1],
+            total_components=self.total_components,
+            gamma=self.gamma,
+            seed=feature_seed,
+        )
+        rng = np.random.default_rng(order_seed)
+        batches_per_epoch = -(-data.shape[0] // self.batch_size)
+        # Short series take more passes, so that SGD always gets at least `MIN_SGD_STEPS` steps to converge.
+        total_epochs = max(self.total_epochs, -(-MIN_SGD_STEPS // batches_per_epoch))
+        total_steps = total_epochs * batches_per_epoch
+        coefficients = np.zeros(self.total_components)
+        rho = 0.0
+        average_coefficients = np.zeros(self.total_components)
+        average_rho = 0.0
+        step = 0
+        for _ in range(total_epochs):
+            order = rng.permutation(data.shape[0])
+            for start in range(0, data.shape[0], self.batch_size):
+                components = self.features.transform(values=data[order[start : start + self.batch_size]])
+                is_inside_margin = components @ coefficients < rho
+                # The subgradients of the regularizer, the offset and the hinge loss of the rows inside the margin.
+                hinge_share = is_inside_margin.sum() / (self.nu * components.shape[0])
+                learning_rate = self.learning_rate / np.sqrt(1.0 + step)
+                coefficients -= learning_rate * (
+                    coefficients - components[is_inside_margin].sum(axis=0) / (self.nu * components.shape[0])
+                )
+                rho -= learning_rate * (hinge_share - 1.0)
+                step += 1
+                if step > total_steps // 2:
+                    average_coefficients += coefficients
+                    average_rho += rho
+        self.coefficients = average_coefficients / (total_steps - total_steps // 2)
+        self.rho = average_rho / (total_steps - total_steps // 2)
+        return self
+
+    def score(self, values: ArrayLike) -> NDArray[np.float64]:
+        """Calculate `rho - w z(x)` of every row in chunks of `KERNEL_CHUNK_SIZE`, above 0 outside the boundary.
+
+        Args:
+            :values (ArrayLike): The 2-D (n_rows x n_dimensions) block.
+
+        Returns:
+            :anomaly_score (np.ndarray): The score of every row, NaN for rows with NaN.
+        """
+        if self.features is None:
+            raise ValueError("The one-class SVM has to be fitted before scoring.")
+        data = np.asarray(values, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != self.features.weights.shape[0]:
+            raise ValueError("Parameter `values` must be a 2-D block with the dimensions the SVM was trained on.")
+        anomaly_score = np.empty(data.shape[0])
+        for start in range(0, data.shape[0], KERNEL_CHUNK_SIZE):
+            chunk = data[start : start + KERNEL_CHUNK_SIZE]
+            anomaly_score[start : start + KERNEL_CHUNK_SIZE] = (
+                self.rho - self.features.transform(values=chunk) @ self.coefficients
+            )
+        anomaly_score[np.isnan(data).any(axis=1)] = np.nan
+        return anomaly_score
@@ -1,19 +1,93 @@
-from pandas import DataFrame, Series
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from pandas import concat, DataFrame
 
+from src.anomaly_detection.utils.quantile import expanding_quantile, rolling_quantile, streaming_quantile
 
-def calculate_peak_over_threshold(df: DataFrame, features: list[str], min_period: int, quantile: float) -> DataFrame:
-    for feature in features:
-        df[f"pot_th_{feature}"] = (
-            df[feature]
-            .expanding(min_periods=min_period)
-            .apply(lambda x: Series(x).quantile(quantile), raw=True)
-            .shift()
-            .bfill()
-        )
-    return df
+
+def _shift_and_bfill(block: NDArray[np.float64]) -> NDArray[np.float64]:
+    # The NumPy equivalent of `DataFrame.shift().bfill()` along the rows.
+    shifted = np.full((block.shape[0] + 1, *block.shape[1:]), np.nan)
+    shifted[1:-1] = block[:-1]
+    row_idx = np.arange(block.shape[0]).reshape(-1, *([1] * (block.ndim - 1)))
+    next_valid = np.where(np.isnan(shifted[:-1]), block.shape[0], row_idx)
+    next_valid = np.minimum.accumulate(next_valid[::-1], axis=0)[::-1]
+    return np.take_along_axis(shifted, next_valid, axis=0)
+
+
+def compute_peak_over_threshold_block(
+    values: ArrayLike,
+    min_period: int | ArrayLike,
+    quantile: float,
+    compression: float | None = None,
+    window: int | None = None,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Calculate the POT threshold and the data over it for every feature of a block in one batched pass.
+
+    Args:
+        :values (ArrayLike): The 2-D (n_rows x n_features) block with one column per feature.
+        :min_period (int | ArrayLike): The minimum number of observations before the threshold starts, either for
+            all features or one per feature.
+        :quantile (float): The quantile that is used as threshold.
+        :compression (float | None): The `TDigest` compression for approximate thresholds, None for exact ones.
+        :window (int | None): The number of most recent rows for sliding-window thresholds, None for expanding ones.
+
+    Returns:
+        :pot_th_data_rank_error (tuple[np.ndarray, np.ndarray, np.ndarray]): The thresholds and the data over them,
+            both in the shape of `values`, and the worst-case rank error of each feature's thresholds.
+    """
+    block = np.asarray(values, dtype=np.float64)
+    if block.ndim != 2:
+        raise ValueError("Parameter `values` must be 2-dimensional.")
+    min_periods = np.broadcast_to(np.asarray(min_period, dtype=np.int64), (block.shape[1],))
+    shared_min_period = int(min_periods.min(initial=0))
+    if window is not None:
+        if compression is not None:
+            raise ValueError("Sliding-window thresholds are only available for the exact quantile.")
+        pot_th = rolling_quantile(values=block, quantile=quantile, window=window, min_period=shared_min_period)
+        rank_error = np.zeros(block.shape[1])
+    elif compression is None:
+        pot_th = expanding_quantile(values=block, quantile=quantile, min_period=shared_min_period)
+        rank_error = np.zeros(block.shape[1])
+    else:
+        pot_th = np.empty(block.shape)
+        rank_error = np.full(block.shape[1], np.nan)
+        for idx in range(block.shape[1]):
+            pot_th[:, idx], feature_rank_error = streaming_quantile(
+                values=block[:, idx], quantile=quantile, min_period=int(min_periods[idx]), compression=compression
+            )
+            if not np.isnan(feature_rank_error).all():
+                rank_error[idx] = np.nanmax(feature_rank_error)
+    if (min_periods > shared_min_period).any():
+        pot_th[np.cumsum(~np.isnan(block), axis=0) < min_periods] = np.nan
+    pot_th = _shift_and_bfill(block=pot_th)
+    pot_data = np.clip(block - pot_th, 0, None)
+    return pot_th, pot_data, rank_error
+
+
+def calculate_peak_over_threshold(
+    df: DataFrame, features: list[str], min_period: int, quantile: float, window: int | None = None
+) -> DataFrame:
+    pot_th, _, _ = compute_peak_over_threshold_block(
+        values=df[features].to_numpy(dtype="float64"), min_period=min_period, quantile=quantile, window=window
+    )
+    pot_th_df = DataFrame(
+        data=pot_th,
+        index=df.index,
+        columns=[f"pot_th_{feature}" for feature in features],
+    )
+    return concat([df, pot_th_df], axis=1)
 
 
 def get_data_over_threshold(df: DataFrame, features: list[str]) -> DataFrame:
-    for feature in features:
-        df[f"pot_data_{feature}"] = (df[feature] - df[f"pot_th_{feature}"]).clip(0, None)
-    return df
+    pot_data_df = DataFrame(
+        data=np.clip(
+            df[features].to_numpy(dtype="float64")
+            - df[[f"pot_th_{feature}" for feature in features]].to_numpy(dtype="float64"),
+            0,
+            None,
+        ),
+        index=df.index,
+        columns=[f"pot_data_{feature}" for feature in features],
+    )
+    return concat([df, pot_data_df], axis=1)
@@ -0,0 +1,130 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from src.anomaly_detection.utils.quantile import QUANTILE_TILE_SIZE, rank_columns, WaveletMatrix
+
+# The MAD of a normal distribution times this factor estimates its standard deviation.
+MAD_SCALE = 1.4826
+
+
+def _kth_deviation(
+    kth_value,
+    kth: NDArray[np.integer],
+    median: NDArray[np.float64],
+    below: NDArray[np.integer],
+    size: NDArray[np.integer],
+) -> NDArray[np.float64]:
+    # The deviations from the median are two sorted runs: `median - s[below - 1 - i]` for the `below` values up to
+    # the median and `s[below + j] - median` for the rest. The k-th smallest of their merge is found by a binary
+    # search over how many of the `k + 1` smallest deviations come from the first run.
+    above = size - below
+    low = np.maximum(kth + 1 - above, 0)
+    high = np.minimum(kth + 1, below)
+    for _ in range(int(np.max(high - low, initial=0)).bit_length() + 1):
+        middle = (low + high) // 2
+        taken_above = kth + 1 - middle
+        below_deviation = median - kth_value(np.clip(below - 1 - middle, 0, size - 1))
+        above_deviation = kth_value(np.clip(below + taken_above - 1, 0, size - 1)) - median
+        is_enough = (middle >= below) | (taken_above <= 0) | (above_deviation <= below_deviation)
+        is_searching = low < high
+        high = np.where(is_searching & is_enough, middle, high)
+        low = np.where(is_searching & ~is_enough, middle + 1, low)
+    taken_above = kth + 1 - low
+    below_deviation = np.where(low > 0, median - kth_value(np.clip(below - low, 0, size - 1)), -np.inf)
+    above_deviation = np.where(
+        taken_above > 0, kth_value(np.clip(below + taken_above - 1, 0, size - 1)) - median, -np.inf
+    )
+    return np.maximum(below_deviation, above_deviation)
+
+
+def _median_mad_block(
+    block: NDArray[np.float64], window: int | None, min_period: int
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    median = np.full(block.shape, np.nan)
+    mad = np.full(block.shape, np.nan)
+    ranks, sorted_data, offsets, counts = rank_columns(block=block)
+    if window is None:
+        starts = np.zeros(block.shape, dtype=counts.dtype)
+    else:
+        starts = np.zeros(block.shape, dtype=counts.dtype)
+        starts[window:] = counts[:-window]
+    sizes = counts - starts
+    rows, cols = np.nonzero(sizes >= max(min_period, 1))
+    if rows.shape[0] == 0:
+        return median, mad
+
+    left = (offsets[cols] + starts[rows, cols]).astype(ranks.dtype)
+    size = sizes[rows, cols].astype(ranks.dtype)
+    wavelet_matrix = WaveletMatrix(ranks=ranks)
+
+    def kth_value(kth: NDArray[np.integer]) -> NDArray[np.float64]:
+        repeats = kth.shape[0] // left.shape[0]
+        return sorted_data[
+            wavelet_matrix.kth_smallest(
+                left=np.tile(left, repeats), right=np.tile(left + size, repeats), kth=kth.astype(ranks.dtype)
+            )
+        ]
+
+    middle = np.concatenate(((size - 1) // 2, size // 2))
+    lower, upper = np.split(kth_value(middle), 2)
+    window_median = (lower + upper) / 2
+    below = (size + 1) // 2
+    lower, upper = np.split(
+        _kth_deviation(
+            kth_value=kth_value,
+            kth=middle,
+            median=np.tile(window_median, 2),
+            below=np.tile(below, 2),
+            size=np.tile(size, 2),
+        ),
+        2,
+    )
+    median[rows, cols] = window_median
+    mad[rows, cols] = (lower + upper) / 2
+    return median, mad
+
+
+def median_absolute_deviation(
+    values: ArrayLike, window: int | None = None, min_period: int = 1
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Calculate the exact median and median absolute deviation over an expanding or sliding window of every column.
+
+    A sorted window would cost O(w log w) per row for the median of the absolute deviations, because the deviations
+    change with every new median. Instead, the values of all columns are ranked once into a wavelet matrix, which
+    answers "k-th smallest value between two positions" for all windows together in O(log n). The median takes two
+    such queries per window, the MAD a binary search of O(log w) steps over the two sorted runs of deviations below
+    and above the median, so all windows cost O(n log w log n) in a handful of vectorized passes.
+
+    Args:
+        :values (ArrayLike): The 1-D data or the 2-D (n_rows x n_features) block in arrival order.
+        :window (int | None): The number of most recent rows of every window, None for an expanding window.
+        :min_period (int): The minimum number of non-NaN observations in a window needed to produce a value.
+
+    Returns:
+        :median_and_mad (tuple[np.ndarray, np.ndarray]): The median and the MAD of every window in the shape of
+            `values`, NaN where there is not enough data.
+    """
+    if window is not None and window < 1:
+        raise ValueError("Parameter `window` must be a positive integer.")
+    data = np.asarray(values, dtype=np.float64)
+    if data.ndim not in (1, 2):
+        raise ValueError("Parameter `values` must be 1- or 2-dimensional.")
+    block = data[:, None] if data.ndim == 1 else data
+    median = np.empty(block.shape)
+    mad = np.empty(block.shape)
+    # A sliding window only looks `window - 1` rows back, so long series are cut into row tiles with that overlap,
+    # which keeps every wavelet matrix small. An expanding window needs all rows at once.
+    row_tile = block.shape[0] if window is None else max(QUANTILE_TILE_SIZE, 4 * window)
+    tile_width = max(QUANTILE_TILE_SIZE // max(min(block.shape[0], row_tile), 1), 1)
+    overlap = 0 if window is None else window - 1
+    for row_start in range(0, max(block.shape[0], 1), max(row_tile, 1)):
+        row_stop = min(row_start + row_tile, block.shape[0])
+        context_start = max(row_start - overlap, 0)
+        for start in range(0, block.shape[1], tile_width):
+            stop = start + tile_width
+            tile_median, tile_mad = _median_mad_block(
+                block=block[context_start:row_stop, start:stop], window=window, min_period=min_period
+            )
+            median[row_start:row_stop, start:stop] = tile_median[row_start - context_start :]
+            mad[row_start:row_stop, start:stop] = tile_mad[row_start - context_start :]
+    return median.reshape(data.shape), mad.reshape(data.shape)
@@ -0,0 +1,204 @@
+import warnings
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from pandas import DataFrame
+
+CUMSUM_BLOCK_SIZE = 4096
+
+
+def compensated_cumsum(block: NDArray[np.float64], block_size: int = CUMSUM_BLOCK_SIZE) -> NDArray[np.float64]:
+    """Calculate the cumulative sum along the rows with an error that does not grow with the number of rows.
+
+    A plain `np.cumsum` accumulates one rounding error per row. Here the rows are summed in blocks of `block_size`
+    and only the pairwise-summed block totals are carried across blocks, with Neumaier's compensated summation, so
+    the error of every prefix stays in the order of `block_size` roundings even for 10M+ rows. Blocks never exceed
+    the number of rows, so a small streaming batch is not padded to a whole block.
+    """
+    total_rows = block.shape[0]
+    block_size = max(min(block_size, total_rows), 1)
+    total_blocks = -(-total_rows // block_size)
+    padded = np.zeros((total_blocks * block_size, *block.shape[1:]))
+    padded[:total_rows] = block
+    blocks = padded.reshape(total_blocks, block_size, -1)
+    local = np.cumsum(blocks, axis=1).reshape(total_blocks, block_size, *block.shape[1:])
+    # The block totals are summed pairwise along a contiguous axis, which is far more accurate than the last cumsum.
+    totals = np.sum(np.ascontiguousarray(blocks.transpose(0, 2, 1)), axis=2).reshape(total_blocks, *block.shape[1:])
+
+    offsets = np.empty((total_blocks, *block.shape[1:]))
+    running = np.zeros(block.shape[1:])
+    compensation = np.zeros(block.shape[1:])
+    for idx in range(total_blocks):
+        offsets[idx] = running + compensation
+        total = totals[idx]
+        added = running + total
+        compensation += np.where(
+            np.abs(running) >= np.abs(total), (running - added) + total, (total - added) + running
+        )
+        running = added
+    return (local + offsets[:, None]).reshape(padded.shape)[:total_rows]
+
+
+def _first_valid(block: NDArray[np.float64]) -> NDArray[np.float64]:
+    is_valid = ~np.isnan(block)
+    first = np.take_along_axis(block, np.argmax(is_valid, axis=0)[None, :], axis=0)[0]
+    return np.where(is_valid.any(axis=0), first, 0.0)
+
+
+def _prefix_moments(
+    block: NDArray[np.float64], count: NDArray[np.int64], mean: NDArray[np.float64], m2: NDArray[np.float64]
+) -> tuple[NDArray[np.int64], NDArray[np.float64], NDArray[np.float64]]:
+    # The count, mean and sum of squared deviations of every prefix, continuing from the given moments. All sums are
+    # taken around a reference close to the data (the running mean, or the first value) to avoid cancellation.
+    reference = np.where(count > 0, mean, _first_valid(block=block))
+    is_valid = ~np.isnan(block)
+    deviation = np.where(is_valid, block - reference, 0.0)
+    counts: NDArray[np.int64] = count + np.cumsum(is_valid, axis=0)
+    sum_deviation = compensated_cumsum(block=deviation)
+    sum_squared_deviation = compensated_cumsum(block=deviation * deviation)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        prefix_mean: NDArray[np.float64] = reference + sum_deviation / counts
+        prefix_m2: NDArray[np.float64] = np.maximum(
+            m2 + sum_squared_deviation - sum_deviation * sum_deviation / counts, 0.0
+        )
+    return counts, prefix_mean, prefix_m2
+
+
+def _std(counts: NDArray[np.int64], m2: NDArray[np.float64]) -> NDArray[np.float64]:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(counts > 1, np.sqrt(m2 / (counts - 1)), np.nan)
+
+
+def expanding_mean_std(values: ArrayLike, min_period: int = 2) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Calculate the expanding mean and sample standard deviation of every column in O(n).
+
+    The result matches `DataFrame(values).expanding(min_periods=min_period).mean()` and `.std()`, NaN values are
+    skipped.
+
+    Args:
+        :values (ArrayLike): The 2-D (n_rows x n_features) block in arrival order.
+        :min_period (int): The minimum number of non-NaN observations needed to produce a value.
+
+    Returns:
+        :mean_and_std (tuple[np.ndarray, np.ndarray]): The mean and standard deviation of every prefix, NaN where
+            there is not enough data.
+    """
+    block = np.asarray(values, dtype=np.float64)
+    if block.ndim != 2:
+        raise ValueError("Parameter `values` must be 2-dimensional.")
+    zeros = np.zeros(block.shape[1])
+    counts, mean, m2 = _prefix_moments(block=block, count=zeros.astype(np.int64), mean=zeros, m2=zeros)
+    is_enough = counts >= max(min_period, 1)
+    return np.where(is_enough, mean, np.nan), np.where(is_enough, _std(counts=counts, m2=m2), np.nan)
+
+
+def rolling_mean_std(
+    values: ArrayLike, window: int, min_period: int = 2
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Calculate the mean and sample standard deviation over the last `window` rows of every column in O(n).
+
+    Differences of prefix sums would cancel badly for small windows deep into a long series, so this uses pandas'
+    rolling moments instead, which add and remove one value per step with Welford's update and Kahan summation.
+
+    Args:
+        :values (ArrayLike): The 2-D (n_rows x n_features) block in arrival order.
+        :window (int): The number of most recent rows.
+        :min_period (int): The minimum number of non-NaN observations in a window needed to produce a value.
+
+    Returns:
+        :mean_and_std (tuple[np.ndarray, np.ndarray]): The mean and standard deviation of every window, NaN where
+            there is not enough data.
+    """
+    if window < 1:
+        raise ValueError("Parameter `window` must be a positive integer.")
+    block = np.asarray(values, dtype=np.float64)
+    if block.ndim != 2:
+        raise ValueError("Parameter `values` must be 2-dimensional.")
+    rolling = DataFrame(block).rolling(window=window, min_periods=min(max(min_period, 1), window))
+    mean = rolling.mean().to_numpy()
+    std = rolling.std().to_numpy()
+    if min_period > window:
+        mean[:], std[:] = np.nan, np.nan
+    return mean, std
+
+
+class RunningMoments:
+    """The count, mean and sum of squared deviations (Welford's `M2`) of every feature, updated batch by batch.
+
+    A batch of `k` rows is folded in with Chan's parallel update on compensated prefix sums, which is O(1) work per
+    value and gives every row the moments of all values before it. A single row takes Welford's update directly.
+
+    Args:
+        :total_features (int): The number of features, i.e. columns of every batch.
+    """
+
+    def __init__(self, total_features: int):
+        self.count = np.zeros(total_features, dtype=np.int64)
+        self.mean = np.zeros(total_features)
+        self.m2 = np.zeros(total_features)
+
+    @property
+    def std(self) -> NDArray[np.float64]:
+        return _std(counts=self.count, m2=self.m2)
+
+    def update(self, values: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Fold a batch into the moments.
+
+        Args:
+            :values (ArrayLike): The 2-D (n_rows x n_features) batch in arrival order.
+
+        Returns:
+            :mean_and_std_before (tuple[np.ndarray, np.ndarray]): The mean and standard deviation of all values before
+                every row of the batch.
+        """
+        block = np.asarray(values, dtype=np.float64)
+        if block.ndim != 2 or block.shape[1] != self.count.shape[0]:
+            raise ValueError("Parameter `values` must be a 2-D block with one column per feature.")
+        if block.shape[0] == 0:
+            return np.empty(block.shape), np.empty(block.shape)
+        if block.shape[0] == 1:
+            return self.__update_row(row=block[0])
+        counts, mean, m2 = _prefix_moments(block=block, count=self.count, mean=self.mean, m2=self.m2)
+        mean_before = np.concatenate((np.where(self.count > 0, self.mean, np.nan)[None, :], mean[:-1]))
+        mean_before[np.concatenate((self.count[None, :], counts[:-1])) == 0] = np.nan
+        std_before = np.concatenate((self.std[None, :], _std(counts=counts[:-1], m2=m2[:-1])))
+
+        has_values = counts[-1] > 0
+        self.count = counts[-1]
+        self.mean = np.where(has_values, mean[-1], self.mean)
+        self.m2 = np.where(has_values, m2[-1], self.m2)
+        return mean_before, std_before
+
+    def __update_row(self, row: NDArray[np.float64]) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        # Welford's update of a single value per feature, a few vector operations instead of the prefix sums.
+        mean_before = np.where(self.count > 0, self.mean, np.nan)[None, :]
+        std_before = self.std[None, :]
+        is_valid = ~np.isnan(row)
+        count = self.count + is_valid
+        delta = np.where(is_valid, row - self.mean, 0.0)
+        mean = self.mean + delta / np.maximum(count, 1)
+        self.m2 = np.where(is_valid, self.m2 + delta * (row - mean), self.m2)
+        self.count = count
+        self.mean = mean
+        return mean_before, std_before
+
+
+def absolute_z_score(values: ArrayLike, mean: ArrayLike, std: ArrayLike) -> NDArray[np.float64]:
+    """Calculate `|x - mean| / std`, inf for a deviation from a constant history and NaN where a moment is missing."""
+    deviation = np.abs(np.asarray(values, dtype=np.float64) - np.asarray(mean, dtype=np.float64))
+    std = np.asarray(std, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 0, deviation / std, np.where(deviation > 0, np.inf, deviation))
+
+
+def standardize(values: ArrayLike, calibration_rows: int) -> NDArray[np.float64]:
+    """Center and scale every column by the mean and standard deviation of its first `calibration_rows` rows.
+
+    A constant column is only centered, a column without any value in the calibration rows becomes NaN.
+    """
+    block = np.asarray(values, dtype=np.float64)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        mean = np.nanmean(block[:calibration_rows], axis=0)
+        std = np.nanstd(block[:calibration_rows], axis=0)
+    return (block - mean) / np.where(std > 0, std, 1.0)
@@ -0,0 +1,117 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from scipy.spatial import cKDTree
+
+from src.anomaly_detection.utils.parallel import resolve_n_jobs
+
+NEIGHBOR_CHUNK_SIZE = 2**16
+
+
+def _as_points(points: ArrayLike) -> NDArray[np.float64]:
+    data = np.asarray(points, dtype=np.float64)
+    if data.ndim == 1:
+        data = data[:, None]
+    if data.ndim != 2:
+        raise ValueError("Parameter `points` must be 1- or 2-dimensional.")
+    return data
+
+
+def is_core_point(points: ArrayLike, eps: float, min_samples: int, n_jobs: int = 1) -> NDArray[np.bool_]:
+    """Tell for every point whether at least `min_samples` points, itself included, lie within the distance `eps`.
+
+    Only whether the count reaches `min_samples` matters, so the neighbors are never counted further. 1-D points are
+    sorted once and every count is two binary searches. Points of a few dimensions go through a `scipy.spatial.cKDTree`
+    which looks for the `min_samples` nearest points within `eps` only, in chunks of `NEIGHBOR_CHUNK_SIZE` points.
+    Either way it is about O(n log n) time, and the memory is O(n + NEIGHBOR_CHUNK_SIZE * min_samples) however dense
+    the points are.
+
+    Args:
+        :points (ArrayLike): The 1-D values or the (n_points x n_dimensions) block, without NaN.
+        :eps (float): The radius of the neighborhood, its boundary included.
+        :min_samples (int): The number of neighbors that makes a point a core point.
+        :n_jobs (int): The number of threads of the tree queries, negative values count back from the number of CPUs.
+
+    Returns:
+        :is_core (np.ndarray): Whether every point is a core point.
+    """
+    data = _as_points(points=points)
+    if data.shape[1] == 1:
+        sorted_values = np.sort(data[:, 0])
+        counts = np.searchsorted(sorted_values, data[:, 0] + eps, side="right") - np.searchsorted(
+            sorted_values, data[:, 0] - eps, side="left"
+        )
+        return counts >= min_samples
+    if data.shape[0] < min_samples:
+        return np.zeros(data.shape[0], dtype=bool)
+    tree = cKDTree(data)
+    is_core = np.empty(data.shape[0], dtype=bool)
+    for start in range(0, data.shape[0], NEIGHBOR_CHUNK_SIZE):
+        distance, _ = tree.query(
+            data[start : start + NEIGHBOR_CHUNK_SIZE],
+            k=[min_samples],
+            distance_upper_bound=np.nextafter(eps, np.inf),
+            workers=resolve_n_jobs(n_jobs=n_jobs),
+        )
+        is_core[start : start + NEIGHBOR_CHUNK_SIZE] = distance[:, 0] <= eps
+    return is_core
+
+
+def nearest_distance(points: ArrayLike, references: ArrayLike, n_jobs: int = 1) -> NDArray[np.float64]:
+    """Calculate the Euclidean distance from every point to its nearest reference point, inf without references.
+
+    Args:
+        :points (ArrayLike): The 1-D values or the (n_points x n_dimensions) block, without NaN.
+        :references (ArrayLike): The reference points in the same dimensions.
+        :n_jobs (int): The number of threads of the tree queries, negative values count back from the number of CPUs.
+
+    Returns:
+        :distance (np.ndarray): The distance of every point.
+    """
+    data = _as_points(points=points)
+    reference_data = _as_points(points=references)
+    if reference_data.shape[0] == 0:
+        return np.full(data.shape[0], np.inf)
+    if data.shape[1] == 1:
+        sorted_values = np.sort(reference_data[:, 0])
+        idx = np.searchsorted(sorted_values, data[:, 0])
+        below = sorted_values[np.clip(idx - 1, 0, None)]
+        above = sorted_values[np.clip(idx, None, sorted_values.shape[0] - 1)]
+        return np.minimum(np.abs(data[:, 0] - below), np.abs(above - data[:, 0]))
+    tree = cKDTree(reference_data)
+    distance = np.empty(data.shape[0])
+    for start in range(0, data.shape[0], NEIGHBOR_CHUNK_SIZE):
+        distance[start : start + NEIGHBOR_CHUNK_SIZE], _ = tree.query(
+            data[start : start + NEIGHBOR_CHUNK_SIZE], k=1, workers=resolve_n_jobs(n_jobs=n_jobs)
+        )
+    return distance
+
+
+def dbscan_core_distance(points: ArrayLike, eps: float, min_samples: int, n_jobs: int = 1) -> NDArray[np.float64]:
+    """Calculate the distance of every point to the nearest DBSCAN core point, NaN for points with NaN.
+
+    A core point has at least `min_samples` points within `eps`, itself included. Core points are at distance 0,
+    border points, which join the cluster of a core point, are at most `eps` away, and everything further is noise.
+    The cluster labels themselves are never built, so no neighbor pairs are ever held in memory.
+
+    Args:
+        :points (ArrayLike): The 1-D values or the (n_points x n_dimensions) block.
+        :eps (float): The radius of the neighborhood, its boundary included.
+        :min_samples (int): The number of neighbors that makes a point a core point.
+        :n_jobs (int): The number of threads of the tree queries, negative values count back from the number of CPUs.
+
+    Returns:
+        :core_distance (np.ndarray): The distance of every point to the nearest core point.
+    """
+    if eps <= 0.0 or min_samples < 1:
+        raise ValueError("Parameter `eps` must be positive and `min_samples` a positive integer.")
+    data = _as_points(points=points)
+    is_valid = ~np.isnan(data).any(axis=1)
+    valid_data = data[is_valid]
+    is_core = is_core_point(points=valid_data, eps=eps, min_samples=min_samples, n_jobs=n_jobs)
+    valid_core_distance = np.zeros(valid_data.shape[0])
+    valid_core_distance[~is_core] = nearest_distance(
+        points=valid_data[~is_core], references=valid_data[is_core], n_jobs=n_jobs
+    )
+    core_distance = np.full(data.shape[0], np.nan)
+    core_distance[is_valid] = valid_core_distance
+    return core_distance
@@ -0,0 +1,113 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+RECONSTRUCTION_CHUNK_SIZE = 2**15
+
+
+class DenseAutoencoder:
+    """A small dense autoencoder in plain NumPy with float32 weights, tanh hidden layers and a linear output layer.
+
+    It is trained with minibatch Adam on the mean squared reconstruction error. Every minibatch and every scoring
+    chunk is one matrix product per layer, so the memory is bounded by `batch_size` or `RECONSTRUCTION_CHUNK_SIZE`
+    rows whatever the number of windows.
+
+    Args:
+        :layer_sizes (list[int]): The sizes of all layers from the input to the output, e.g. `[16, 8, 4, 8, 16]`.
+        :learning_rate (float): The Adam step size.
+        :seed (int | None): The seed of the initial weights and the minibatch order.
+    """
+
+    def __init__(self, layer_sizes: list[int], learning_rate: float = 1e-3, seed: int | None = None):
+        if len(layer_sizes) < 2 or layer_sizes[0] != layer_sizes[-1] or min(layer_sizes) < 1:
+            raise ValueError("Parameter `layer_sizes` must be positive sizes from the input back to the same output.")
+        self.learning_rate = np.float32(learning_rate)
+        self.rng = np.random.default_rng(seed)
+        # Glorot uniform initialization keeps the tanh layers away from saturation.
+        self.weights = [
+            self.rng.uniform(-limit, limit, size=(fan_in, fan_out)).astype(np.float32)
+            for fan_in, fan_out, limit in (
+                (fan_in, fan_out, np.sqrt(6.0 / (fan_in + fan_out)))
+                for fan_in, fan_out in zip(layer_sizes[:-1], layer_sizes[1:])
+            )
+        ]
+        self.biases = [np.zeros(fan_out, dtype=np.float32) for fan_out in layer_sizes[1:]]
+        self.__moments = [np.zeros_like(parameter) for parameter in self.weights + self.biases]
+        self.__squared_moments = [np.zeros_like(parameter) for parameter in self.weights + self.biases]
+        self.__step = 0
+
+    def _forward(self, inputs: NDArray[np.float32]) -> list[NDArray[np.float32]]:
+        activations = [inputs]
+        for idx, (weight, bias) in enumerate(zip(self.weights, self.biases)):
+            output = activations[-1] @ weight
+            output += bias
+            if idx < len(self.weights) - 1:
+                np.tanh(output, out=output)
+            activations.append(output)
+        return activations
+
+    def _adam_step(self, gradients: list[NDArray[np.float32]]) -> None:
+        self.__step += 1
+        beta_1, beta_2, epsilon = np.float32(0.9), np.float32(0.999), np.float32(1e-7)
+        step_size = self.learning_rate * np.sqrt(1.0 - beta_2**self.__step) / (1.0 - beta_1**self.__step)
+        for parameter, gradient, moment, squared_moment in zip(
+            self.weights + self.biases, gradients, self.__moments, self.__squared_moments
+        ):
+            moment *= beta_1
+            moment += (1.0 - beta_1) * gradient
+            squared_moment *= beta_2
+            squared_moment += (1.0 - beta_2) * gradient * gradient
+            parameter -= np.float32(step_size) * moment / (np.sqrt(squared_moment) + epsilon)
+
+    def fit(self, inputs: ArrayLike, total_epochs: int = 20, batch_size: int = 256) -> NDArray[np.float64]:
+        """Train on the rows without NaN of the 2-D (n_rows x input_size) block.
+
+        Returns:
+            :losses (np.ndarray): The mean squared reconstruction error of every epoch.
+        """
+        data = np.asarray(inputs, dtype=np.float32)
+        if data.ndim != 2 or data.shape[1] != self.weights[0].shape[0]:
+            raise ValueError("Parameter `inputs` must be a 2-D block with one column per input.")
+        data = data[~np.isnan(data).any(axis=1)]
+        if data.shape[0] == 0:
+            raise ValueError("Parameter `inputs` needs at least one row without NaN.")
+        losses = np.empty(total_epochs)
+        for epoch in range(total_epochs):
+            order = self.rng.permutation(data.shape[0])
+            total_loss = 0.0
+            for start in range(0, data.shape[0], batch_size):
+                batch = data[order[start : start + batch_size]]
+                activations = self._forward(inputs=batch)
+                residual = activations[-1] - batch
+                total_loss += float(np.square(residual).sum())
+                # The gradient of the mean squared error, propagated back through the linear and tanh layers.
+                delta = residual * np.float32(2.0 / residual.size)
+                weight_gradients, bias_gradients = [], []
+                for idx in range(len(self.weights) - 1, -1, -1):
+                    weight_gradients.append(activations[idx].T @ delta)
+                    bias_gradients.append(delta.sum(axis=0))
+                    if idx > 0:
+                        delta = (delta @ self.weights[idx].T) * (1.0 - activations[idx] * activations[idx])
+                self._adam_step(gradients=weight_gradients[::-1] + bias_gradients[::-1])
+            losses[epoch] = total_loss / data.size
+        return losses
+
+    def reconstruction_error(self, inputs: ArrayLike) -> NDArray[np.float64]:
+        """Calculate the mean squared reconstruction error of every row in chunks of `RECONSTRUCTION_CHUNK_SIZE`.
+
+        Args:
+            :inputs (ArrayLike): The 2-D (n_rows x input_size) block.
+
+        Returns:
+            :error (np.ndarray): The error of every row, NaN for rows with NaN.
+        """
+        data = np.asarray(inputs)
+        if data.ndim != 2 or data.shape[1] != self.weights[0].shape[0]:
+            raise ValueError("Parameter `inputs` must be a 2-D block with one column per input.")
+        error = np.empty(data.shape[0])
+        for start in range(0, data.shape[0], RECONSTRUCTION_CHUNK_SIZE):
+            chunk = np.asarray(data[start : start + RECONSTRUCTION_CHUNK_SIZE], dtype=np.float32)
+            residual = self._forward(inputs=chunk)[-1] - chunk
+            error[start : start + RECONSTRUCTION_CHUNK_SIZE] = (
+                np.einsum("ij,ij->i", residual, residual) / data.shape[1]
+            )
+        return error
@@ -0,0 +1,107 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from src.anomaly_detection.utils.math import compute_peak_over_threshold_block
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """Turn a joblib-style `n_jobs` into a number of processes, -1 means one per CPU, -2 all CPUs but one, etc."""
+    if n_jobs == 0:
+        raise ValueError("Parameter `n_jobs` can not be 0.")
+    total_cpus = os.cpu_count() or 1
+    return max(n_jobs if n_jobs > 0 else total_cpus + 1 + n_jobs, 1)
+
+
+def _view(shm: shared_memory.SharedMemory, shape: tuple[int, ...]) -> NDArray[np.float64]:
+    # The blocks are laid out feature by feature (Fortran order), so every worker's features are one contiguous slab.
+    return np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+
+
+def _pot_worker(
+    names: list[str],
+    shape: tuple[int, int],
+    start: int,
+    stop: int,
+    min_period: int,
+    quantile: float,
+    compression: float | None,
+    window: int | None,
+) -> None:
+    segments = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        pot_th, pot_data, rank_error = compute_peak_over_threshold_block(
+            values=_view(shm=segments[0], shape=shape)[:, start:stop],
+            min_period=min_period,
+            quantile=quantile,
+            compression=compression,
+            window=window,
+        )
+        _view(shm=segments[1], shape=shape)[:, start:stop] = pot_th
+        _view(shm=segments[2], shape=shape)[:, start:stop] = pot_data
+        _view(shm=segments[3], shape=(shape[1],))[start:stop] = rank_error
+    finally:
+        for segment in segments:
+            segment.close()
+
+
+def parallel_peak_over_threshold_block(
+    values: ArrayLike,
+    min_period: int,
+    quantile: float,
+    compression: float | None = None,
+    window: int | None = None,
+    n_jobs: int = -1,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Spread `compute_peak_over_threshold_block` over a process pool, one contiguous range of features per worker.
+
+    The block and the results live in `multiprocessing.shared_memory`, so the workers neither receive nor send back
+    any column through pickling, they only read their slab of the input and write into their slab of the outputs.
+
+    Args:
+        :values (ArrayLike): The 2-D (n_rows x n_features) block with one column per feature.
+        :min_period (int): The minimum number of observations before the expanding threshold starts.
+        :quantile (float): The quantile that is used as threshold.
+        :compression (float | None): The `TDigest` compression for approximate thresholds, None for exact ones.
+        :window (int | None): The number of most recent rows for sliding-window thresholds, None for expanding ones.
+        :n_jobs (int): The number of worker processes, negative values count back from the number of CPUs.
+
+    Returns:
+        :pot_th_data_rank_error (tuple[np.ndarray, np.ndarray, np.ndarray]): The same as
+            `compute_peak_over_threshold_block`.
+    """
+    data = np.asarray(values, dtype=np.float64)
+    if data.ndim != 2:
+        raise ValueError("Parameter `values` must be 2-dimensional.")
+    total_jobs = min(resolve_n_jobs(n_jobs=n_jobs), data.shape[1])
+    if total_jobs <= 1 or data.size == 0:
+        return compute_peak_over_threshold_block(
+            values=data, min_period=min_period, quantile=quantile, compression=compression, window=window
+        )
+
+    segments = [shared_memory.SharedMemory(create=True, size=max(data.nbytes, 8)) for _ in range(3)]
+    segments.append(shared_memory.SharedMemory(create=True, size=data.shape[1] * 8))
+    try:
+        _view(shm=segments[0], shape=data.shape)[:] = data
+        bounds = np.linspace(0, data.shape[1], total_jobs + 1).astype(int)
+        names = [segment.name for segment in segments]
+        shape = (data.shape[0], data.shape[1])
+        with ProcessPoolExecutor(max_workers=total_jobs) as executor:
+            futures = [
+                executor.submit(_pot_worker, names, shape, start, stop, min_period, quantile, compression, window)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+        return (
+            np.array(_view(shm=segments[1], shape=data.shape), order="C"),
+            np.array(_view(shm=segments[2], shape=data.shape), order="C"),
+            _view(shm=segments[3], shape=(data.shape[1],)).copy(),
+        )
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
@@ -0,0 +1,270 @@
+import importlib
+import json
+import os
+import zipfile
+from collections.abc import Mapping
+from itertools import count
+from typing import Any, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+FORMAT_VERSION = 1
+METADATA_KEY = "__metadata__"
+# Classes are only ever re-created from this package, a bundle can not instantiate anything else.
+PACKAGE_NAME = "anomaly_detection"
+JSON_TYPES = (type(None), bool, int, float, str)
+
+
+class _BundleWriter:
+    """Turn an object graph into a JSON description and a flat dict of arrays.
+
+    Every array gets a generated name, so feature names never end up in the member names of the `.npz`. The values of
+    a dict, e.g. the per-feature forests of a detector, are packed together: the same array of every value is stored
+    back to back in one array with the offsets and shapes next to it, and numeric scalars become one array as well.
+    100k per-feature models are then a handful of arrays instead of millions of members.
+    """
+
+    def __init__(self):
+        self.arrays: dict[str, NDArray] = {}
+        self.__names = count()
+
+    def add_array(self, array: NDArray) -> str:
+        if array.dtype.hasobject:
+            raise ValueError("Arrays of Python objects can not be saved.")
+        name = f"array_{next(self.__names)}"
+        self.arrays[name] = array
+        return name
+
+    def describe(self, value: Any) -> dict:
+        if isinstance(value, np.generic):
+            return {"kind": "scalar", "key": self.add_array(array=np.asarray(value))}
+        if isinstance(value, JSON_TYPES):
+            return {"kind": "value", "value": value}
+        if isinstance(value, (list, tuple)) and all(isinstance(item, JSON_TYPES) for item in value):
+            return {"kind": "value", "value": list(value), "tuple": isinstance(value, tuple)}
+        if isinstance(value, np.ndarray):
+            return {"kind": "array", "key": self.add_array(array=np.asarray(value))}
+        if isinstance(value, (list, tuple)):
+            return {
+                "kind": "list",
+                "tuple": isinstance(value, tuple),
+                "items": [self.describe(value=item) for item in value],
+            }
+        if isinstance(value, Mapping):
+            if not all(isinstance(key, str) for key in value):
+                raise ValueError("Only dicts with str keys can be saved.")
+            return {
+                "kind": "packed_dict",
+                "keys": list(value),
+                "node": self.pack(nodes=[self.describe(value=item) for item in value.values()]),
+            }
+        if isinstance(value, np.random.Generator):
+            return {"kind": "rng", "state": value.bit_generator.state}
+        if PACKAGE_NAME in type(value).__module__.split(".") and hasattr(value, "__dict__"):
+            return {
+                "kind": "object",
+                "class": f"{type(value).__module__}:{type(value).__qualname__}",
+                "state": {name: self.describe(value=item) for name, item in vars(value).items()},
+            }
+        raise ValueError(f"Objects of type {type(value).__name__} can not be saved.")
+
+    def pack(self, nodes: list[dict]) -> dict:
+        """Merge the descriptions of many values of the same structure into one, stacking their arrays."""
+        kinds = {node["kind"] for node in nodes}
+        kind = kinds.pop() if len(kinds) == 1 else None
+        if kind in ("array", "scalar"):
+            parts = [self.arrays[node["key"]] for node in nodes]
+            if len({part.dtype for part in parts}) == 1 and len({part.ndim for part in parts}) == 1:
+                for node in nodes:
+                    del self.arrays[node["key"]]
+                sizes = np.array([part.size for part in parts], dtype=np.int64)
+                return {
+                    "kind": "stacked_array",
+                    "scalar": kind == "scalar",
+                    "data": self.add_array(array=np.concatenate([part.ravel() for part in parts])),
+                    "offsets": self.add_array(array=np.r_[0, np.cumsum(sizes)]),
+                    "shapes": self.add_array(
+                        array=np.array([part.shape for part in parts], dtype=np.int64).reshape(len(parts), -1)
+                    ),
+                }
+        elif kind == "value":
+            values = [node["value"] for node in nodes]
+            if all(type(value) is float for value in values):
+                return {"kind": "stacked_value", "type": "float", "key": self.add_array(array=np.array(values))}
+            if all(type(value) is int and abs(value) < 2**63 for value in values):
+                return {"kind": "stacked_value", "type": "int", "key": self.add_array(array=np.array(values))}
+            return {"kind": "values", "nodes": nodes}
+        elif kind == "list" and len({(len(node["items"]), node["tuple"]) for node in nodes}) == 1:
+            return {
+                "kind": "list",
+                "tuple": nodes[0]["tuple"],
+                "items": [self.pack(nodes=list(items)) for items in zip(*(node["items"] for node in nodes))],
+            }
+        elif kind == "object" and len({(node["class"], tuple(node["state"])) for node in nodes}) == 1:
+            return {
+                "kind": "object",
+                "class": nodes[0]["class"],
+                "state": {
+                    name: self.pack(nodes=[node["state"][name] for node in nodes]) for name in nodes[0]["state"]
+                },
+            }
+        return {"kind": "values", "nodes": nodes}
+
+
+def _import_class(path: str) -> type[Any]:
+    module_name, _, qualname = path.partition(":")
+    if PACKAGE_NAME not in module_name.split("."):
+        raise ValueError(f"Class {path} is not part of {PACKAGE_NAME} and can not be loaded.")
+    cls: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        cls = getattr(cls, name, None)
+    # Only a class defined in that very module qualifies, not one the module merely imported, e.g. `zipfile.ZipFile`.
+    if not isinstance(cls, type) or cls.__module__ != module_name or cls.__qualname__ != qualname:
+        raise ValueError(f"Class {path} is not part of {PACKAGE_NAME} and can not be loaded.")
+    return cls
+
+
+class _BundleReader:
+    """Re-create the object graph of a `_BundleWriter` description on top of the loaded arrays."""
+
+    def __init__(self, arrays: Mapping[str, NDArray]):
+        self.arrays = arrays
+
+    def restore(self, node: dict, index: int | None = None) -> Any:
+        kind = node["kind"]
+        if kind == "value":
+            return tuple(node["value"]) if node.get("tuple") else node["value"]
+        if kind == "values":
+            return self.restore(node=node["nodes"][index])
+        if kind == "scalar":
+            return self.arrays[node["key"]][()]
+        if kind == "array":
+            return self.arrays[node["key"]]
+        if kind == "stacked_array":
+            assert index is not None, "A stacked array is only restored through its packed dict."
+            offsets = self.arrays[node["offsets"]]
+            part = self.arrays[node["data"]][offsets[index] : offsets[index + 1]].reshape(
+                self.arrays[node["shapes"]][index]
+            )
+            return part[()] if node["scalar"] else part
+        if kind == "stacked_value":
+            assert index is not None, "A stacked value is only restored through its packed dict."
+            return (
+                float(self.arrays[node["key"]][index])
+                if node["type"] == "float"
+                else int(self.arrays[node["key"]][index])
+            )
+        if kind == "list":
+            items = [self.restore(node=item, index=index) for item in node["items"]]
+            return tuple(items) if node["tuple"] else items
+        if kind == "packed_dict":
+            if node["node"]["kind"] == "object":
+                return _PackedModels(keys=node["keys"], node=node["node"], reader=self)
+            return {key: self.restore(node=node["node"], index=idx) for idx, key in enumerate(node["keys"])}
+        if kind == "rng":
+            rng = np.random.Generator(getattr(np.random, node["state"]["bit_generator"])())
+            rng.bit_generator.state = node["state"]
+            return rng
+        if kind == "object":
+            cls = _import_class(path=node["class"])
+            obj = object.__new__(cls)
+            obj.__dict__.update({name: self.restore(node=item, index=index) for name, item in node["state"].items()})
+            return obj
+        raise ValueError(f"Unknown node kind {kind} in the bundle.")
+
+
+class _PackedModels(Mapping):
+    """A read-only dict of per-feature models that builds every model from the stacked arrays on first access.
+
+    Loading a detector with 100k per-feature models therefore costs nothing per model, and a worker only ever
+    materializes the models of the features it scores.
+    """
+
+    def __init__(self, keys: list[str], node: dict, reader: _BundleReader):
+        self.__positions = {key: idx for idx, key in enumerate(keys)}
+        self.__node = node
+        self.__reader = reader
+        self.__models: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__models:
+            self.__models[key] = self.__reader.restore(node=self.__node, index=self.__positions[key])
+        return self.__models[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__positions)
+
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+
+def _map_npz_members(path: str) -> dict[str, NDArray]:
+    # `np.load` can not memory-map the members of an `.npz`, but `np.savez` stores them uncompressed, so every
+    # member is a plain `.npy` file at a known offset of the bundle that can be mapped directly.
+    arrays: dict[str, NDArray] = {}
+    with zipfile.ZipFile(path) as bundle, open(path, "rb") as file:
+        for info in bundle.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError("Only uncompressed bundles can be memory-mapped.")
+            file.seek(info.header_offset + 26)
+            name_length, extra_length = np.frombuffer(file.read(4), dtype="<u2")
+            file.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+            key = info.filename.removesuffix(".npy")
+            if int(np.prod(shape)) == 0:
+                arrays[key] = np.empty(shape, dtype=dtype)
+            else:
+                # Copy-on-write pages are shared between processes until one of them writes to its model.
+                arrays[key] = np.memmap(
+                    path, dtype=dtype, mode="c", offset=file.tell(), shape=shape, order="F" if fortran_order else "C"
+                ).view(np.ndarray)
+    return arrays
+
+
+def save_detector(path: str, detector: Any) -> None:
+    """Save the whole state of a detector, fitted models included, as an uncompressed `.npz` bundle.
+
+    Replacing a bundle that a loaded detector still memory-maps only works on POSIX systems, Windows refuses to
+    replace or delete a mapped file, so drop the loaded detectors first there.
+
+    Args:
+        :path (str): The file to write, taken as it is without appending `.npz`, and replaced atomically.
+        :detector (AnomalyDetector): The detector to save.
+    """
+    writer = _BundleWriter()
+    node = writer.describe(value=detector)
+    metadata = json.dumps({"format_version": FORMAT_VERSION, "detector": node})
+    # The bundle is swapped in by a rename, so detectors that still map the old file keep seeing the old content
+    # on POSIX systems.
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        np.savez(file, **writer.arrays, **{METADATA_KEY: np.frombuffer(metadata.encode(), dtype=np.uint8)})
+    os.replace(temporary_path, path)
+
+
+def load_detector(path: str, mmap: bool = True) -> Any:
+    """Load a detector saved with `save_detector`.
+
+    Args:
+        :path (str): The bundle to read.
+        :mmap (bool): Whether to memory-map the arrays instead of reading them into memory.
+
+    Returns:
+        :detector (AnomalyDetector): The detector with the state it was saved with.
+    """
+    if mmap:
+        arrays: Mapping[str, NDArray] = _map_npz_members(path=path)
+    else:
+        with np.load(path, allow_pickle=False) as bundle:
+            arrays = {key: bundle[key] for key in bundle.files}
+    metadata = json.loads(bytes(arrays[METADATA_KEY]).decode())
+    if metadata.get("format_version") != FORMAT_VERSION:
+        raise ValueError(
+            f"Bundle format version {metadata.get('format_version')} is not supported, expected {FORMAT_VERSION}."
+        )
+    return _BundleReader(arrays=arrays).restore(node=metadata["detector"])
@@ -0,0 +1,425 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from pandas import DataFrame
+
+QUANTILE_TILE_SIZE = 2**16
+
+
+def _percentile_quantile(quantile: float) -> np.float64:
+    # Pandas hands `q * 100` to `np.percentile`, which divides by 100 again. Repeating the round trip keeps the
+    # interpolation weight bit-identical to `Series.quantile`.
+    return np.true_divide(np.float64(quantile) * 100.0, 100.0)
+
+
+def _lerp(lower: NDArray[np.float64], upper: NDArray[np.float64], gamma: NDArray[np.float64]) -> NDArray[np.float64]:
+    diff = upper - lower
+    return np.where(gamma >= 0.5, upper - diff * (1 - gamma), lower + diff * gamma)
+
+
+class WaveletMatrix:
+    """A wavelet matrix over value ranks that answers many "k-th smallest rank in `ranks[left:right]`" queries at once.
+
+    Building it costs O(m log m) and keeps one prefix count of zero bits per level, every batch of queries then
+    costs O(log m) per query.
+
+    Args:
+        :ranks (np.ndarray): A permutation of `0..m-1`, i.e. the value ranks in arrival order.
+    """
+
+    def __init__(self, ranks: NDArray[np.integer]):
+        self.total_levels = max(int(ranks.shape[0] - 1).bit_length(), 1)
+        self.zeros_before: list[NDArray[np.integer]] = []
+        level_seq = ranks
+        for level in range(self.total_levels - 1, -1, -1):
+            is_one = ((level_seq >> level) & 1).astype(bool)
+            zeros_before = np.empty(level_seq.shape[0] + 1, dtype=level_seq.dtype)
+            zeros_before[0] = 0
+            np.cumsum(~is_one, out=zeros_before[1:])
+            self.zeros_before.append(zeros_before)
+            level_seq = np.concatenate((level_seq[~is_one], level_seq[is_one]))
+
+    def kth_smallest(
+        self, left: NDArray[np.integer], right: NDArray[np.integer], kth: NDArray[np.integer]
+    ) -> NDArray[np.integer]:
+        """Find the rank of the k-th smallest element of every range.
+
+        Args:
+            :left (np.ndarray): The inclusive start of each query range.
+            :right (np.ndarray): The exclusive end of each query range, `left < right <= m`.
+            :kth (np.ndarray): The zero-based order `k` of each query, `0 <= k < right - left`.
+
+        Returns:
+            :kth_ranks (np.ndarray): The rank of the k-th smallest element of every queried range.
+        """
+        k = kth.copy()
+        result = np.zeros_like(kth)
+        for level, zeros_before in zip(range(self.total_levels - 1, -1, -1), self.zeros_before):
+            total_zeros = zeros_before[-1]
+            left_zeros = zeros_before[left]
+            right_zeros = zeros_before[right]
+            zeros_in_range = right_zeros - left_zeros
+            go_right = k >= zeros_in_range
+
+            k = np.where(go_right, k - zeros_in_range, k)
+            left = np.where(go_right, total_zeros + left - left_zeros, left_zeros)
+            right = np.where(go_right, total_zeros + right - right_zeros, right_zeros)
+            result |= go_right.astype(result.dtype) << level
+        return result
+
+
+def _kth_smallest_in_range(
+    ranks: NDArray[np.integer], left: NDArray[np.integer], right: NDArray[np.integer], kth: NDArray[np.integer]
+) -> NDArray[np.integer]:
+    """Answer "k-th smallest rank among `ranks[left:right]`" for many queries at once, see `WaveletMatrix`."""
+    return WaveletMatrix(ranks=ranks).kth_smallest(left=left, right=right, kth=kth)
+
+
+def rank_columns(
+    block: NDArray[np.float64],
+) -> tuple[NDArray[np.integer], NDArray[np.float64], NDArray[np.integer], NDArray[np.int64]]:
+    """Lay the non-NaN values of every column back to back and rank them, so one wavelet matrix serves all columns.
+
+    Returns:
+        :ranks_sorted_offsets_counts (tuple[np.ndarray, ...]): The rank of every value in arrival order, the values
+            in rank order, the position where each column starts and the running count of non-NaN values per row.
+    """
+    is_valid = ~np.isnan(block)
+    counts: NDArray[np.int64] = np.cumsum(is_valid, axis=0, dtype=np.int64)
+    index_dtype = np.int32 if block.size < np.iinfo(np.int32).max else np.int64
+    totals = counts[-1].astype(index_dtype) if block.shape[0] > 0 else np.zeros(block.shape[1], dtype=index_dtype)
+    offsets = np.r_[0, np.cumsum(totals)[:-1]].astype(index_dtype)
+
+    # NaN sorts last, so the first `totals[j]` local ranks of column j belong to its valid values.
+    order = np.argsort(block, axis=0, kind="stable")
+    local_ranks = np.empty(block.shape, dtype=index_dtype)
+    np.put_along_axis(
+        local_ranks, order, np.broadcast_to(np.arange(block.shape[0], dtype=index_dtype)[:, None], block.shape), axis=0
+    )
+    is_sorted_valid = np.arange(block.shape[0])[:, None] < totals[None, :]
+    sorted_data = np.take_along_axis(block, order, axis=0).T[is_sorted_valid.T]
+    ranks = (offsets[:, None] + local_ranks.T)[is_valid.T]
+    return ranks, sorted_data, offsets, counts
+
+
+def _expanding_quantile_block(
+    block: NDArray[np.float64], quantiles: tuple[float, ...], min_period: int
+) -> NDArray[np.float64]:
+    # The columns are laid out back to back, so one wavelet matrix answers the prefixes of every column and every
+    # quantile at once.
+    result = np.full((len(quantiles), *block.shape), np.nan)
+
+    ranks, sorted_data, offsets, counts = rank_columns(block=block)
+    rows, cols = np.nonzero(counts >= max(min_period, 1))
+    if rows.shape[0] == 0:
+        return result
+    index_dtype = ranks.dtype
+
+    prefix_lengths = np.tile(counts[rows, cols].astype(index_dtype), len(quantiles))
+    virtual_idx = (prefix_lengths - 1) * np.repeat(
+        [_percentile_quantile(quantile) for quantile in quantiles], rows.shape[0]
+    )
+    lower_idx = np.floor(virtual_idx).astype(index_dtype)
+    upper_idx = lower_idx + 1
+    above_bounds = virtual_idx >= prefix_lengths - 1
+    lower_idx[above_bounds] = prefix_lengths[above_bounds] - 1
+    upper_idx[above_bounds] = prefix_lengths[above_bounds] - 1
+
+    left = np.tile(offsets[cols], len(quantiles))
+    kth_ranks = _kth_smallest_in_range(
+        ranks=ranks,
+        left=np.concatenate((left, left)),
+        right=np.concatenate((left + prefix_lengths, left + prefix_lengths)),
+        kth=np.concatenate((lower_idx, upper_idx)),
+    )
+    lower = sorted_data[kth_ranks[: prefix_lengths.shape[0]]]
+    upper = sorted_data[kth_ranks[prefix_lengths.shape[0] :]]
+    gamma = virtual_idx - np.where(above_bounds, -1, lower_idx)
+    result[:, rows, cols] = _lerp(lower=lower, upper=upper, gamma=gamma).reshape(len(quantiles), rows.shape[0])
+    return result
+
+
+def _expanding_quantiles(
+    values: NDArray[np.float64], quantiles: tuple[float, ...], min_period: int
+) -> NDArray[np.float64]:
+    block = values[:, None] if values.ndim == 1 else values
+    result = np.empty((len(quantiles), *block.shape))
+    tile_width = max(QUANTILE_TILE_SIZE // max(block.shape[0], 1), 1)
+    for start in range(0, block.shape[1], tile_width):
+        result[:, :, start : start + tile_width] = _expanding_quantile_block(
+            block=block[:, start : start + tile_width], quantiles=quantiles, min_period=min_period
+        )
+    return result.reshape(len(quantiles), *values.shape)
+
+
+def expanding_quantile(values: ArrayLike, quantile: float, min_period: int) -> NDArray[np.float64]:
+    """Calculate the exact expanding quantile of one or many series in O(n log n).
+
+    The result is identical to `Series(values).expanding(min_periods=min_period).apply(lambda x:
+    Series(x).quantile(quantile), raw=True)` for every column: NaN values are skipped and the linear interpolation
+    follows `np.percentile`. Instead of re-sorting every prefix, all prefixes are answered together as order-statistic
+    queries on a wavelet matrix built over the value ranks. Columns are batched into tiles of about
+    `QUANTILE_TILE_SIZE` values, which amortizes the per-call overhead on wide blocks while the working set of a tile
+    stays in the CPU cache.
+
+    Args:
+        :values (ArrayLike): The 1-D data or the 2-D (n_rows x n_features) block in arrival order.
+        :quantile (float): The quantile to compute, between 0. and 1.0.
+        :min_period (int): The minimum number of non-NaN observations needed to produce a value.
+
+    Returns:
+        :expanding_quantiles (np.ndarray): The float64 quantile of every prefix in the shape of `values`, NaN where
+            there is not enough data.
+    """
+    data = np.asarray(values, dtype=np.float64)
+    if data.ndim not in (1, 2):
+        raise ValueError("Parameter `values` must be 1- or 2-dimensional.")
+    return _expanding_quantiles(values=data, quantiles=(quantile,), min_period=min_period)[0]
+
+
+def rolling_quantile(values: ArrayLike, quantile: float, window: int, min_period: int) -> NDArray[np.float64]:
+    """Calculate the exact quantile over a sliding window of the last `window` rows of one or many series.
+
+    Pandas keeps the window in an indexable skiplist, so every step costs O(log window) and the state never holds more
+    than `window` values per column. The first rows stay NaN until `min_period` non-NaN observations have arrived in
+    total, just like with `expanding_quantile`.
+
+    Args:
+        :values (ArrayLike): The 1-D data or the 2-D (n_rows x n_features) block in arrival order.
+        :quantile (float): The quantile to compute, between 0. and 1.0.
+        :window (int): The number of most recent rows the quantile is taken over.
+        :min_period (int): The minimum number of non-NaN observations needed to produce a value.
+
+    Returns:
+        :rolling_quantiles (np.ndarray): The float64 quantile of every window in the shape of `values`, NaN where
+            there is not enough data.
+    """
+    if window < 1:
+        raise ValueError("Parameter `window` must be a positive integer.")
+    data = np.asarray(values, dtype=np.float64)
+    if data.ndim not in (1, 2):
+        raise ValueError("Parameter `values` must be 1- or 2-dimensional.")
+    block = data[:, None] if data.ndim == 1 else data
+    result = DataFrame(block).rolling(window=window, min_periods=1).quantile(quantile).to_numpy()
+    result[np.cumsum(~np.isnan(block), axis=0) < max(min_period, 1)] = np.nan
+    return result.reshape(data.shape)
+
+
+def quartiles(
+    values: ArrayLike, window: int | None, min_period: int
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Calculate the exact first and third quartile over an expanding or sliding window of one or many series.
+
+    The expanding quartiles share one ranking and one wavelet matrix, both are answered in the same batch of
+    order-statistic queries. The sliding quartiles come from `rolling_quantile`, whose skiplist only ever updates by
+    one value per row. Either way every column of the block goes through at once and no window is ever re-sorted.
+
+    Args:
+        :values (ArrayLike): The 1-D data or the 2-D (n_rows x n_features) block in arrival order.
+        :window (int | None): The number of most recent rows the quartiles are taken over, None for all rows so far.
+        :min_period (int): The minimum number of non-NaN observations needed to produce a value.
+
+    Returns:
+        :q1_q3 (tuple[np.ndarray, np.ndarray]): The float64 first and third quartile of every row in the shape of
+            `values`, NaN where there is not enough data.
+    """
+    data = np.asarray(values, dtype=np.float64)
+    if data.ndim not in (1, 2):
+        raise ValueError("Parameter `values` must be 1- or 2-dimensional.")
+    if window is None:
+        q1, q3 = _expanding_quantiles(values=data, quantiles=(0.25, 0.75), min_period=min_period)
+        return q1, q3
+    return (
+        rolling_quantile(values=data, quantile=0.25, window=window, min_period=min_period),
+        rolling_quantile(values=data, quantile=0.75, window=window, min_period=min_period),
+    )
+
+
+class TDigest:
+    """A merging t-digest, i.e. a fixed-size sketch of a distribution that keeps the tails accurate.
+
+    Centroids are merged with the `k1` scale function `k(q) = compression / (2 * pi) * asin(2q - 1)`, so a centroid
+    near the median may hold many points while centroids near q = 0. or q = 1.0 stay small. The sketch never keeps
+    more than `compression / 2 + 2` centroids, independent of how many values were added.
+
+    Args:
+        :compression (float): The accuracy/memory trade-off, higher values keep more centroids.
+    """
+
+    def __init__(self, compression: float = 1000.0):
+        if compression <= 0.0:
+            raise ValueError("Parameter `compression` must be a positive number.")
+        self.compression = compression
+        self.__means = np.empty(0, dtype=np.float64)
+        self.__weights = np.empty(0, dtype=np.float64)
+        self.__min = np.inf
+        self.__max = -np.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.__weights.sum())
+
+    @property
+    def nbytes(self) -> int:
+        return self.__means.nbytes + self.__weights.nbytes
+
+    def __k_scale(self, q: NDArray[np.float64]) -> NDArray[np.float64]:
+        return self.compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0.0, 1.0) - 1)
+
+    def update(self, values: ArrayLike) -> None:
+        data = np.asarray(values, dtype=np.float64).ravel()
+        data = data[~np.isnan(data)]
+        if data.shape[0] == 0:
+            return
+        self.__min = min(self.__min, float(data.min()))
+        self.__max = max(self.__max, float(data.max()))
+
+        means = np.concatenate((self.__means, data))
+        weights = np.concatenate((self.__weights, np.ones(data.shape[0])))
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+
+        cumulative = np.cumsum(weights)
+        k_bins = np.floor(self.__k_scale((cumulative - weights / 2) / cumulative[-1]))
+        starts = np.flatnonzero(np.r_[True, k_bins[1:] != k_bins[:-1]])
+        self.__weights = np.add.reduceat(weights, starts)
+        self.__means = np.add.reduceat(means * weights, starts) / self.__weights
+
+    def __interpolation_points(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        centers = np.cumsum(self.__weights) - self.__weights / 2
+        return np.r_[0.0, centers, self.count], np.r_[self.__min, self.__means, self.__max]
+
+    def quantile(self, q: float) -> float:
+        if self.__weights.shape[0] == 0:
+            return np.nan
+        ranks, values = self.__interpolation_points()
+        return float(np.interp(q * self.count, ranks, values))
+
+    def rank_error(self, q: float) -> float:
+        """The worst-case rank error of `quantile(q)` as a fraction of all added values.
+
+        The estimate is interpolated between the two centroids that bracket the target rank, so its true rank can be
+        off by at most the weight of those two centroids.
+        """
+        if self.__weights.shape[0] == 0:
+            return np.nan
+        ranks, _ = self.__interpolation_points()
+        weights = np.r_[0.0, self.__weights, 0.0]
+        right = int(np.clip(np.searchsorted(ranks, q * self.count, side="right"), 1, ranks.shape[0] - 1))
+        return float((weights[right - 1] + weights[right]) / self.count)
+
+
+class StreamingQuantile:
+    """The resumable state behind `streaming_quantile`, which is fed one chunk of a series at a time.
+
+    Besides the `TDigest` it only keeps fewer than `block_size` values that are not absorbed yet, so a series of any
+    length runs in bounded memory. Feeding a long series in chunks gives the same estimates as feeding it at once, as
+    long as the chunks do not split the first `min_period` values into pieces of `block_size` or more.
+
+    Args:
+        :quantile (float): The quantile to estimate, between 0. and 1.0.
+        :min_period (int): The minimum number of non-NaN observations needed to produce a value.
+        :compression (float): The accuracy/memory trade-off of the `TDigest`.
+        :block_size (int): The number of values absorbed per digest merge.
+    """
+
+    def __init__(self, quantile: float, min_period: int, compression: float = 1000.0, block_size: int = 1024):
+        if block_size < 1:
+            raise ValueError("Parameter `block_size` must be a positive integer.")
+        self.quantile = quantile
+        self.block_size = block_size
+        self.first_boundary = max(min_period, 1)
+        self.total_valid = 0
+        self.__digest = TDigest(compression=compression)
+        self.__pending = np.empty(0)
+        self.__boundary = 0
+        self.__estimate = np.nan
+        self.__boundary_rank_error = np.nan
+
+    def __next_boundary(self) -> int:
+        if self.__boundary == 0:
+            return self.first_boundary
+        return self.__boundary + self.block_size
+
+    def update(self, values: ArrayLike, is_last: bool = False) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Estimate the expanding quantile for the next chunk of the series.
+
+        Args:
+            :values (ArrayLike): The next 1-D chunk in arrival order.
+            :is_last (bool): Whether this chunk ends the series, which publishes the values of the last partial block.
+
+        Returns:
+            :quantiles_and_rank_errors (tuple[np.ndarray, np.ndarray]): The same as `streaming_quantile` for the rows
+                of this chunk.
+        """
+        data = np.asarray(values, dtype=np.float64)
+        if data.ndim != 1:
+            raise ValueError("Parameter `values` must be 1-dimensional.")
+        valid_data = data[~np.isnan(data)]
+        start_valid = self.total_valid
+        end_valid = start_valid + valid_data.shape[0]
+
+        boundaries = np.arange(self.__next_boundary(), end_valid + 1, self.block_size)
+        last_boundary = int(boundaries[-1]) if boundaries.shape[0] > 0 else self.__boundary
+        if is_last and end_valid >= self.first_boundary and last_boundary < end_valid:
+            boundaries = np.r_[boundaries, end_valid]
+        boundary_counts = np.r_[self.__boundary, boundaries]
+        boundary_estimates = np.r_[self.__estimate, np.empty(boundaries.shape[0])]
+        boundary_rank_errors = np.r_[self.__boundary_rank_error, np.empty(boundaries.shape[0])]
+        for idx in range(1, boundary_counts.shape[0]):
+            self.__digest.update(
+                np.concatenate(
+                    (
+                        self.__pending,
+                        valid_data[
+                            max(boundary_counts[idx - 1] - start_valid, 0) : boundary_counts[idx] - start_valid
+                        ],
+                    )
+                )
+            )
+            self.__pending = np.empty(0)
+            boundary_estimates[idx] = self.__digest.quantile(self.quantile)
+            boundary_rank_errors[idx] = self.__digest.rank_error(self.quantile) * boundary_counts[idx]
+        self.__pending = np.concatenate((self.__pending, valid_data[max(boundary_counts[-1] - start_valid, 0) :]))
+        self.__boundary = int(boundary_counts[-1])
+        self.__estimate = boundary_estimates[-1]
+        self.__boundary_rank_error = boundary_rank_errors[-1]
+        self.total_valid = end_valid
+        if self.__boundary == 0 and self.__pending.shape[0] >= self.block_size:
+            # Nothing is published before the first boundary, so the digest may absorb these values early.
+            self.__digest.update(self.__pending)
+            self.__pending = np.empty(0)
+
+        estimates = np.full(data.shape[0], np.nan)
+        rank_errors = np.full(data.shape[0], np.nan)
+        counts = start_valid + np.cumsum(~np.isnan(data))
+        rows = np.flatnonzero(counts >= self.first_boundary)
+        boundary_idx = np.searchsorted(boundary_counts, counts[rows], side="right") - 1
+        estimates[rows] = boundary_estimates[boundary_idx]
+        pending = counts[rows] - boundary_counts[boundary_idx]
+        rank_errors[rows] = (boundary_rank_errors[boundary_idx] + pending) / counts[rows]
+        return estimates, rank_errors
+
+
+def streaming_quantile(
+    values: ArrayLike, quantile: float, min_period: int, compression: float = 1000.0, block_size: int = 1024
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Approximate the expanding quantile of a series with a constant-memory `TDigest`.
+
+    The digest absorbs the first `min_period` non-NaN values and then `block_size` values at a time. Every row
+    reports the estimate of the last absorbed block, so a row never sees data that arrived after it.
+
+    Args:
+        :values (ArrayLike): The 1-D data in arrival order.
+        :quantile (float): The quantile to estimate, between 0. and 1.0.
+        :min_period (int): The minimum number of non-NaN observations needed to produce a value.
+        :compression (float): The accuracy/memory trade-off of the `TDigest`.
+        :block_size (int): The number of values absorbed per digest merge.
+
+    Returns:
+        :quantiles_and_rank_errors (tuple[np.ndarray, np.ndarray]): The estimated quantile of every prefix and its
+            worst-case rank error, which includes the values that are not absorbed yet. Both are NaN where there is
+            not enough data.
+    """
+    return StreamingQuantile(
+        quantile=quantile, min_period=min_period, compression=compression, block_size=block_size
+    ).update(values=values, is_last=True)
@@ -0,0 +1,107 @@
+from collections.abc import Hashable
+
+import numpy as np
+from numpy.typing import NDArray
+from pandas import DataFrame, Index
+
+
+class POTResult:
+    """The thresholds and data over threshold of a POT computation, kept as contiguous arrays.
+
+    Every array has one column per feature in the order of `features`, the row order follows `index`. The
+    `pot_th_<feature>`/`pot_data_<feature>` DataFrame is only built when `to_dataframe` is called.
+
+    Args:
+        :features (list[str]): The feature names, i.e. the column labels of the arrays.
+        :index (pd.Index): The row index of the dataset the result belongs to.
+        :pot_th (np.ndarray): The (n_rows x n_features) POT thresholds.
+        :pot_data (np.ndarray): The (n_rows x n_features) data over the thresholds.
+        :rank_error (np.ndarray): The worst-case rank error of each feature's thresholds.
+    """
+
+    def __init__(
+        self,
+        features: list[str],
+        index: Index,
+        pot_th: NDArray[np.float64],
+        pot_data: NDArray[np.float64],
+        rank_error: NDArray[np.float64],
+    ):
+        if pot_th.shape != (len(index), len(features)) or pot_data.shape != pot_th.shape:
+            raise ValueError("Arrays `pot_th` and `pot_data` must have the shape (n_rows, n_features).")
+        self.features: list[str] = list(features)
+        self.feature_index: dict[str, int] = {feature: idx for idx, feature in enumerate(self.features)}
+        self.index: Index = index
+        self.pot_th: NDArray[np.float64] = np.ascontiguousarray(pot_th)
+        self.pot_data: NDArray[np.float64] = np.ascontiguousarray(pot_data)
+        self.rank_error: NDArray[np.float64] = np.asarray(rank_error, dtype=np.float64)
+        self.__df: DataFrame | None = None
+
+    @property
+    def nbytes(self) -> int:
+        return self.pot_th.nbytes + self.pot_data.nbytes + self.rank_error.nbytes
+
+    def get_pot_th(self, feature: str) -> NDArray[np.float64]:
+        return self.pot_th[:, self.feature_index[feature]]
+
+    def get_pot_data(self, feature: str) -> NDArray[np.float64]:
+        return self.pot_data[:, self.feature_index[feature]]
+
+    def to_dataframe(self) -> DataFrame:
+        if self.__df is None:
+            self.__df = DataFrame(
+                data=np.concatenate((self.pot_th, self.pot_data), axis=1),
+                index=self.index,
+                columns=[f"pot_th_{feature}" for feature in self.features]
+                + [f"pot_data_{feature}" for feature in self.features],
+            )
+        return self.__df
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+class BatchResult:
+    """The per-series anomaly scores of a batch run over many independent series.
+
+    Args:
+        :series_ids (list[Hashable]): The id of every series.
+        :timestamps (list[np.ndarray]): The timestamps (or row positions) of the scored rows of every series.
+        :anomaly_scores (list[np.ndarray]): The anomaly scores of every series.
+        :total_seconds (float): The wall time of the batch run.
+    """
+
+    def __init__(
+        self,
+        series_ids: list[Hashable],
+        timestamps: list[NDArray],
+        anomaly_scores: list[NDArray[np.float64]],
+        total_seconds: float,
+    ):
+        if not len(series_ids) == len(timestamps) == len(anomaly_scores):
+            raise ValueError("Every series needs one id, one array of timestamps and one array of anomaly scores.")
+        self.series_ids: list[Hashable] = list(series_ids)
+        self.series_index: dict[Hashable, int] = {series_id: idx for idx, series_id in enumerate(self.series_ids)}
+        self.timestamps: list[NDArray] = timestamps
+        self.anomaly_scores: list[NDArray[np.float64]] = anomaly_scores
+        self.total_seconds = total_seconds
+
+    @property
+    def series_per_second(self) -> float:
+        return len(self.series_ids) / self.total_seconds if self.total_seconds > 0 else float("inf")
+
+    def get_anomaly_score(self, series_id: Hashable) -> NDArray[np.float64]:
+        return self.anomaly_scores[self.series_index[series_id]]
+
+    def to_dataframe(self) -> DataFrame:
+        lengths = [anomaly_score.shape[0] for anomaly_score in self.anomaly_scores]
+        return DataFrame(
+            data={
+                "series_id": np.repeat(np.array(self.series_ids, dtype=object), lengths),
+                "ts": np.concatenate(self.timestamps) if self.timestamps else np.empty(0),
+                "anomaly_score": np.concatenate(self.anomaly_scores) if self.anomaly_scores else np.empty(0),
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.series_ids)
@@ -0,0 +1,173 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from src.anomaly_detection.utils.gpd import fit_gpd
+
+
+def _mean_of_last(sequence: NDArray[np.float64], ends: NDArray[np.int64], depth: int) -> NDArray[np.float64]:
+    # The mean of the (up to) `depth` elements of `sequence` right before every position in `ends`.
+    cumulative: NDArray[np.float64] = np.concatenate((np.asarray([0.0]), np.cumsum(sequence)))
+    starts = np.maximum(ends - depth, 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (cumulative[ends] - cumulative[starts]) / (ends - starts)
+
+
+class StreamingPOT:
+    """The streaming peak-over-threshold detector SPOT, or DSPOT when `drift_depth` is set, for many features.
+
+    `initialize` calibrates the initial threshold `t`, the GPD of the peaks over it and the alarm threshold `z` on a
+    calibration block. Each `update` flags the values above `z`, stores the new peaks over `t` and only refits the GPD
+    once the number of peaks has grown by `refit_growth`, so the refit cost stays amortized O(1) per value. Within
+    one batch every value is judged against the `z` of the batch start.
+
+    Args:
+        :features (list[str]): The feature names, one per column of the calibration block and of every batch.
+        :quantile (float): The quantile of the calibration data that becomes the initial threshold `t`.
+        :risk (float): The probability `q` of a false alarm, `z` is the `1 - q` quantile of the fitted tail.
+        :drift_depth (int | None): The number of normal values in the DSPOT moving average, None for plain SPOT.
+        :refit_growth (float): The relative growth of the peaks since the last fit that triggers a refit.
+    """
+
+    def __init__(
+        self,
+        features: list[str],
+        quantile: float = 0.97,
+        risk: float = 1e-4,
+        drift_depth: int | None = None,
+        refit_growth: float = 0.1,
+    ):
+        if not 0.0 < risk < 1.0:
+            raise ValueError("Parameter `risk` can only be between 0. and 1.0")
+        if drift_depth is not None and drift_depth < 1:
+            raise ValueError("Parameter `drift_depth` must be a positive integer.")
+        self.features: list[str] = list(features)
+        self.quantile = quantile
+        self.risk = risk
+        self.drift_depth = drift_depth
+        self.refit_growth = refit_growth
+        self.total_observations = np.zeros(len(self.features), dtype=np.int64)
+        self.init_th = np.full(len(self.features), np.nan)
+        self.anomaly_th = np.full(len(self.features), np.nan)
+        self.gpd_shape = np.full(len(self.features), np.nan)
+        self.gpd_scale = np.full(len(self.features), np.nan)
+        self.__peaks = np.zeros((16, len(self.features)))
+        self.__total_peaks = np.zeros(len(self.features), dtype=np.int64)
+        self.__total_fitted_peaks = np.zeros(len(self.features), dtype=np.int64)
+        self.__drift_history: list[NDArray[np.float64]] = [np.empty(0) for _ in self.features]
+
+    @property
+    def is_initialized(self) -> bool:
+        return bool(self.total_observations.any())
+
+    @property
+    def total_peaks(self) -> NDArray[np.int64]:
+        return self.__total_peaks.copy()
+
+    def __to_block(self, values: ArrayLike) -> NDArray[np.float64]:
+        block = np.asarray(values, dtype=np.float64)
+        if block.ndim != 2 or block.shape[1] != len(self.features):
+            raise ValueError("Parameter `values` must be a 2-D block with one column per feature.")
+        return block
+
+    def __add_peaks(self, peaks: NDArray[np.float64]) -> None:
+        feature_idx, row_idx = np.nonzero((peaks > 0).T)
+        new_counts = np.bincount(feature_idx, minlength=len(self.features))
+        required_rows = int((self.__total_peaks + new_counts).max(initial=0))
+        if required_rows > self.__peaks.shape[0]:
+            grown = np.zeros((max(required_rows, 2 * self.__peaks.shape[0]), len(self.features)))
+            grown[: self.__peaks.shape[0]] = self.__peaks
+            self.__peaks = grown
+        slot_idx = self.__total_peaks[feature_idx] + (
+            np.arange(feature_idx.shape[0]) - np.repeat(np.cumsum(new_counts) - new_counts, new_counts)
+        )
+        self.__peaks[slot_idx, feature_idx] = peaks[row_idx, feature_idx]
+        self.__total_peaks += new_counts
+
+    def __refit(self, force: bool = False) -> None:
+        stale = self.__total_peaks > 0
+        if not force:
+            stale &= self.__total_peaks >= np.ceil(self.__total_fitted_peaks * (1 + self.refit_growth))
+        features_idx = np.flatnonzero(stale)
+        if features_idx.shape[0] > 0:
+            max_peaks = int(self.__total_peaks[features_idx].max())
+            self.gpd_shape[features_idx], self.gpd_scale[features_idx] = fit_gpd(
+                exceedances=self.__peaks[:max_peaks, features_idx]
+            )
+            self.__total_fitted_peaks[features_idx] = self.__total_peaks[features_idx]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = self.risk * self.total_observations / self.__total_peaks
+            tail_th = np.where(
+                self.gpd_shape == 0,
+                -self.gpd_scale * np.log(ratio),
+                self.gpd_scale / self.gpd_shape * (ratio ** (-self.gpd_shape) - 1),
+            )
+        self.anomaly_th = self.init_th + np.where(self.__total_peaks > 0, tail_th, 0.0)
+
+    def __drift_ends(self, is_normal: NDArray[np.bool_], idx: int) -> NDArray[np.int64]:
+        # Every value is compared with the moving average of the normal values that came before it.
+        return self.__drift_history[idx].shape[0] + np.cumsum(is_normal[:, idx]) - is_normal[:, idx]
+
+    def __residuals(self, block: NDArray[np.float64], is_normal: NDArray[np.bool_]) -> NDArray[np.float64]:
+        if self.drift_depth is None:
+            return block
+        residuals = np.empty(block.shape)
+        for idx in range(block.shape[1]):
+            sequence = np.concatenate((self.__drift_history[idx], block[:, idx][is_normal[:, idx]]))
+            ends = self.__drift_ends(is_normal=is_normal, idx=idx)
+            residuals[:, idx] = block[:, idx] - _mean_of_last(sequence=sequence, ends=ends, depth=self.drift_depth)
+        return residuals
+
+    def __update_drift_history(self, block: NDArray[np.float64], is_normal: NDArray[np.bool_]) -> None:
+        if self.drift_depth is None:
+            return
+        for idx in range(block.shape[1]):
+            history = np.concatenate((self.__drift_history[idx], block[:, idx][is_normal[:, idx]]))
+            self.__drift_history[idx] = history[-self.drift_depth :]
+
+    def initialize(self, values: ArrayLike) -> None:
+        block = self.__to_block(values=values)
+        is_normal = ~np.isnan(block)
+        residuals = self.__residuals(block=block, is_normal=is_normal)
+        if self.drift_depth is not None:
+            # Values without a complete moving average yet are left out of the calibration, like in DSPOT.
+            for idx in range(block.shape[1]):
+                residuals[self.__drift_ends(is_normal=is_normal, idx=idx) < self.drift_depth, idx] = np.nan
+        self.__update_drift_history(block=block, is_normal=is_normal)
+
+        is_calibration = ~np.isnan(residuals)
+        if not is_calibration.any(axis=0).all():
+            raise ValueError("Every feature needs at least one value in the calibration data.")
+        self.init_th = np.nanquantile(residuals, self.quantile, axis=0)
+        self.total_observations = is_calibration.sum(axis=0)
+        self.__add_peaks(peaks=np.nan_to_num(residuals - self.init_th, nan=0.0))
+        self.__refit(force=True)
+
+    def update(self, values: ArrayLike) -> NDArray[np.bool_]:
+        """Flag the anomalies of a new batch and learn from its normal values.
+
+        Args:
+            :values (ArrayLike): The 2-D (n_rows x n_features) batch in arrival order.
+
+        Returns:
+            :is_anomaly (np.ndarray): True for every value that lies above the anomaly threshold.
+        """
+        if not self.is_initialized:
+            raise ValueError("The streaming detector must be initialized with calibration data first.")
+        block = self.__to_block(values=values)
+        is_valid = ~np.isnan(block)
+
+        # Judge once assuming the whole batch is normal, then again without the values flagged by the first pass.
+        is_anomaly = is_valid & (self.__residuals(block=block, is_normal=is_valid) > self.anomaly_th)
+        if self.drift_depth is not None:
+            residuals = self.__residuals(block=block, is_normal=is_valid & ~is_anomaly)
+            is_anomaly = is_valid & (residuals > self.anomaly_th)
+        else:
+            residuals = block
+        is_normal = is_valid & ~is_anomaly
+
+        self.__update_drift_history(block=block, is_normal=is_normal)
+        self.total_observations += is_normal.sum(axis=0)
+        self.__add_peaks(peaks=np.where(is_normal, residuals - self.init_th, 0.0))
+        self.__refit()
+        return is_anomaly
@@ -1,19 +1,25 @@
-from anomaly_detection.models.detectors.autoencoder import AutoencoderAnomalyDetector
-from anomaly_detection.models.detectors.block_maxima import BlockMaximaAnomalyDetector
-from anomaly_detection.models.detectors.dbscan import DBSCANAnomalyDetector
-from anomaly_detection.models.detectors.isolation_forest import IsoForestAnomalyDetector
-from anomaly_detection.models.detectors.mad import MADAnomalyDetector
-from anomaly_detection.models.detectors.one_class_svm import OneClassSVMAnomalyDetector
-from anomaly_detection.models.detectors.pot import POTAnomalyDetector
-from anomaly_detection.models.detectors.zscore import ZScoreAnomalyDetector
+from typing import TYPE_CHECKING, Union
 
-AnomalyDetector = (
-    AutoencoderAnomalyDetector
-    | BlockMaximaAnomalyDetector
-    | DBSCANAnomalyDetector
-    | IsoForestAnomalyDetector
-    | MADAnomalyDetector
-    | OneClassSVMAnomalyDetector
-    | POTAnomalyDetector
-    | ZScoreAnomalyDetector
-)
+if TYPE_CHECKING:
+    from src.anomaly_detection.models.detectors.autoencoder import AutoencoderAnomalyDetector
+    from src.anomaly_detection.models.detectors.block_maxima import BlockMaximaAnomalyDetector
+    from src.anomaly_detection.models.detectors.box_plot import BoxPlotAnomalyDetector
+    from src.anomaly_detection.models.detectors.dbscan import DBSCANAnomalyDetector
+    from src.anomaly_detection.models.detectors.isolation_forest import IsoForestAnomalyDetector
+    from src.anomaly_detection.models.detectors.mad import MADAnomalyDetector
+    from src.anomaly_detection.models.detectors.one_class_svm import OneClassSVMAnomalyDetector
+    from src.anomaly_detection.models.detectors.pot import POTAnomalyDetector
+    from src.anomaly_detection.models.detectors.zscore import ZScoreAnomalyDetector
+
+# The detectors are only named here, importing them would load every detector module with pandas and scipy.
+AnomalyDetector = Union[
+    "AutoencoderAnomalyDetector",
+    "BlockMaximaAnomalyDetector",
+    "BoxPlotAnomalyDetector",
+    "DBSCANAnomalyDetector",
+    "IsoForestAnomalyDetector",
+    "MADAnomalyDetector",
+    "OneClassSVMAnomalyDetector",
+    "POTAnomalyDetector",
+    "ZScoreAnomalyDetector",
+]
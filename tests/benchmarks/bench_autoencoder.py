@@ -0,0 +1,43 @@
+"""Benchmark the training time and the float32 scoring throughput of the NumPy autoencoder in windows per second.
+
+Run with `python -m tests.benchmarks.bench_autoencoder [total_windows] [window]` from the repository root.
+"""
+import sys
+from time import perf_counter
+
+from numpy import arange, sin
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.random import default_rng
+
+from src.anomaly_detection.utils.network import DenseAutoencoder
+
+
+def bench_autoencoder(total_windows: int = 1_000_000, window: int = 16) -> dict[str, float]:
+    rng = default_rng(seed=42)
+    total_rows = total_windows + window - 1
+    series = sin(arange(total_rows) / 10) + 0.1 * rng.normal(size=total_rows)
+    windows = sliding_window_view(series, window_shape=window)
+    autoencoder = DenseAutoencoder(
+        layer_sizes=[window, window // 2, 4, window // 2, window], learning_rate=1e-2, seed=42
+    )
+
+    total_training_windows = min(total_windows, 100_000)
+    start = perf_counter()
+    autoencoder.fit(inputs=windows[:total_training_windows], total_epochs=5)
+    training_seconds = perf_counter() - start
+
+    start = perf_counter()
+    autoencoder.reconstruction_error(inputs=windows)
+    scoring_seconds = perf_counter() - start
+
+    return {
+        "total_windows": total_windows,
+        "window": window,
+        "training_windows_per_second": 5 * total_training_windows / training_seconds,
+        "scoring_seconds": scoring_seconds,
+        "scoring_windows_per_second": total_windows / scoring_seconds,
+    }
+
+
+if __name__ == "__main__":
+    print(bench_autoencoder(*[int(arg) for arg in sys.argv[1:3]]))
@@ -0,0 +1,42 @@
+"""Benchmark the batch POT anomaly score of many short series against a per-series detector loop.
+
+Run with `python -m tests.benchmarks.bench_batch [total_series] [min_rows] [max_rows]` from the repository root.
+"""
+import sys
+from time import perf_counter
+
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+
+
+def gen_series(total_series: int, min_rows: int, max_rows: int, seed: int = 42):
+    rng = default_rng(seed=seed)
+    return [rng.normal(size=rng.integers(min_rows, max_rows + 1)) for _ in range(total_series)]
+
+
+def bench_batch(total_series: int = 50_000, min_rows: int = 200, max_rows: int = 300) -> dict[str, float]:
+    series = gen_series(total_series=total_series, min_rows=min_rows, max_rows=max_rows)
+
+    batch_result = get_detector("pot").compute_anomaly_score_batch(series=series)  # type: ignore
+
+    total_loop_series = min(total_series, 1_000)
+    start = perf_counter()
+    for values in series[:total_loop_series]:
+        detector = get_detector("pot")
+        detector.set_timeframe(total_rows=values.shape[0])  # type: ignore
+        detector.compute_anomaly_score(DataFrame({"value": values}))
+    loop_series_per_second = total_loop_series / (perf_counter() - start)
+
+    return {
+        "total_series": total_series,
+        "batch_seconds": batch_result.total_seconds,
+        "batch_series_per_second": batch_result.series_per_second,
+        "loop_series_per_second": loop_series_per_second,
+        "speed_up": batch_result.series_per_second / loop_series_per_second,
+    }
+
+
+if __name__ == "__main__":
+    print(bench_batch(*[int(arg) for arg in sys.argv[1:4]]))
@@ -0,0 +1,59 @@
+"""Benchmark the vectorized Grimshaw GPD fit against a per-feature `scipy.stats.genpareto.fit` loop.
+
+Run with `python -m tests.benchmarks.bench_gpd [total_features] [total_rows]` from the repository root.
+"""
+import sys
+from time import perf_counter
+
+from numpy import zeros
+from numpy.random import default_rng
+from scipy.stats import genpareto
+
+from src.anomaly_detection.utils.gpd import fit_gpd
+
+
+def gen_exceedances(total_features: int, total_rows: int, seed: int = 42):
+    rng = default_rng(seed=seed)
+    exceedances = zeros((total_rows, total_features))
+    total_exceedances = max(int(0.03 * total_rows), 2)
+    for idx in range(total_features):
+        rows = rng.choice(total_rows, size=total_exceedances, replace=False)
+        exceedances[rows, idx] = genpareto.rvs(
+            rng.uniform(-0.4, 0.6), scale=rng.uniform(0.5, 5.0), size=total_exceedances, random_state=rng
+        )
+    return exceedances
+
+
+def bench_gpd(total_features: int = 200, total_rows: int = 10_000) -> dict[str, float]:
+    exceedances = gen_exceedances(total_features=total_features, total_rows=total_rows)
+
+    start = perf_counter()
+    shape, scale = fit_gpd(exceedances=exceedances)
+    vectorized_seconds = perf_counter() - start
+
+    start = perf_counter()
+    scipy_fits = []
+    for idx in range(total_features):
+        scipy_shape, _, scipy_scale = genpareto.fit(exceedances[:, idx][exceedances[:, idx] > 0], floc=0)
+        scipy_fits.append((scipy_shape, scipy_scale))
+    scipy_seconds = perf_counter() - start
+
+    total_less_likely = 0
+    for idx, (scipy_shape, scipy_scale) in enumerate(scipy_fits):
+        y = exceedances[:, idx][exceedances[:, idx] > 0]
+        scipy_log_likelihood = genpareto.logpdf(y, scipy_shape, 0, scipy_scale).sum()
+        log_likelihood = genpareto.logpdf(y, shape[idx], 0, scale[idx]).sum()
+        total_less_likely += int(log_likelihood < scipy_log_likelihood - 1e-6 * abs(scipy_log_likelihood))
+
+    return {
+        "total_features": total_features,
+        "total_rows": total_rows,
+        "vectorized_seconds": vectorized_seconds,
+        "scipy_seconds": scipy_seconds,
+        "speed_up": scipy_seconds / vectorized_seconds,
+        "total_less_likely_than_scipy": total_less_likely,
+    }
+
+
+if __name__ == "__main__":
+    print(bench_gpd(*[int(arg) for arg in sys.argv[1:3]]))
@@ -0,0 +1,51 @@
+"""Benchmark the cold import of `detecto` in a fresh interpreter and fail when it goes over the import-time budget.
+
+Run with `python -m tests.benchmarks.bench_import [total_runs]` from the repository root.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import TypedDict
+
+IMPORT_BUDGET_SECONDS = 0.25
+# None of these may be loaded by `import detecto`, only by requesting a detector or reading a dataset.
+LAZY_MODULES = ("pandas", "scipy", "src.anomaly_detection.models.detectors.interface")
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+IMPORT_SCRIPT = f"""
+import json, sys
+from time import perf_counter
+start = perf_counter()
+import src.anomaly_detection.detecto
+seconds = perf_counter() - start
+print(json.dumps({{"seconds": seconds, "lazy_modules": [name for name in {LAZY_MODULES!r} if name in sys.modules]}}))
+"""
+
+
+class ImportResult(TypedDict):
+    import_seconds: float
+    budget_seconds: float
+    lazy_modules_loaded: list[str]
+
+
+def bench_import(total_runs: int = 5) -> ImportResult:
+    runs = [
+        json.loads(
+            subprocess.run(
+                [sys.executable, "-c", IMPORT_SCRIPT], cwd=REPOSITORY_ROOT, capture_output=True, check=True, text=True
+            ).stdout
+        )
+        for _ in range(total_runs)
+    ]
+    return {
+        "import_seconds": min(run["seconds"] for run in runs),
+        "budget_seconds": IMPORT_BUDGET_SECONDS,
+        "lazy_modules_loaded": sorted({name for run in runs for name in run["lazy_modules"]}),
+    }
+
+
+if __name__ == "__main__":
+    result = bench_import(*[int(arg) for arg in sys.argv[1:2]])
+    print(result)
+    if result["import_seconds"] > IMPORT_BUDGET_SECONDS or result["lazy_modules_loaded"]:
+        sys.exit("`import detecto` is over the import-time budget or loads modules that should stay lazy")
@@ -0,0 +1,41 @@
+"""Benchmark growing and scoring the array-backed isolation forest on one feature and on several features.
+
+Run with `python -m tests.benchmarks.bench_isolation [total_rows] [total_features]` from the repository root.
+"""
+import sys
+from time import perf_counter
+
+from numpy.random import default_rng
+
+from src.anomaly_detection.utils.isolation import IsolationForest
+
+
+def bench_isolation(total_rows: int = 10_000_000, total_features: int = 4) -> dict[str, float]:
+    rng = default_rng(seed=42)
+    univariate = rng.normal(size=(total_rows, 1))
+
+    start = perf_counter()
+    forest = IsolationForest(seed=42).fit(values=univariate)
+    univariate_fit_seconds = perf_counter() - start
+    start = perf_counter()
+    forest.score(values=univariate)
+    univariate_score_seconds = perf_counter() - start
+
+    total_multivariate_rows = min(total_rows, 1_000_000)
+    multivariate = rng.normal(size=(total_multivariate_rows, total_features))
+    forest = IsolationForest(seed=42).fit(values=multivariate, n_jobs=-1)
+    start = perf_counter()
+    forest.score(values=multivariate, n_jobs=-1)
+    multivariate_score_seconds = perf_counter() - start
+
+    return {
+        "total_rows": total_rows,
+        "univariate_fit_seconds": univariate_fit_seconds,
+        "univariate_score_seconds": univariate_score_seconds,
+        "univariate_rows_per_second": total_rows / univariate_score_seconds,
+        "multivariate_rows_per_second": total_multivariate_rows / multivariate_score_seconds,
+    }
+
+
+if __name__ == "__main__":
+    print(bench_isolation(*[int(arg) for arg in sys.argv[1:3]]))
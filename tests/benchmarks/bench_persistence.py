@@ -0,0 +1,51 @@
+"""Benchmark saving and memory-mapped loading of detectors with many fitted per-feature models.
+
+Run with `python -m tests.benchmarks.bench_persistence [total_models]` from the repository root.
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from numpy.random import default_rng
+
+from src.anomaly_detection.models.detectors.block_maxima import BlockMaximaAnomalyDetector
+from src.anomaly_detection.models.detectors.isolation_forest import IsoForestAnomalyDetector
+from src.anomaly_detection.utils.isolation import IsolationForest
+
+
+def bench_persistence(total_models: int = 100_000) -> dict[str, float]:
+    rng = default_rng(seed=42)
+    block_maxima_detector = BlockMaximaAnomalyDetector()
+    block_maxima_detector.gev_shape = rng.normal(scale=0.1, size=total_models)
+    block_maxima_detector.gev_location = rng.normal(size=total_models)
+    block_maxima_detector.gev_scale = rng.exponential(size=total_models)
+    # Every feature gets its own forest object, grown on a small sample to keep the set-up short.
+    forest = IsolationForest(total_trees=10, sample_size=16, seed=42).fit(values=rng.normal(size=(16, 1)))
+    iso_forest_detector = IsoForestAnomalyDetector()
+    iso_forest_detector.forests = {f"feature_{idx}": forest for idx in range(total_models)}
+
+    result: dict[str, float] = {"total_models": total_models}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, detector in (("block_maxima", block_maxima_detector), ("iso_forest", iso_forest_detector)):
+            path = os.path.join(directory, f"{name}.npz")
+            start = perf_counter()
+            detector.save(path=path)
+            result[f"{name}_save_seconds"] = perf_counter() - start
+            result[f"{name}_megabytes"] = os.path.getsize(path) / 2**20
+
+            start = perf_counter()
+            loaded_detector = type(detector).load(path=path)
+            result[f"{name}_load_seconds"] = perf_counter() - start
+        # The forests are built on first access, so a worker only pays for the features it scores.
+        loaded_iso_forest_detector = IsoForestAnomalyDetector.load(path=os.path.join(directory, "iso_forest.npz"))
+        start = perf_counter()
+        loaded_iso_forest_detector.forests[f"feature_{total_models - 1}"].score(values=rng.normal(size=(1000, 1)))
+        result["iso_forest_first_model_seconds"] = perf_counter() - start
+        # Windows can not delete the directory while the bundles are still memory-mapped.
+        del loaded_detector, loaded_iso_forest_detector
+    return result
+
+
+if __name__ == "__main__":
+    print(bench_persistence(*[int(arg) for arg in sys.argv[1:2]]))
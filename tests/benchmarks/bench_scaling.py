@@ -0,0 +1,224 @@
+"""Benchmark how the POT steps and every detector scale from 1k to 10M rows and over several column counts.
+
+Every step records its wall time, rows per second and peak traced memory, and the whole run can be written as JSON
+and compared with a stored baseline, which exits non-zero on regressions.
+
+Run with `python -m tests.benchmarks.bench_scaling [--rows ...] [--cols ...] [--cases ...] [--output result.json]
+[--baseline baseline.json]` from the repository root.
+"""
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable
+
+import numpy as np
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+from src.anomaly_detection.models.detectors.detector import DETECTOR_REGISTRY
+from src.anomaly_detection.utils.math import calculate_peak_over_threshold
+
+FORMAT_VERSION = 1
+TOTAL_ROWS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+TOTAL_COLS = (1, 4, 16)
+POT_CASES = ("calculate_peak_over_threshold", "compute_pot_data")
+DETECTOR_CASES = tuple(DETECTOR_REGISTRY)
+# Steps faster than this are repeated and the fastest run counts, slower steps run once.
+REPEAT_BELOW_SECONDS = 1.0
+# Timings of very fast steps jitter by more than any relative tolerance, so they get this much absolute slack.
+REGRESSION_SLACK_SECONDS = 0.005
+REGRESSION_SLACK_MEGABYTES = 1.0
+
+
+def gen_benchmark_data(total_rows: int, total_cols: int, seed: int = 42) -> DataFrame:
+    rng = np.random.default_rng(seed=seed)
+    values = rng.normal(size=(total_rows, total_cols))
+    # About one value in 1000 is a spike far in the tail.
+    is_spike = rng.random(size=values.shape) < 1e-3
+    values[is_spike] += rng.choice([-1.0, 1.0], size=int(is_spike.sum())) * rng.uniform(6.0, 12.0, int(is_spike.sum()))
+    return DataFrame(data=values, columns=[f"col_{idx + 1}" for idx in range(total_cols)])
+
+
+def measure(step: Callable[[], Any], repeat: int = 3) -> tuple[Any, float, float]:
+    """Run a step under `tracemalloc` for its peak memory, and repeat it untraced while it is quick.
+
+    Returns:
+        :result_seconds_peak_megabytes (tuple[Any, float, float]): The result of the first run, the fastest wall time
+            and the peak of the memory NumPy and Python allocated during the first run.
+    """
+    tracemalloc.start()
+    start = perf_counter()
+    result = step()
+    seconds = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    for _ in range(repeat - 1):
+        if seconds >= REPEAT_BELOW_SECONDS:
+            break
+        start = perf_counter()
+        step()
+        seconds = min(seconds, perf_counter() - start)
+    return result, seconds, peak / 2**20
+
+
+def _case_steps(case: str, df: DataFrame) -> list[tuple[str, Callable[[], Any]]]:
+    # Every case is a list of named steps, a later step may use the result of the step before it.
+    if case == "calculate_peak_over_threshold":
+        return [
+            (
+                "calculate_peak_over_threshold",
+                lambda: calculate_peak_over_threshold(
+                    df=df, features=list(df.columns), min_period=int(0.6 * df.shape[0]), quantile=0.97
+                ),
+            )
+        ]
+    detector = get_detector("pot" if case == "compute_pot_data" else case)
+    detector.set_timeframe(total_rows=df.shape[0])  # type: ignore
+    if hasattr(detector, "seed"):
+        detector.seed = 42  # type: ignore
+    if case == "compute_pot_data":
+        return [("compute_pot_data", lambda: detector.compute_pot_data(df))]  # type: ignore
+    anomaly_score: dict[str, DataFrame] = {}
+    return [
+        ("compute_anomaly_score", lambda: anomaly_score.setdefault("df", detector.compute_anomaly_score(df))),
+        ("detect_anomaly", lambda: detector.detect_anomaly(anomaly_score["df"])),
+    ]
+
+
+def bench_scaling(
+    cases: tuple[str, ...] = POT_CASES + DETECTOR_CASES,
+    total_rows: tuple[int, ...] = TOTAL_ROWS,
+    total_cols: tuple[int, ...] = TOTAL_COLS,
+    time_limit: float = 60.0,
+    max_cells: int = 40_000_000,
+    repeat: int = 3,
+) -> dict[str, Any]:
+    """Measure every step of every case for all row and column counts.
+
+    Once a step of a case takes longer than `time_limit` seconds, the larger row counts of that case and column count
+    are recorded as skipped, and so is every dataset of more than `max_cells` values.
+    """
+    results: list[dict[str, Any]] = []
+    for case in cases:
+        for cols in sorted(total_cols):
+            over_time_limit: str | None = None
+            for rows in sorted(total_rows):
+                skip_reason = over_time_limit
+                if rows * cols > max_cells:
+                    skip_reason = f"more than {max_cells} values"
+                if skip_reason is not None:
+                    results.append(
+                        {"case": case, "step": None, "total_rows": rows, "total_cols": cols, "skipped": skip_reason}
+                    )
+                    continue
+                steps = _case_steps(case=case, df=gen_benchmark_data(total_rows=rows, total_cols=cols))
+                for step_name, step in steps:
+                    _, seconds, peak_megabytes = measure(step=step, repeat=repeat)
+                    results.append(
+                        {
+                            "case": case,
+                            "step": step_name,
+                            "total_rows": rows,
+                            "total_cols": cols,
+                            "seconds": seconds,
+                            "rows_per_second": rows / seconds,
+                            "peak_megabytes": peak_megabytes,
+                        }
+                    )
+                    if seconds > time_limit:
+                        over_time_limit = f"{step_name} took over {time_limit} s at {rows} rows"
+    return {
+        "format_version": FORMAT_VERSION,
+        "machine": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "results": results,
+    }
+
+
+def compare_with_baseline(
+    result: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.25
+) -> list[dict[str, Any]]:
+    """Find every step that got slower or needs more memory than in the baseline, beyond the tolerance and slack.
+
+    Args:
+        :result (dict): The output of `bench_scaling`.
+        :baseline (dict): A stored output of `bench_scaling`, steps missing from either side are ignored.
+        :tolerance (float): The relative increase that still counts as noise, e.g. 0.25 for 25%.
+
+    Returns:
+        :regressions (list[dict]): The step, its sizes and the metric that regressed with both values and their ratio.
+    """
+    if baseline.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Baseline format version {baseline.get('format_version')} is not {FORMAT_VERSION}.")
+    baseline_steps = {
+        (entry["case"], entry["step"], entry["total_rows"], entry["total_cols"]): entry
+        for entry in baseline["results"]
+        if "skipped" not in entry
+    }
+    regressions = []
+    for entry in result["results"]:
+        baseline_entry = baseline_steps.get((entry["case"], entry["step"], entry["total_rows"], entry["total_cols"]))
+        if "skipped" in entry or baseline_entry is None:
+            continue
+        for metric, slack in (("seconds", REGRESSION_SLACK_SECONDS), ("peak_megabytes", REGRESSION_SLACK_MEGABYTES)):
+            if entry[metric] > baseline_entry[metric] * (1 + tolerance) + slack:
+                regressions.append(
+                    {
+                        "case": entry["case"],
+                        "step": entry["step"],
+                        "total_rows": entry["total_rows"],
+                        "total_cols": entry["total_cols"],
+                        "metric": metric,
+                        "baseline": baseline_entry[metric],
+                        "value": entry[metric],
+                        "ratio": entry[metric] / max(baseline_entry[metric], 1e-12),
+                    }
+                )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=TOTAL_ROWS)
+    parser.add_argument("--cols", type=int, nargs="+", default=TOTAL_COLS)
+    parser.add_argument("--cases", nargs="+", default=POT_CASES + DETECTOR_CASES)
+    parser.add_argument("--time-limit", type=float, default=60.0)
+    parser.add_argument("--max-cells", type=int, default=40_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="the file to write the JSON result to, printed to stdout without it")
+    parser.add_argument("--baseline", help="a stored JSON result to flag regressions against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    result = bench_scaling(
+        cases=tuple(args.cases),
+        total_rows=tuple(args.rows),
+        total_cols=tuple(args.cols),
+        time_limit=args.time_limit,
+        max_cells=args.max_cells,
+        repeat=args.repeat,
+    )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(result, file, indent=2)
+    else:
+        print(json.dumps(result, indent=2))
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare_with_baseline(result=result, baseline=json.load(file), tolerance=args.tolerance)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['case']}.{regression['step']} {regression['total_rows']}x"
+                f"{regression['total_cols']} {regression['metric']}: {regression['baseline']:.4g} -> "
+                f"{regression['value']:.4g} ({regression['ratio']:.2f}x)",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
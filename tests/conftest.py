@@ -1,9 +1,21 @@
-from os import listdir
-from random import shuffle
+"""Lazily built, cached test datasets.
+
+Nothing is read or generated on import. The first request for a dataset turns it into a `.npy` block in
+`tests/datasets/` once: from the CSV written by `python -m tests.data_gen` when it exists, else straight from
+`DataGenerator` with the same seed. Every later request only memory-maps that block.
+"""
+import os
+from functools import lru_cache
 from typing import Literal
 
+import numpy as np
 from pandas import DataFrame, read_csv
 
+from tests.data_gen import DataGenerator, dataset_filename, TEST_DATASETS
+
+TEST_DATASET_DIRECTORY = "tests/datasets"
+TEST_DATASET_SEED = 42
+
 
 def get_test_dataset(
     dtype: Literal[
@@ -27,12 +39,34 @@ def get_test_dataset(
         "anomaly_003",
         "anomaly_01",
     ],
+    directory: str = TEST_DATASET_DIRECTORY,
 ) -> str:
-    test_dataset_path = "tests/datasets/"
-    for filename in listdir(test_dataset_path):
-        if dtype in filename and total_rows in filename and vals in filename and anomaly_percentage in filename:
-            return test_dataset_path + filename
-    return "File doesn't exist!"
+    """Find the dataset in `TEST_DATASETS` and return the path of its `.npy` block, built on the first call."""
+    for idx, dataset in enumerate(TEST_DATASETS):
+        filename = dataset_filename(**dataset)  # type: ignore
+        if all(part in filename for part in (f"_{dtype}_", total_rows, vals, anomaly_percentage)):
+            return _build_test_dataset(directory=directory, idx=idx)
+    raise ValueError(f"There is no test dataset of {dtype}, {total_rows}, {vals} and {anomaly_percentage}.")
+
+
+@lru_cache(maxsize=None)
+def _build_test_dataset(directory: str, idx: int) -> str:
+    dataset = TEST_DATASETS[idx]
+    csv_path = os.path.join(directory, dataset_filename(**dataset))  # type: ignore
+    npy_path = csv_path.removesuffix(".csv") + ".npy"
+    is_stale = os.path.exists(csv_path) and (
+        not os.path.exists(npy_path) or os.path.getmtime(npy_path) < os.path.getmtime(csv_path)
+    )
+    if os.path.exists(npy_path) and not is_stale:
+        return npy_path
+    # The block is written next to its final path and renamed, so an interrupted run never leaves half a dataset.
+    temporary_path = f"{npy_path}.tmp.npy"
+    if os.path.exists(csv_path):
+        np.save(temporary_path, read_csv(filepath_or_buffer=csv_path, float_precision="round_trip").to_numpy())
+    else:
+        DataGenerator(total_cols=2, seed=TEST_DATASET_SEED + idx, **dataset).write(path=temporary_path)  # type: ignore
+    os.replace(temporary_path, npy_path)
+    return npy_path
 
 
 def init_test_df(
@@ -55,82 +89,24 @@ def init_test_df(
         "anomaly_01",
     ],
     is_shuffled: bool = False,
+    seed: int | None = TEST_DATASET_SEED,
+    directory: str = TEST_DATASET_DIRECTORY,
 ) -> DataFrame:
-    test_dataset = get_test_dataset(
-        dtype=dtype,
-        total_rows=total_rows,
-        vals=vals,
-        anomaly_percentage=anomaly_percentage,
+    """Load a test dataset with the columns `col_1`, `col_2`, ..., every column shuffled on its own if asked to.
+
+    The block is memory-mapped copy-on-write, so every call gets its own data without reading the file and a test
+    that writes to its frame never changes what the next one loads.
+    """
+    values = np.load(
+        get_test_dataset(
+            dtype=dtype,
+            total_rows=total_rows,
+            vals=vals,
+            anomaly_percentage=anomaly_percentage,
+            directory=directory,
+        ),
+        mmap_mode="c",
     )
-    if test_dataset == "File doesn't exist!":
-        return "File doesn't exist!"
-    df = read_csv(filepath_or_buffer=test_dataset)
     if is_shuffled:
-        for feature in df.columns:
-            shuffle(df[feature].values)
-    return df
-
-
-test_df_int_row1000_max1000_a003 = init_test_df(
-    dtype="int", total_rows="row_1000_", vals="max_1000_", anomaly_percentage="anomaly_003", is_shuffled=False
-)
-test_df_int_row10000_max1000_a003 = init_test_df(
-    dtype="int", total_rows="row_10000_", vals="max_1000_", anomaly_percentage="anomaly_003", is_shuffled=False
-)
-test_df_int_row100000_max1000_a003 = init_test_df(
-    dtype="int", total_rows="row_100000_", vals="max_1000_", anomaly_percentage="anomaly_003", is_shuffled=False
-)
-test_df_int_row1000000_max1000_a003 = init_test_df(
-    dtype="int", total_rows="row_1000000_", vals="max_1000_", anomaly_percentage="anomaly_003", is_shuffled=False
-)
-test_df_int_row10000000_max1000_a003 = init_test_df(
-    dtype="int", total_rows="row_1000_", vals="max_1000_", anomaly_percentage="anomaly_003", is_shuffled=False
-)
-
-test_df_int_row1000_max1000_a01 = init_test_df(
-    dtype="int", total_rows="row_1000_", vals="max_1000_", anomaly_percentage="anomaly_01", is_shuffled=False
-)
-test_df_int_row10000_max1000_a01 = init_test_df(
-    dtype="int", total_rows="row_10000_", vals="max_1000_", anomaly_percentage="anomaly_01", is_shuffled=False
-)
-test_df_int_row100000_max1000_a01 = init_test_df(
-    dtype="int", total_rows="row_100000_", vals="max_1000_", anomaly_percentage="anomaly_01", is_shuffled=False
-)
-test_df_int_row1000000_max1000_a01 = init_test_df(
-    dtype="int", total_rows="row_1000000_", vals="max_1000_", anomaly_percentage="anomaly_01", is_shuffled=False
-)
-test_df_int_row10000000_max1000_a01 = init_test_df(
-    dtype="int", total_rows="row_1000_", vals="max_1000_", anomaly_percentage="anomaly_01", is_shuffled=False
-)
-
-test_df_int_row1000_max1000_a003_sd = init_test_df(
-    dtype="int", total_rows="row_1000_", vals="max_1000_", anomaly_percentage="anomaly_003", is_shuffled=True
-)
-test_df_int_row10000_max1000_a003_sd = init_test_df(
-    dtype="int", total_rows="row_10000_", vals="max_1000_", anomaly_percentage="anomaly_003", is_shuffled=True
-)
-test_df_int_row100000_max1000_a003_sd = init_test_df(
-    dtype="int", total_rows="row_100000_", vals="max_1000_", anomaly_percentage="anomaly_003", is_shuffled=True
-)
-test_df_int_row1000000_max1000_a003_sd = init_test_df(
-    dtype="int", total_rows="row_1000000_", vals="max_1000_", anomaly_percentage="anomaly_003", is_shuffled=True
-)
-test_df_int_row10000000_max1000_a003_sd = init_test_df(
-    dtype="int", total_rows="row_1000_", vals="max_1000_", anomaly_percentage="anomaly_003", is_shuffled=True
-)
-
-test_df_int_row1000_max1000_a01_sd = init_test_df(
-    dtype="int", total_rows="row_1000_", vals="max_1000_", anomaly_percentage="anomaly_01", is_shuffled=True
-)
-test_df_int_row10000_max1000_a01_sd = init_test_df(
-    dtype="int", total_rows="row_10000_", vals="max_1000_", anomaly_percentage="anomaly_01", is_shuffled=True
-)
-test_df_int_row100000_max1000_a01_sd = init_test_df(
-    dtype="int", total_rows="row_100000_", vals="max_1000_", anomaly_percentage="anomaly_01", is_shuffled=True
-)
-test_df_int_row1000000_max1000_a01_sd = init_test_df(
-    dtype="int", total_rows="row_1000000_", vals="max_1000_", anomaly_percentage="anomaly_01", is_shuffled=True
-)
-test_df_int_row10000000_max1000_a01_sd = init_test_df(
-    dtype="int", total_rows="row_1000_", vals="max_1000_", anomaly_percentage="anomaly_01", is_shuffled=True
-)
+        values = np.random.default_rng(seed).permuted(values, axis=0)
+    return DataFrame(data=values, columns=[f"col_{idx + 1}" for idx in range(values.shape[1])])
@@ -1,10 +1,69 @@
-from random import randint, uniform
-from typing import Callable
-
+"""Seeded, vectorized synthetic datasets with known anomalies for the tests and benchmarks.
+
+Nothing is generated on import. Run with `python -m tests.data_gen [directory] [n_jobs]` from the repository root to
+write the CSV test datasets of `TEST_DATASETS` that `tests/conftest.py` reads.
+"""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from numpy.typing import NDArray
 from pandas import DataFrame
 
+# Every block of this many rows is drawn from its own seed, so the data does not depend on the chunk size or n_jobs.
+SEED_BLOCK_SIZE = 2**16
+CHUNK_SIZE = 2**20
+TEST_DATASETS = [
+    {"total_rows": total_rows, "max_value": max_value, "anomaly_percentage": anomaly_percentage, **kind}
+    for total_rows, max_value, anomaly_percentage, kind in product(
+        (1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+        (1_000, 10_000),
+        (0.03, 0.1),
+        (
+            {"is_float": False, "is_pos": True},
+            {"is_float": False, "is_pos": False},
+            {"is_float": True, "is_pos": True},
+            {"is_float": True, "is_pos": False},
+        ),
+    )
+]
+
+
+class GeneratedData:
+    """A generated dataset together with the rows where anomalies were injected.
+
+    Args:
+        :df (pd.DataFrame): The dataset with the columns `col_1`, `col_2`, ...
+        :anomaly_idx (dict[str, np.ndarray]): The sorted row positions of the anomalies of every column.
+    """
+
+    def __init__(self, df: DataFrame, anomaly_idx: dict[str, NDArray[np.int64]]):
+        self.df = df
+        self.anomaly_idx = anomaly_idx
+
 
 class DataGenerator:
+    """Draw uniform values in `[0, max_value]` and replace a share of the rows of every column with anomalies.
+
+    The anomalies are at random rows, `total_pos_inf` of them are +inf, `total_neg_inf` are -inf and the others are
+    uniform up to `max_value ** 2`. Negative data maps every value `x` to `-x - 1`, anomalies included. All values of
+    a block of rows are drawn at once from a NumPy `Generator`, and the same seed always gives the same data.
+
+    Args:
+        :total_cols (int): The number of columns.
+        :total_rows (int): The number of rows.
+        :max_value (int): The largest regular value.
+        :total_pos_inf (int | None): The number of +inf anomalies per column.
+        :total_neg_inf (int | None): The number of -inf anomalies per column.
+        :is_float (bool): Whether to draw floats instead of integers.
+        :is_pos (bool): Whether the data is positive or negative.
+        :anomaly_percentage (float | None): The share of the rows of every column that are anomalies.
+        :seed (int | None): The seed of the values and the anomalies.
+    """
+
     def __init__(
         self,
         total_cols: int = 2,
@@ -15,74 +74,113 @@ class DataGenerator:
         is_float: bool = False,
         is_pos: bool = True,
         anomaly_percentage: float | None = 0.03,
+        seed: int | None = None,
     ):
+        if total_rows <= 0:
+            raise ValueError("Parameter `total_rows` must be a positive integer.")
         self.total_cols: int = total_cols
         self.total_rows: int = total_rows
         self.max_value = max_value
-        self.total_pos_inf: int | None = total_pos_inf
-        self.total_neg_inf: int | None = total_neg_inf
+        self.total_pos_inf: int = total_pos_inf or 0
+        self.total_neg_inf: int = total_neg_inf or 0
         self.is_float: bool = is_float
         self.is_pos: bool = is_pos
-        self.total_anomalies = int(anomaly_percentage * max_value) if anomaly_percentage else None
-
-    def __gen_data(self) -> list[int | float]:
-        if self.total_rows <= 0:
-            raise ValueError("Parameter `total_rows` must be a positive integer.")
-        if not self.is_float:
-            data_gen: Callable[[], int] = lambda: randint(0, self.max_value)  # type: ignore
-        elif self.is_float:
-            data_gen: Callable[[], float] = lambda: uniform(0, self.max_value)  # type: ignore
-        rows: list[int | float] = [data_gen() for _ in range(self.total_rows)]
-        return rows
-
-    def __convert_to_neg(self, rows: list[int | float]) -> list[int | float]:
-        converted_rows = []
+        self.total_anomalies = int(anomaly_percentage * total_rows) if anomaly_percentage else 0
+        if self.total_pos_inf + self.total_neg_inf > self.total_anomalies:
+            raise ValueError("Parameters `total_pos_inf` and `total_neg_inf` can not exceed the number of anomalies.")
+        self.dtype = np.float64 if is_float or self.total_pos_inf or self.total_neg_inf else np.int64
+        self.seed_sequence = np.random.SeedSequence(seed)
+        anomaly_rng = np.random.default_rng(self.__child_seed(0))
+        self.anomaly_idx = {
+            f"col_{idx + 1}": np.sort(anomaly_rng.choice(total_rows, size=self.total_anomalies, replace=False))
+            for idx in range(total_cols)
+        }
+        self.anomaly_values = [self.__gen_anomaly_values(col_idx=idx) for idx in range(total_cols)]
+
+    def __child_seed(self, *key: int) -> np.random.SeedSequence:
+        return np.random.SeedSequence(entropy=self.seed_sequence.entropy, spawn_key=key)
+
+    def __draw(self, rng: np.random.Generator, high: int, size: tuple[int, ...]) -> NDArray:
+        if self.is_float:
+            return rng.uniform(0, high, size=size)
+        return rng.integers(0, high, size=size, endpoint=True)
+
+    def __gen_anomaly_values(self, col_idx: int) -> NDArray:
+        rng = np.random.default_rng(self.__child_seed(1, col_idx))
+        anomaly_values = self.__draw(rng=rng, high=self.max_value**2, size=(self.total_anomalies,)).astype(
+            self.dtype
+        )
+        if self.total_pos_inf or self.total_neg_inf:
+            order = rng.permutation(self.total_anomalies)
+            anomaly_values[order[: self.total_pos_inf]] = np.inf
+            anomaly_values[order[self.total_pos_inf : self.total_pos_inf + self.total_neg_inf]] = -np.inf
+        return anomaly_values
+
+    def gen_chunk(self, start: int, stop: int) -> NDArray:
+        """Generate the rows `[start, stop)` of all columns, the same rows always get the same values."""
+        chunk = np.empty((stop - start, self.total_cols), dtype=self.dtype)
+        for block in range(start // SEED_BLOCK_SIZE, (stop - 1) // SEED_BLOCK_SIZE + 1):
+            block_start = block * SEED_BLOCK_SIZE
+            block_stop = min(block_start + SEED_BLOCK_SIZE, self.total_rows)
+            block_values = self.__draw(
+                rng=np.random.default_rng(self.__child_seed(2, block)),
+                high=self.max_value,
+                size=(block_stop - block_start, self.total_cols),
+            )
+            lower, upper = max(start, block_start), min(stop, block_stop)
+            chunk[lower - start : upper - start] = block_values[lower - block_start : upper - block_start]
+
+        for idx, (anomaly_idx, anomaly_values) in enumerate(zip(self.anomaly_idx.values(), self.anomaly_values)):
+            lower, upper = np.searchsorted(anomaly_idx, [start, stop])
+            chunk[anomaly_idx[lower:upper] - start, idx] = anomaly_values[lower:upper]
         if not self.is_pos:
-            for data in rows:
-                converted_rows.append((data * -1) - 1)
-        else:
-            converted_rows = rows
-        return converted_rows
-
-    def __gen_anomaly(self, rows: list[int | float]) -> list[int | float]:
-        new_rows = rows
-        if self.total_anomalies:
-            new_rows = new_rows[: -self.total_anomalies]
-            if self.total_pos_inf or self.total_neg_inf:
-                for _ in range(0, self.total_anomalies):
-                    new_rows.append(float("inf") if self.total_pos_inf else float("-inf"))
-            else:
-                max_value = self.max_value**2
-                if not self.is_float:
-                    data_gen: Callable[[], int] = lambda: randint(0, max_value)  # type: ignore
-                elif self.is_float:
-                    data_gen: Callable[[], float] = lambda: uniform(0, max_value)  # type: ignore
-                anomaly_rows = [data_gen() for _ in range(0, self.total_anomalies)]
-                for anomaly_row in anomaly_rows:
-                    new_rows.append(anomaly_row)
-        return new_rows
-
-    def __gen_rows(self) -> list[int | float]:
-        print("Start random data generation. . .")
-        rows = self.__gen_data()
-        print(f"{len(rows)} rows are successfully generated!")
-        print("Positive-Negative data convertion. . .")
-        converted_rows = self.__convert_to_neg(rows=rows)
-        if converted_rows[0] < 0:
-            print("Data values are negative!")
+            # Infinite anomalies only swap their sign, every other value x becomes -x - 1.
+            chunk = -chunk - 1
+        return chunk
+
+    def __chunks(self, chunk_size: int, n_jobs: int):
+        starts = range(0, self.total_rows, chunk_size)
+        # Only `n_jobs` chunks are in memory at once, they come back in row order.
+        with ThreadPoolExecutor(max_workers=max(n_jobs, 1)) as executor:
+            for window_start in range(0, len(starts), max(n_jobs, 1)):
+                window = starts[window_start : window_start + max(n_jobs, 1)]
+                yield from zip(
+                    window,
+                    executor.map(
+                        lambda start: self.gen_chunk(start, min(start + chunk_size, self.total_rows)), window
+                    ),
+                )
+
+    def __call__(self) -> GeneratedData:
+        return GeneratedData(
+            df=DataFrame(data=self.gen_chunk(0, self.total_rows), columns=list(self.anomaly_idx)),
+            anomaly_idx=self.anomaly_idx,
+        )
+
+    def write(self, path: str, chunk_size: int = CHUNK_SIZE, n_jobs: int = 1) -> dict[str, NDArray[np.int64]]:
+        """Stream the dataset to a `.npy` (n_rows x n_cols) block or a `.csv` file chunk by chunk.
+
+        Args:
+            :path (str): The file to write, its suffix picks the format.
+            :chunk_size (int): The number of rows generated and written at once.
+            :n_jobs (int): The number of chunks generated in parallel threads.
+
+        Returns:
+            :anomaly_idx (dict[str, np.ndarray]): The sorted row positions of the anomalies of every column.
+        """
+        if path.endswith(".npy"):
+            block = open_memmap(path, mode="w+", dtype=self.dtype, shape=(self.total_rows, self.total_cols))
+            for start, chunk in self.__chunks(chunk_size=chunk_size, n_jobs=n_jobs):
+                block[start : start + chunk.shape[0]] = chunk
+            block.flush()
+        elif path.endswith(".csv"):
+            with open(path, "w") as file:
+                file.write(",".join(self.anomaly_idx) + "\n")
+                for _, chunk in self.__chunks(chunk_size=chunk_size, n_jobs=n_jobs):
+                    DataFrame(data=chunk).to_csv(file, header=False, index=False)
         else:
-            print("Data values stay positive!")
-        print(f"Generating {self.total_anomalies} anomalous data. . .")
-        print(f"{self.total_anomalies} anomalous data are successfully generated!")
-        return self.__gen_anomaly(rows=converted_rows)
-
-    def __call__(self):
-        data = {}
-        for i in range(0, self.total_cols):
-            data[f"col_{i+1}"] = self.__gen_rows()
-        df = DataFrame(data=data)
-        print(f"Total DF rows: {df.shape[0]}")
-        return df
+            raise ValueError("Parameter `path` must end with .npy or .csv.")
+        return self.anomaly_idx
 
 
 def gen_data(
@@ -94,6 +192,7 @@ def gen_data(
     total_neg_inf: int | None = None,
     is_float: bool = False,
     is_pos: bool = True,
+    seed: int | None = None,
 ) -> DataFrame:
     return DataGenerator(
         total_cols=total_cols,
@@ -104,1057 +203,27 @@ def gen_data(
         total_neg_inf=total_neg_inf,
         is_float=is_float,
         is_pos=is_pos,
-    )()
-
-
-df1_pos_int_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df2_pos_int_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df3_pos_int_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df4_pos_int_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df5_pos_int_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df1_pos_int_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df2_pos_int_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df3_pos_int_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df4_pos_int_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df5_pos_int_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-
-df1_neg_int_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df2_neg_int_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df3_neg_int_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df4_neg_int_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df5_neg_int_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df1_neg_int_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df2_neg_int_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df3_neg_int_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df4_neg_int_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df5_neg_int_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-
-df1_pos_float_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df2_pos_float_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df3_pos_float_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df4_pos_float_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df5_pos_float_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df1_pos_float_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df2_pos_float_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df3_pos_float_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df4_pos_float_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df5_pos_float_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-
-df1_neg_float_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df2_neg_float_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df3_neg_float_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df4_neg_float_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df5_neg_float_1000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=1000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df1_neg_float_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df2_neg_float_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df3_neg_float_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df4_neg_float_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df5_neg_float_10000_003 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=10000,
-    anomaly_percentage=0.03,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-
-df1_pos_int_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset1_col_2_row_1000_dtype_int_max_1000_anomaly_003.csv", index=False
-)
-df2_pos_int_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset2_col_2_row_10000_dtype_int_max_1000_anomaly_003.csv", index=False
-)
-df3_pos_int_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset3_col_2_row_100000_dtype_int_max_1000_anomaly_003.csv", index=False
-)
-df4_pos_int_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset4_col_2_row_1000000_dtype_int_max_1000_anomaly_003.csv", index=False
-)
-df5_pos_int_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset5_col_2_row_10000000_dtype_int_max_1000_anomaly_003.csv", index=False
-)
-df1_neg_int_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset6_col_2_row_1000_dtype_int_min_1000_anomaly_003.csv", index=False
-)
-df2_neg_int_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset7_col_2_row_10000_dtype_int_min_1000_anomaly_003.csv", index=False
-)
-df3_neg_int_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset8_col_2_row_100000_dtype_int_min_1000_anomaly_003.csv", index=False
-)
-df4_neg_int_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset9_col_2_row_1000000_dtype_int_min_1000_anomaly_003.csv", index=False
-)
-df5_neg_int_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset10_col_2_row_1000000_dtype_int_min_1000_anomaly_003.csv", index=False
-)
-df1_pos_float_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset11_row_2_col_1000_dtype_float_max_1000_anomaly_003.csv", index=False
-)
-df2_pos_float_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset12_row_2_col_10000_dtypefloatt_max_1000_anomaly_003.csv", index=False
-)
-df3_pos_float_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset13_row_2_col_100000_dtype_float_max_1000_anomaly_003.csv", index=False
-)
-df4_pos_float_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset14_row_2_row_1000000_dtype_float_max_1000_anomaly_003.csv", index=False
-)
-df5_pos_float_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset15_col_2_row_10000000_dtype_float_max_1000_anomaly_003.csv", index=False
-)
-df1_neg_float_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset16_row_2_col_1000_dtype_float_min_1000_anomaly_003.csv", index=False
-)
-df2_neg_float_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset17_row_2_col_10000_dtype_float_min_1000_anomaly_003.csv", index=False
-)
-df3_neg_float_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset18_row_2_col_100000_dtype_float_min_1000_anomaly_003.csv", index=False
-)
-df4_neg_float_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset19_row_2_row_1000000_dtype_float_min_1000_anomaly_003.csv", index=False
-)
-df5_neg_float_1000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset20_col_2_row_10000000_dtype_float_min_1000_anomaly_003.csv", index=False
-)
-
-df1_pos_int_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset1_col_2_row_1000_dtype_int_max_10000_anomaly_003.csv", index=False
-)
-df2_pos_int_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset2_col_2_row_10000_dtype_int_max_10000_anomaly_003.csv", index=False
-)
-df3_pos_int_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset3_col_2_row_100000_dtype_int_max_10000_anomaly_003.csv", index=False
-)
-df4_pos_int_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset4_col_2_row_1000000_dtype_int_max_10000_anomaly_003.csv", index=False
-)
-df5_pos_int_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset5_col_2_row_10000000_dtype_int_max_10000_anomaly_003.csv", index=False
-)
-df1_neg_int_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset6_col_2_row_1000_dtype_int_min_10000_anomaly_003.csv", index=False
-)
-df2_neg_int_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset7_col_2_row_10000_dtype_int_min_10000_anomaly_003.csv", index=False
-)
-df3_neg_int_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset8_col_2_row_100000_dtype_int_min_10000_anomaly_003.csv", index=False
-)
-df4_neg_int_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset9_col_2_row_1000000_dtype_int_min_10000_anomaly_003.csv", index=False
-)
-df5_neg_int_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset10_col_2_row_1000000_dtype_int_min_10000_anomaly_003.csv", index=False
-)
-df1_pos_float_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset11_row_2_col_1000_dtype_float_max_10000_anomaly_003.csv", index=False
-)
-df2_pos_float_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset12_row_2_col_10000_dtypefloatt_max_10000_anomaly_003.csv", index=False
-)
-df3_pos_float_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset13_row_2_col_100000_dtype_float_max_10000_anomaly_003.csv", index=False
-)
-df4_pos_float_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset14_row_2_row_1000000_dtype_float_max_10000_anomaly_003.csv", index=False
-)
-df5_pos_float_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset15_col_2_row_10000000_dtype_float_max_10000_anomaly_003.csv", index=False
-)
-df1_neg_float_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset16_row_2_col_1000_dtype_float_min_10000_anomaly_003.csv", index=False
-)
-df2_neg_float_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset17_row_2_col_10000_dtype_float_min_10000_anomaly_003.csv", index=False
-)
-df3_neg_float_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset18_row_2_col_100000_dtype_float_min_10000_anomaly_003.csv", index=False
-)
-df4_neg_float_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset19_row_2_row_1000000_dtype_float_min_10000_anomaly_003.csv", index=False
-)
-df5_neg_float_10000_003.to_csv(
-    path_or_buf="./tests/datasets/test_dataset20_col_2_row_10000000_dtype_float_min_10000_anomaly_003.csv", index=False
-)
+        seed=seed,
+    )().df
 
-df1_pos_int_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df2_pos_int_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df3_pos_int_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df4_pos_int_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df5_pos_int_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df1_pos_int_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df2_pos_int_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df3_pos_int_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df4_pos_int_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
-df5_pos_int_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=True,
-)
 
-df1_neg_int_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df2_neg_int_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df3_neg_int_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df4_neg_int_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df5_neg_int_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df1_neg_int_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df2_neg_int_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df3_neg_int_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df4_neg_int_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
-df5_neg_int_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=False,
-    is_pos=False,
-)
+def dataset_filename(
+    total_rows: int, max_value: int, anomaly_percentage: float, is_float: bool, is_pos: bool, total_cols: int = 2
+) -> str:
+    return (
+        f"test_dataset_col_{total_cols}_row_{total_rows}_dtype_{'float' if is_float else 'int'}_"
+        f"{'max' if is_pos else 'min'}_{max_value}_anomaly_{str(anomaly_percentage).replace('.', '')}.csv"
+    )
 
-df1_pos_float_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df2_pos_float_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df3_pos_float_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df4_pos_float_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df5_pos_float_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df1_pos_float_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df2_pos_float_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df3_pos_float_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df4_pos_float_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
-df5_pos_float_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=True,
-)
 
-df1_neg_float_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df2_neg_float_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df3_neg_float_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df4_neg_float_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df5_neg_float_1000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=1000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df1_neg_float_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=1000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df2_neg_float_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df3_neg_float_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=100000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df4_neg_float_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
-df5_neg_float_10000_01 = gen_data(
-    total_cols=2,
-    total_rows=10000000,
-    max_value=10000,
-    anomaly_percentage=0.1,
-    total_pos_inf=None,
-    total_neg_inf=None,
-    is_float=True,
-    is_pos=False,
-)
+def write_test_datasets(directory: str = "tests/datasets", n_jobs: int = 1, seed: int = 42) -> None:
+    for idx, dataset in enumerate(TEST_DATASETS):
+        DataGenerator(total_cols=2, seed=seed + idx, **dataset).write(  # type: ignore
+            path=os.path.join(directory, dataset_filename(**dataset)), n_jobs=n_jobs  # type: ignore
+        )
 
-df1_pos_int_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset1_col_2_row_1000_dtype_int_max_1000_anomaly_01.csv", index=False
-)
-df2_pos_int_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset2_col_2_row_10000_dtype_int_max_1000_anomaly_01.csv", index=False
-)
-df3_pos_int_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset3_col_2_row_100000_dtype_int_max_1000_anomaly_01.csv", index=False
-)
-df4_pos_int_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset4_col_2_row_1000000_dtype_int_max_1000_anomaly_01.csv", index=False
-)
-df5_pos_int_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset5_col_2_row_10000000_dtype_int_max_1000_anomaly_01.csv", index=False
-)
-df1_neg_int_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset6_col_2_row_1000_dtype_int_min_1000_anomaly_01.csv", index=False
-)
-df2_neg_int_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset7_col_2_row_10000_dtype_int_min_1000_anomaly_01.csv", index=False
-)
-df3_neg_int_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset8_col_2_row_100000_dtype_int_min_1000_anomaly_01.csv", index=False
-)
-df4_neg_int_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset9_col_2_row_1000000_dtype_int_min_1000_anomaly_01.csv", index=False
-)
-df5_neg_int_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset10_col_2_row_1000000_dtype_int_min_1000_anomaly_01.csv", index=False
-)
-df1_pos_float_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset11_row_2_col_1000_dtype_float_max_1000_anomaly_01.csv", index=False
-)
-df2_pos_float_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset12_row_2_col_10000_dtypefloatt_max_1000_anomaly_01.csv", index=False
-)
-df3_pos_float_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset13_row_2_col_100000_dtype_float_max_1000_anomaly_01.csv", index=False
-)
-df4_pos_float_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset14_row_2_row_1000000_dtype_float_max_1000_anomaly_01.csv", index=False
-)
-df5_pos_float_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset15_col_2_row_10000000_dtype_float_max_1000_anomaly_01.csv", index=False
-)
-df1_neg_float_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset16_row_2_col_1000_dtype_float_min_1000_anomaly_01.csv", index=False
-)
-df2_neg_float_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset17_row_2_col_10000_dtype_float_min_1000_anomaly_01.csv", index=False
-)
-df3_neg_float_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset18_row_2_col_100000_dtype_float_min_1000_anomaly_01.csv", index=False
-)
-df4_neg_float_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset19_row_2_row_1000000_dtype_float_min_1000_anomaly_01.csv", index=False
-)
-df5_neg_float_1000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset20_col_2_row_10000000_dtype_float_min_1000_anomaly_01.csv", index=False
-)
 
-df1_pos_int_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset1_col_2_row_1000_dtype_int_max_10000_anomaly_01.csv", index=False
-)
-df2_pos_int_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset2_col_2_row_10000_dtype_int_max_10000_anomaly_01.csv", index=False
-)
-df3_pos_int_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset3_col_2_row_100000_dtype_int_max_10000_anomaly_01.csv", index=False
-)
-df4_pos_int_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset4_col_2_row_1000000_dtype_int_max_10000_anomaly_01.csv", index=False
-)
-df5_pos_int_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset5_col_2_row_10000000_dtype_int_max_10000_anomaly_01.csv", index=False
-)
-df1_neg_int_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset6_col_2_row_1000_dtype_int_min_10000_anomaly_01.csv", index=False
-)
-df2_neg_int_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset7_col_2_row_10000_dtype_int_min_10000_anomaly_01.csv", index=False
-)
-df3_neg_int_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset8_col_2_row_100000_dtype_int_min_10000_anomaly_01.csv", index=False
-)
-df4_neg_int_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset9_col_2_row_1000000_dtype_int_min_10000_anomaly_01.csv", index=False
-)
-df5_neg_int_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset10_col_2_row_1000000_dtype_int_min_10000_anomaly_01.csv", index=False
-)
-df1_pos_float_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset11_row_2_col_1000_dtype_float_max_10000_anomaly_01.csv", index=False
-)
-df2_pos_float_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset12_row_2_col_10000_dtypefloatt_max_10000_anomaly_01.csv", index=False
-)
-df3_pos_float_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset13_row_2_col_100000_dtype_float_max_10000_anomaly_01.csv", index=False
-)
-df4_pos_float_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset14_row_2_row_1000000_dtype_float_max_10000_anomaly_01.csv", index=False
-)
-df5_pos_float_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset15_col_2_row_10000000_dtype_float_max_10000_anomaly_01.csv", index=False
-)
-df1_neg_float_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset16_row_2_col_1000_dtype_float_min_10000_anomaly_01.csv", index=False
-)
-df2_neg_float_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset17_row_2_col_10000_dtype_float_min_10000_anomaly_01.csv", index=False
-)
-df3_neg_float_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset18_row_2_col_100000_dtype_float_min_10000_anomaly_01.csv", index=False
-)
-df4_neg_float_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset19_row_2_row_1000000_dtype_float_min_10000_anomaly_01.csv", index=False
-)
-df5_neg_float_10000_01.to_csv(
-    path_or_buf="./tests/datasets/test_dataset20_col_2_row_10000000_dtype_float_min_10000_anomaly_01.csv", index=False
-)
+if __name__ == "__main__":
+    directory = sys.argv[1] if len(sys.argv) > 1 else "tests/datasets"
+    n_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    write_test_datasets(directory=directory, n_jobs=n_jobs)
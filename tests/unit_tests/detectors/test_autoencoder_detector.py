@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from numpy import arange, isnan, sin
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+from src.anomaly_detection.models.detectors.autoencoder import AutoencoderAnomalyDetector
+from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+
+
+class TestAutoencoderAnomalyDetector(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.autoencoder_anomaly_detector = get_detector("autoencoder")
+        rng = default_rng(seed=18)
+        col_1 = sin(arange(3000) / 10) + 0.05 * rng.normal(size=3000)
+        col_1[2500] += 2.0
+        self.test_df = DataFrame(data={"col_1": col_1, "col_2": rng.normal(size=3000), "col_3": ["a"] * 3000})
+
+    def test_construct_autoencoder_anomaly_detector(self):
+        assert issubclass(type(self.autoencoder_anomaly_detector), AnomalyDetector)
+        assert isinstance(self.autoencoder_anomaly_detector, AutoencoderAnomalyDetector)
+        assert str(self.autoencoder_anomaly_detector) == "Autoencoder Anomaly Detector"
+
+    def test_default_value_for_autoencoder_attributes(self):
+        assert self.autoencoder_anomaly_detector.window == 16  # type: ignore
+        assert self.autoencoder_anomaly_detector.latent_size == 4  # type: ignore
+        assert self.autoencoder_anomaly_detector.ae_quantile == 0.99  # type: ignore
+
+    def test_set_autoencoder_attributes_failed_caused_by_invalid_values(self):
+        with self.assertRaises(ValueError):
+            self.autoencoder_anomaly_detector.window = 1  # type: ignore
+        with self.assertRaises(ValueError):
+            self.autoencoder_anomaly_detector.latent_size = 0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.autoencoder_anomaly_detector.ae_quantile = 1.0  # type: ignore
+
+    def test_compute_anomaly_score_and_detect_anomaly(self):
+        self.autoencoder_anomaly_detector.seed = 1  # type: ignore
+        self.autoencoder_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_score_df = self.autoencoder_anomaly_detector.compute_anomaly_score(self.test_df)
+        anomaly_df = self.autoencoder_anomaly_detector.detect_anomaly(anomaly_score_df)
+
+        assert list(anomaly_score_df.columns) == ["anomaly_score_col_1", "anomaly_score_col_2"]
+        assert list(anomaly_score_df.index) == list(range(1800, 3000))
+        assert not isnan(anomaly_score_df.to_numpy()).any()
+        # The spike is in the last position of the window of row 2500 and in every later window that holds it.
+        assert anomaly_df["is_anomaly_col_1"].loc[2500:2515].all()
+        assert anomaly_df["is_anomaly_col_1"].mean() < 0.05
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+from numpy import isnan
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+from src.anomaly_detection.models.detectors.block_maxima import BlockMaximaAnomalyDetector
+from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+
+
+class TestBlockMaximaAnomalyDetector(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.block_maxima_anomaly_detector = get_detector("block_maxima")
+        rng = default_rng(seed=19)
+        col_1 = rng.normal(size=3000)
+        col_1[2000] = 8.0
+        self.test_df = DataFrame(data={"col_1": col_1, "col_2": rng.gumbel(size=3000), "col_3": ["a"] * 3000})
+
+    def test_construct_block_maxima_anomaly_detector(self):
+        assert issubclass(type(self.block_maxima_anomaly_detector), AnomalyDetector)
+        assert isinstance(self.block_maxima_anomaly_detector, BlockMaximaAnomalyDetector)
+        assert str(self.block_maxima_anomaly_detector) == "Block-Maxima Anomaly Detector"
+
+    def test_default_value_for_block_maxima_attributes(self):
+        assert self.block_maxima_anomaly_detector.bm_th == 0.97  # type: ignore
+        assert self.block_maxima_anomaly_detector.block_size == 30  # type: ignore
+
+    def test_set_block_maxima_attributes_failed_caused_by_invalid_values(self):
+        with self.assertRaises(ValueError):
+            self.block_maxima_anomaly_detector.bm_th = 1.0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.block_maxima_anomaly_detector.block_size = 0  # type: ignore
+
+    def test_compute_block_maxima_over_the_t0_rows(self):
+        self.block_maxima_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        maxima_df = self.block_maxima_anomaly_detector.compute_block_maxima(self.test_df)  # type: ignore
+
+        assert list(maxima_df.columns) == ["col_1", "col_2"]
+        assert list(maxima_df.index[:3]) == [0, 30, 60]
+        assert maxima_df.shape == (60, 2)
+        assert maxima_df["col_1"].iloc[1] == self.test_df["col_1"].iloc[30:60].max()
+
+    def test_compute_anomaly_score_and_detect_anomaly(self):
+        self.block_maxima_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_score_df = self.block_maxima_anomaly_detector.compute_anomaly_score(self.test_df)
+        anomaly_df = self.block_maxima_anomaly_detector.detect_anomaly(anomaly_score_df)
+
+        assert list(anomaly_score_df.columns) == ["anomaly_score_col_1", "anomaly_score_col_2"]
+        assert list(anomaly_score_df.index) == list(range(1800, 3000))
+        assert self.block_maxima_anomaly_detector.gev_shape.shape == (2,)  # type: ignore
+        assert anomaly_df["is_anomaly_col_1"].loc[2000]
+        # About one block maximum in 33 exceeds the 0.97 quantile, i.e. about one value in 1000 of 30-row blocks.
+        assert anomaly_df["is_anomaly_col_1"].sum() < 10
+
+    def test_compute_anomaly_score_on_a_short_calibration_window(self):
+        short_df = DataFrame(data=default_rng(seed=4).normal(size=(500, 3)), columns=["col_1", "col_2", "col_3"])
+
+        anomaly_score_df = self.block_maxima_anomaly_detector.compute_anomaly_score(short_df)
+
+        assert anomaly_score_df.shape == (200, 3)
+        # The 10 block maxima of the 300 calibration rows are too few to pin the shape, it never degenerates below -1.
+        shape = self.block_maxima_anomaly_detector.gev_shape  # type: ignore
+        assert shape is not None and ((shape > -1.0) | isnan(shape)).all()
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from numpy import isclose
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+from src.anomaly_detection.models.detectors.box_plot import BoxPlotAnomalyDetector
+from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+
+
+class TestBoxPlotAnomalyDetector(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.box_plot_anomaly_detector = get_detector("box_plot")
+        self.test_df = DataFrame(
+            data={
+                "col_1": [10, 12, 10, 12, 10, 12, 10, 12, 10, 50],
+                "col_2": [15, 25, 35, 45, 55, 65, 75, 85, 95, 105],
+                "col_3": ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"],
+            }
+        )
+
+    def test_construct_box_plot_anomaly_detector(self):
+        assert issubclass(type(self.box_plot_anomaly_detector), AnomalyDetector)
+        assert isinstance(self.box_plot_anomaly_detector, BoxPlotAnomalyDetector)
+        assert str(self.box_plot_anomaly_detector) == "Box-Plot Anomaly Detector"
+
+    def test_default_value_for_iqr_threshold_and_window_attributes(self):
+        assert self.box_plot_anomaly_detector.iqr_th == 1.5  # type: ignore
+        assert self.box_plot_anomaly_detector.window == None  # type: ignore
+
+    def test_set_iqr_threshold_and_window_failed_caused_by_invalid_values(self):
+        with self.assertRaises(ValueError):
+            self.box_plot_anomaly_detector.iqr_th = -1.0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.box_plot_anomaly_detector.window = 1  # type: ignore
+
+    def test_compute_anomaly_score_against_previous_rows(self):
+        self.box_plot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_score_df = self.box_plot_anomaly_detector.compute_anomaly_score(self.test_df)
+
+        assert list(anomaly_score_df.columns) == ["anomaly_score_col_1", "anomaly_score_col_2"]
+        assert list(anomaly_score_df.index) == [6, 7, 8, 9]
+        # The values of `col_1` stay inside the box [10, 12] until the last one, 38 above it or 19 IQRs.
+        assert list(anomaly_score_df["anomaly_score_col_1"]) == [0.0, 0.0, 0.0, 19.0]
+        # The 7th value of `col_2` against the box [27.5, 52.5] of the 6 values before it.
+        assert isclose(anomaly_score_df["anomaly_score_col_2"].iloc[0], (75 - 52.5) / 25)
+
+    def test_compute_anomaly_score_with_rolling_window(self):
+        self.box_plot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        self.box_plot_anomaly_detector.window = 4  # type: ignore
+
+        anomaly_score_df = self.box_plot_anomaly_detector.compute_anomaly_score(self.test_df)
+
+        # Every value of `col_2` is 17.5 above the box of the 4 values before it, whose IQR is 15.
+        assert isclose(anomaly_score_df["anomaly_score_col_2"], 17.5 / 15).all()
+
+    def test_detect_anomaly_from_anomaly_score(self):
+        self.box_plot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_df = self.box_plot_anomaly_detector.detect_anomaly(
+            self.box_plot_anomaly_detector.compute_anomaly_score(self.test_df)
+        )
+
+        assert list(anomaly_df.columns) == ["is_anomaly_col_1", "is_anomaly_col_2"]
+        assert list(anomaly_df["is_anomaly_col_1"]) == [False, False, False, True]
+        assert not anomaly_df["is_anomaly_col_2"].any()
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from numpy import array, concatenate, isnan
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+from src.anomaly_detection.models.detectors.dbscan import DBSCANAnomalyDetector
+from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+
+
+class TestDBSCANAnomalyDetector(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dbscan_anomaly_detector = get_detector("dbscan")
+        rng = default_rng(seed=16)
+        self.test_df = DataFrame(
+            data={
+                "col_1": concatenate((rng.normal(size=995), array([8.0, -7.0, 0.0, 9.0, 0.1]))),
+                "col_2": rng.normal(size=1000),
+                "col_3": ["a"] * 1000,
+            }
+        )
+
+    def test_construct_dbscan_anomaly_detector(self):
+        assert issubclass(type(self.dbscan_anomaly_detector), AnomalyDetector)
+        assert isinstance(self.dbscan_anomaly_detector, DBSCANAnomalyDetector)
+        assert str(self.dbscan_anomaly_detector) == "DBSCAN Anomaly Detector"
+
+    def test_default_value_for_dbscan_attributes(self):
+        assert self.dbscan_anomaly_detector.eps == 0.5  # type: ignore
+        assert self.dbscan_anomaly_detector.min_samples == 5  # type: ignore
+        assert self.dbscan_anomaly_detector.window == 1  # type: ignore
+        assert self.dbscan_anomaly_detector.n_jobs == 1  # type: ignore
+
+    def test_set_dbscan_attributes_failed_caused_by_invalid_values(self):
+        with self.assertRaises(ValueError):
+            self.dbscan_anomaly_detector.eps = 0.0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.dbscan_anomaly_detector.min_samples = 0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.dbscan_anomaly_detector.window = 0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.dbscan_anomaly_detector.n_jobs = 0  # type: ignore
+
+    def test_compute_anomaly_score_and_detect_noise_points(self):
+        self.dbscan_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_score_df = self.dbscan_anomaly_detector.compute_anomaly_score(self.test_df)
+        anomaly_df = self.dbscan_anomaly_detector.detect_anomaly(anomaly_score_df)
+
+        assert list(anomaly_score_df.columns) == ["anomaly_score_col_1", "anomaly_score_col_2"]
+        assert list(anomaly_score_df.index) == list(range(600, 1000))
+        assert list(anomaly_df["is_anomaly_col_1"].iloc[-5:]) == [True, True, False, True, False]
+        assert anomaly_df["is_anomaly_col_1"].sum() == 3
+
+    def test_compute_anomaly_score_with_lagged_window(self):
+        self.dbscan_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        self.dbscan_anomaly_detector.window = 3  # type: ignore
+
+        anomaly_score_df = self.dbscan_anomaly_detector.compute_anomaly_score(self.test_df)
+        anomaly_df = self.dbscan_anomaly_detector.detect_anomaly(anomaly_score_df)
+
+        assert not isnan(anomaly_score_df.to_numpy()).any()
+        # Every point of the last rows that holds one of the outlying values is noise.
+        assert list(anomaly_df["is_anomaly_col_1"].iloc[-5:]) == [True, True, True, True, True]
+
+    def test_compute_anomaly_score_without_complete_window(self):
+        self.dbscan_anomaly_detector.window = 20  # type: ignore
+
+        anomaly_score_df = self.dbscan_anomaly_detector.compute_anomaly_score(self.test_df.iloc[:10])
+
+        assert isnan(anomaly_score_df.to_numpy()).all()
+
+    def tearDown(self) -> None:
+        return super().tearDown()
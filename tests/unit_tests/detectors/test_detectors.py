@@ -1,10 +1,21 @@
-from unittest import TestCase
+from importlib.metadata import EntryPoint
+from unittest import mock, TestCase
 
-from src.anomaly_detection.detecto import get_detector
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector, register_detector
 from src.anomaly_detection.models.detectors.autoencoder import AutoencoderAnomalyDetector
 from src.anomaly_detection.models.detectors.block_maxima import BlockMaximaAnomalyDetector
+from src.anomaly_detection.models.detectors.box_plot import BoxPlotAnomalyDetector
 from src.anomaly_detection.models.detectors.dbscan import DBSCANAnomalyDetector
-from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.models.detectors.detector import (
+    clear_detector_cache,
+    DETECTOR_PROTOTYPES,
+    DETECTOR_REGISTRY,
+    ENTRY_POINT_GROUP,
+    FactoryAnomalyDetector,
+)
+from src.anomaly_detection.models.detectors.interface import AnomalyDetector, ParallelAnomalyDetector
 from src.anomaly_detection.models.detectors.isolation_forest import IsoForestAnomalyDetector
 from src.anomaly_detection.models.detectors.mad import MADAnomalyDetector
 from src.anomaly_detection.models.detectors.one_class_svm import OneClassSVMAnomalyDetector
@@ -30,6 +41,13 @@ class TestAnomalyDetectors(TestCase):
         assert isinstance(blockmaxima_anomaly_detector, BlockMaximaAnomalyDetector)
         assert str(blockmaxima_anomaly_detector) == "Block-Maxima Anomaly Detector"
 
+    def test_construct_boxplot_anomaly_detector_from_detector_factory(self):
+        boxplot_anomaly_detector = get_detector("box_plot")
+
+        assert issubclass(type(boxplot_anomaly_detector), AnomalyDetector)
+        assert isinstance(boxplot_anomaly_detector, BoxPlotAnomalyDetector)
+        assert str(boxplot_anomaly_detector) == "Box-Plot Anomaly Detector"
+
     def test_construct_dbscan_anomaly_detector_from_detector_factory(self):
         dbscan_anomaly_detector = get_detector("dbscan")
 
@@ -72,5 +90,127 @@ class TestAnomalyDetectors(TestCase):
         assert isinstance(z_score_anomaly_detector, ZScoreAnomalyDetector)
         assert str(z_score_anomaly_detector) == "Z-Score Anomaly Detector"
 
+    def test_every_detector_shares_the_timeframe_and_anomaly_detection(self):
+        anomaly_score_df = DataFrame(data={"anomaly_score_col_1": [0.0, 0.5, 1.5, 4.0, 25.0, 40.0]})
+
+        for name in DETECTOR_REGISTRY:
+            anomaly_detector = get_detector(name)
+            anomaly_detector.set_timeframe(total_rows=100)  # type: ignore
+            assert (anomaly_detector.t0, anomaly_detector.t1, anomaly_detector.t2) == (60, 25, 15)  # type: ignore
+            anomaly_df = anomaly_detector.detect_anomaly(anomaly_score_df)
+            assert list(anomaly_df.columns) == ["is_anomaly_col_1"]
+            assert anomaly_df["is_anomaly_col_1"].tolist() == list(
+                anomaly_score_df["anomaly_score_col_1"] > anomaly_detector.anomaly_score_th
+            )
+
+    def test_construct_detector_failed_caused_by_missing_anomaly_score_threshold(self):
+        class ScoreOnlyAnomalyDetector(AnomalyDetector):
+            def compute_anomaly_score(self, dataset: DataFrame) -> DataFrame:
+                return dataset
+
+        with self.assertRaises(TypeError):
+            ScoreOnlyAnomalyDetector()  # type: ignore
+
+    def test_set_n_jobs_of_parallel_detectors_failed_caused_by_zero_jobs(self):
+        for name in ("dbscan", "iso_forest", "pot"):
+            anomaly_detector = get_detector(name, n_jobs=-1)
+            assert isinstance(anomaly_detector, ParallelAnomalyDetector)
+            assert anomaly_detector.n_jobs == -1
+            with self.assertRaises(ValueError):
+                anomaly_detector.n_jobs = 0
+
+    def tearDown(self) -> None:
+        return super().tearDown()
+
+
+class TestDetectorRegistry(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.registry = dict(DETECTOR_REGISTRY)
+
+    def test_get_detector_failed_caused_by_unknown_name(self):
+        with self.assertRaises(ValueError):
+            get_detector("z-score")
+
+    def test_get_detector_with_parameters(self):
+        pot_anomaly_detector = get_detector("pot", pot_th=0.99, n_jobs=2)
+
+        assert pot_anomaly_detector.pot_th == 0.99  # type: ignore
+        assert pot_anomaly_detector.n_jobs == 2  # type: ignore
+
+    def test_get_detector_failed_caused_by_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            get_detector("pot", pot_th=1.5)
+        with self.assertRaises(ValueError):
+            get_detector("pot", z_th=3.0)
+
+    def test_get_detector_failed_caused_by_parameters_without_property_setter(self):
+        with self.assertRaises(ValueError):
+            get_detector("pot", compute_anomaly_score=1)
+        with self.assertRaises(ValueError):
+            get_detector("pot", t0=5)
+        with self.assertRaises(ValueError):
+            get_detector("z_score", anomaly_score_th=1.0)
+
+    def test_get_detector_builds_new_or_copies_the_cached_prototype(self):
+        mad_anomaly_detector = get_detector("mad", mad_th=4.0)
+        mad_anomaly_detector.mad_th = 5.0  # type: ignore
+
+        assert get_detector("mad", mad_th=4.0) is not mad_anomaly_detector
+        assert get_detector("mad", mad_th=4.0).mad_th == 4.0  # type: ignore
+        cached_detector = get_detector("mad", cached=True, mad_th=4.0)
+        assert isinstance(cached_detector, MADAnomalyDetector) and cached_detector.mad_th == 4.0
+        assert cached_detector is not get_detector("mad", cached=True, mad_th=4.0)
+        assert list(DETECTOR_PROTOTYPES) == [("mad", (("mad_th", 4.0),))]
+
+    def test_get_detector_keeps_the_state_of_cached_detectors_apart(self):
+        long_df = DataFrame(data={"col_1": [float(idx % 7) for idx in range(100)]})
+        fitted_detector = get_detector("iso_forest", cached=True, iso_th=0.6)
+        fitted_detector.compute_anomaly_score(long_df)
+        fitted_detector.iso_th = 0.9  # type: ignore
+
+        anomaly_detector = get_detector("iso_forest", cached=True, iso_th=0.6)
+
+        assert fitted_detector.t0 == 60  # type: ignore
+        assert anomaly_detector.t0 is None and anomaly_detector.forests == {}  # type: ignore
+        assert anomaly_detector.iso_th == 0.6  # type: ignore
+        anomaly_score_df = anomaly_detector.compute_anomaly_score(long_df.iloc[:10])
+        assert list(anomaly_score_df.index) == [6, 7, 8, 9]
+        assert fitted_detector.forests["col_1"] is not anomaly_detector.forests["col_1"]  # type: ignore
+
+    def test_register_detector_by_class_or_path(self):
+        register_detector("robust_z_score", MADAnomalyDetector)
+        register_detector("extreme", "src.anomaly_detection.models.detectors.pot:POTAnomalyDetector")
+
+        assert isinstance(get_detector("robust_z_score"), MADAnomalyDetector)
+        assert isinstance(get_detector("extreme"), POTAnomalyDetector)
+        assert isinstance(DETECTOR_REGISTRY["extreme"], type)
+
+    def test_register_detector_replaces_the_cached_prototype(self):
+        register_detector("custom", MADAnomalyDetector)
+        get_detector("custom", cached=True)
+        register_detector("custom", ZScoreAnomalyDetector)
+
+        assert isinstance(get_detector("custom", cached=True), ZScoreAnomalyDetector)
+
+    def test_get_detector_from_entry_point(self):
+        entry_point = EntryPoint(
+            name="plugin_mad",
+            value="src.anomaly_detection.models.detectors.mad:MADAnomalyDetector",
+            group=ENTRY_POINT_GROUP,
+        )
+        with mock.patch("importlib.metadata.entry_points", return_value=[entry_point]) as entry_points:
+            assert isinstance(get_detector("plugin_mad"), MADAnomalyDetector)
+        entry_points.assert_called_once_with(group=ENTRY_POINT_GROUP)
+
+    def test_get_detector_failed_caused_by_class_without_detector_interface(self):
+        register_detector("not_a_detector", "collections:OrderedDict")
+
+        with self.assertRaises(ValueError):
+            FactoryAnomalyDetector("not_a_detector")()
+
     def tearDown(self) -> None:
+        DETECTOR_REGISTRY.clear()
+        DETECTOR_REGISTRY.update(self.registry)
+        clear_detector_cache()
         return super().tearDown()
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from numpy import concatenate, full
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.models.detectors.isolation_forest import IsoForestAnomalyDetector
+
+
+class TestIsoForestAnomalyDetector(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.iso_forest_anomaly_detector = get_detector("iso_forest")
+        rng = default_rng(seed=15)
+        self.test_df = DataFrame(
+            data={
+                "col_1": concatenate((rng.normal(size=995), full(5, 10.0))),
+                "col_2": rng.normal(size=1000),
+                "col_3": ["a"] * 1000,
+            }
+        )
+
+    def test_construct_iso_forest_anomaly_detector(self):
+        assert issubclass(type(self.iso_forest_anomaly_detector), AnomalyDetector)
+        assert isinstance(self.iso_forest_anomaly_detector, IsoForestAnomalyDetector)
+        assert str(self.iso_forest_anomaly_detector) == "Isolation Forest Anomaly Detector"
+
+    def test_default_value_for_iso_forest_attributes(self):
+        assert self.iso_forest_anomaly_detector.iso_th == 0.6  # type: ignore
+        assert self.iso_forest_anomaly_detector.total_trees == 100  # type: ignore
+        assert self.iso_forest_anomaly_detector.sample_size == 256  # type: ignore
+        assert self.iso_forest_anomaly_detector.n_jobs == 1  # type: ignore
+
+    def test_set_iso_forest_attributes_failed_caused_by_invalid_values(self):
+        with self.assertRaises(ValueError):
+            self.iso_forest_anomaly_detector.iso_th = 1.0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.iso_forest_anomaly_detector.total_trees = 0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.iso_forest_anomaly_detector.sample_size = 1  # type: ignore
+        with self.assertRaises(ValueError):
+            self.iso_forest_anomaly_detector.n_jobs = 0  # type: ignore
+
+    def test_compute_anomaly_score_and_detect_anomaly(self):
+        self.iso_forest_anomaly_detector.seed = 1  # type: ignore
+        self.iso_forest_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_score_df = self.iso_forest_anomaly_detector.compute_anomaly_score(self.test_df)
+        anomaly_df = self.iso_forest_anomaly_detector.detect_anomaly(anomaly_score_df)
+
+        assert list(anomaly_score_df.columns) == ["anomaly_score_col_1", "anomaly_score_col_2"]
+        assert list(anomaly_score_df.index) == list(range(600, 1000))
+        assert list(self.iso_forest_anomaly_detector.forests.keys()) == ["col_1", "col_2"]  # type: ignore
+        assert anomaly_df["is_anomaly_col_1"].iloc[-5:].all()
+        assert anomaly_df["is_anomaly_col_1"].sum() < 40
+
+    def tearDown(self) -> None:
+        return super().tearDown()
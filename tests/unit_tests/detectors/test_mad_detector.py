@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from numpy import inf, isclose
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.models.detectors.mad import MADAnomalyDetector
+
+
+class TestMADAnomalyDetector(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.mad_anomaly_detector = get_detector("mad")
+        self.test_df = DataFrame(
+            data={
+                "col_1": [10, 12, 10, 12, 10, 12, 10, 12, 10, 50],
+                "col_2": [15, 25, 35, 45, 55, 65, 75, 85, 95, 105],
+                "col_3": ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"],
+            }
+        )
+
+    def test_construct_mad_anomaly_detector(self):
+        assert issubclass(type(self.mad_anomaly_detector), AnomalyDetector)
+        assert isinstance(self.mad_anomaly_detector, MADAnomalyDetector)
+        assert str(self.mad_anomaly_detector) == "MAD Anomaly Detector"
+
+    def test_default_value_for_mad_threshold_and_window_attributes(self):
+        assert self.mad_anomaly_detector.mad_th == 3.5  # type: ignore
+        assert self.mad_anomaly_detector.window == None  # type: ignore
+
+    def test_set_mad_threshold_and_window_failed_caused_by_invalid_values(self):
+        with self.assertRaises(ValueError):
+            self.mad_anomaly_detector.mad_th = -1.0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.mad_anomaly_detector.window = 1  # type: ignore
+
+    def test_compute_anomaly_score_against_previous_rows(self):
+        self.mad_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_score_df = self.mad_anomaly_detector.compute_anomaly_score(self.test_df)
+
+        assert list(anomaly_score_df.columns) == ["anomaly_score_col_1", "anomaly_score_col_2"]
+        assert list(anomaly_score_df.index) == [6, 7, 8, 9]
+        # The last value of `col_1` against the median 10 and MAD 0 of the 9 values before it.
+        assert anomaly_score_df["anomaly_score_col_1"].iloc[-1] == inf
+        # The 7th value of `col_2` against the median 40 and MAD 15 of the 6 values before it.
+        assert isclose(anomaly_score_df["anomaly_score_col_2"].iloc[0], (75 - 40) / (1.4826 * 15))
+
+    def test_compute_anomaly_score_with_rolling_window(self):
+        self.mad_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        self.mad_anomaly_detector.window = 4  # type: ignore
+
+        anomaly_score_df = self.mad_anomaly_detector.compute_anomaly_score(self.test_df)
+
+        assert isclose(anomaly_score_df["anomaly_score_col_1"].iloc[-1], 39 / 1.4826)
+        assert isclose(anomaly_score_df["anomaly_score_col_2"].iloc[-1], 25 / (1.4826 * 10))
+
+    def test_detect_anomaly_from_anomaly_score(self):
+        self.mad_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_df = self.mad_anomaly_detector.detect_anomaly(
+            self.mad_anomaly_detector.compute_anomaly_score(self.test_df)
+        )
+
+        assert list(anomaly_df.columns) == ["is_anomaly_col_1", "is_anomaly_col_2"]
+        # More than half of the values before the 12 of row 7 are 10, so their MAD is 0 and any deviation is anomalous.
+        assert list(anomaly_df["is_anomaly_col_1"]) == [False, True, False, True]
+        assert not anomaly_df["is_anomaly_col_2"].any()
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+from numpy import array, concatenate, isnan
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.models.detectors.one_class_svm import OneClassSVMAnomalyDetector
+
+
+class TestOneClassSVMAnomalyDetector(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.one_class_svm_anomaly_detector = get_detector("1_class_svm")
+        rng = default_rng(seed=17)
+        self.test_df = DataFrame(
+            data={
+                "col_1": concatenate((rng.normal(size=1995), array([8.0, -7.0, 0.0, 9.0, 0.1]))),
+                "col_2": rng.normal(size=2000),
+                "col_3": ["a"] * 2000,
+            }
+        )
+
+    def test_construct_one_class_svm_anomaly_detector(self):
+        assert issubclass(type(self.one_class_svm_anomaly_detector), AnomalyDetector)
+        assert isinstance(self.one_class_svm_anomaly_detector, OneClassSVMAnomalyDetector)
+        assert str(self.one_class_svm_anomaly_detector) == "One Class SVM Anomaly Detector"
+
+    def test_default_value_for_one_class_svm_attributes(self):
+        assert self.one_class_svm_anomaly_detector.nu == 0.05  # type: ignore
+        assert self.one_class_svm_anomaly_detector.gamma == None  # type: ignore
+        assert self.one_class_svm_anomaly_detector.total_components == 256  # type: ignore
+        assert self.one_class_svm_anomaly_detector.window == 1  # type: ignore
+
+    def test_set_one_class_svm_attributes_failed_caused_by_invalid_values(self):
+        with self.assertRaises(ValueError):
+            self.one_class_svm_anomaly_detector.nu = 1.5  # type: ignore
+        with self.assertRaises(ValueError):
+            self.one_class_svm_anomaly_detector.gamma = 0.0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.one_class_svm_anomaly_detector.total_components = 0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.one_class_svm_anomaly_detector.window = 0  # type: ignore
+
+    def test_compute_anomaly_score_and_detect_anomaly(self):
+        self.one_class_svm_anomaly_detector.seed = 1  # type: ignore
+        self.one_class_svm_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_score_df = self.one_class_svm_anomaly_detector.compute_anomaly_score(self.test_df)
+        anomaly_df = self.one_class_svm_anomaly_detector.detect_anomaly(anomaly_score_df)
+
+        assert list(anomaly_score_df.columns) == ["anomaly_score_col_1", "anomaly_score_col_2"]
+        assert list(anomaly_score_df.index) == list(range(1200, 2000))
+        assert list(anomaly_df["is_anomaly_col_1"].iloc[-5:]) == [True, True, False, True, False]
+        assert anomaly_df["is_anomaly_col_1"].mean() < 0.15
+
+    def test_compute_anomaly_score_with_lagged_window(self):
+        self.one_class_svm_anomaly_detector.seed = 1  # type: ignore
+        self.one_class_svm_anomaly_detector.window = 3  # type: ignore
+
+        anomaly_score_df = self.one_class_svm_anomaly_detector.compute_anomaly_score(self.test_df)
+        anomaly_df = self.one_class_svm_anomaly_detector.detect_anomaly(anomaly_score_df)
+
+        assert not isnan(anomaly_score_df.to_numpy()).any()
+        assert anomaly_df["is_anomaly_col_1"].iloc[-5:].all()
+
+    def tearDown(self) -> None:
+        return super().tearDown()
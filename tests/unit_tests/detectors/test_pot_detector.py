@@ -1,3 +1,4 @@
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from pandas import DataFrame
@@ -5,6 +6,8 @@ from pandas import DataFrame
 from src.anomaly_detection.detecto import get_detector
 from src.anomaly_detection.models.detectors.interface import AnomalyDetector
 from src.anomaly_detection.models.detectors.pot import POTAnomalyDetector
+from src.anomaly_detection.utils.ingestion import ColumnarDataset
+from src.anomaly_detection.utils.results import POTResult
 
 
 class TestPOTAnomalyDetectors(TestCase):
@@ -85,7 +88,7 @@ class TestPOTAnomalyDetectors(TestCase):
         assert self.pot_anomaly_detector.t1 == 3  # type: ignore
         assert self.pot_anomaly_detector.t2 == 1  # type: ignore
 
-        pot_df = self.pot_anomaly_detector.compute_pot_data(df=self.test_df)  # type: ignore
+        pot_df = self.pot_anomaly_detector.compute_pot_data(df=self.test_df).to_dataframe()  # type: ignore
         for feature in pot_df.columns:
             if "pot" in feature:
                 pot_df[feature] = round(pot_df[feature], 2)
@@ -98,5 +101,169 @@ class TestPOTAnomalyDetectors(TestCase):
         assert pot_df["pot_data_col_2"].equals(expected_pot_data_df["pot_data_col_2"])
         assert pot_df["pot_data_col_3"].equals(expected_pot_data_df["pot_data_col_3"])
 
+    def test_compute_pot_data_leaves_dataset_untouched(self):
+        self.pot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        original_df = self.test_df.copy()
+
+        pot_result = self.pot_anomaly_detector.compute_pot_data(df=self.test_df)  # type: ignore
+
+        assert self.test_df.equals(original_df)
+        assert isinstance(pot_result, POTResult)
+        assert pot_result.features == ["col_1", "col_2", "col_3"]
+        assert pot_result.pot_th.shape == (10, 3)
+        assert pot_result.pot_data.flags["C_CONTIGUOUS"]
+        assert round(pot_result.get_pot_th("col_2")[-1], 2) == 92.6
+        assert round(pot_result.get_pot_data("col_3")[-1], 2) == 12.4
+
+    def test_compute_anomaly_score_for_t1_t2_rows(self):
+        self.pot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_score_df = self.pot_anomaly_detector.compute_anomaly_score(df=self.test_df)  # type: ignore
+
+        assert list(anomaly_score_df.columns) == ["anomaly_score_col_1", "anomaly_score_col_2", "anomaly_score_col_3"]
+        assert list(anomaly_score_df.index) == [6, 7, 8, 9]
+        assert (anomaly_score_df > 1.0).all().all()
+        assert self.pot_anomaly_detector.gpd_shape.tolist() == [0.0, 0.0, 0.0]  # type: ignore
+        assert [round(scale, 2) for scale in self.pot_anomaly_detector.gpd_scale] == [1.5, 1.5, 1.5]  # type: ignore
+
+    def test_compute_anomaly_score_without_setting_the_timeframe(self):
+        anomaly_score_df = self.pot_anomaly_detector.compute_anomaly_score(df=self.test_df)  # type: ignore
+
+        assert self.pot_anomaly_detector.t0 == 6
+        assert list(anomaly_score_df.index) == [6, 7, 8, 9]
+        assert (anomaly_score_df > 1.0).all().all()
+
+    def test_detect_anomaly_beyond_the_t1_quantile_of_the_tail(self):
+        anomaly_score_df = DataFrame(data={"anomaly_score_col_1": [0.0, 1.5, 30.0, 40.0]}, index=[6, 7, 8, 9])
+
+        anomaly_df = self.pot_anomaly_detector.detect_anomaly(anomaly_score_df)
+
+        assert list(anomaly_df.columns) == ["is_anomaly_col_1"]
+        assert list(anomaly_df.index) == [6, 7, 8, 9]
+        assert anomaly_df["is_anomaly_col_1"].tolist() == [False, False, False, True]
+        self.pot_anomaly_detector.t1_th = 1.0  # type: ignore
+        assert not self.pot_anomaly_detector.detect_anomaly(anomaly_score_df)["is_anomaly_col_1"].any()
+
+    def test_update_stream_after_initializing_on_t0_window(self):
+        self.pot_anomaly_detector.initialize_stream(df=self.test_df)  # type: ignore
+        batch = DataFrame(data={"col_1": [20, 1000], "col_2": [25, 1000], "col_3": [22, 1000]}, index=[10, 11])
+
+        is_anomaly_df = self.pot_anomaly_detector.update(batch=batch)  # type: ignore
+
+        assert self.pot_anomaly_detector.t0 == 6  # type: ignore
+        assert list(is_anomaly_df.columns) == ["is_anomaly_col_1", "is_anomaly_col_2", "is_anomaly_col_3"]
+        assert list(is_anomaly_df.index) == [10, 11]
+        assert not is_anomaly_df.loc[10].any()
+        assert is_anomaly_df.loc[11].all()
+
+    def test_update_stream_failed_caused_by_missing_initialization(self):
+        with self.assertRaises(ValueError):
+            self.pot_anomaly_detector.update(batch=self.test_df)  # type: ignore
+
+    def test_default_value_for_quantile_compression_attribute(self):
+        assert self.pot_anomaly_detector.quantile_compression == None  # type: ignore
+
+    def test_set_quantile_compression_failed_caused_by_non_positive_value(self):
+        with self.assertRaises(ValueError):
+            self.pot_anomaly_detector.quantile_compression = -1.0  # type: ignore
+
+    def test_get_approximate_pot_data_from_097_quantile_pot_th(self):
+        self.pot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        self.pot_anomaly_detector.quantile_compression = 1000.0  # type: ignore
+
+        pot_df = self.pot_anomaly_detector.compute_pot_data(df=self.test_df).to_dataframe()  # type: ignore
+        pot_df = pot_df.join(self.test_df)
+
+        assert set(self.pot_anomaly_detector.pot_rank_error.keys()) == {"col_1", "col_2", "col_3"}  # type: ignore
+        for feature in ["col_1", "col_2", "col_3"]:
+            assert (pot_df[f"pot_data_{feature}"] >= 0.0).all()
+            assert pot_df[f"pot_th_{feature}"].between(pot_df[feature].min(), pot_df[feature].max()).all()
+
+    def test_set_pot_window_failed_caused_by_non_positive_value(self):
+        with self.assertRaises(ValueError):
+            self.pot_anomaly_detector.pot_window = 0  # type: ignore
+
+    def test_get_pot_data_from_sliding_window_pot_th(self):
+        self.pot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        self.pot_anomaly_detector.pot_window = 3  # type: ignore
+
+        pot_df = self.pot_anomaly_detector.compute_pot_data(df=self.test_df).to_dataframe()  # type: ignore
+
+        assert pot_df["pot_th_col_1"].tolist() == [
+            59.4,
+            59.4,
+            59.4,
+            59.4,
+            59.4,
+            59.4,
+            59.4,
+            69.4,
+            79.4,
+            89.4,
+        ]
+
+    def test_default_value_for_n_jobs_attribute(self):
+        assert self.pot_anomaly_detector.n_jobs == 1  # type: ignore
+
+    def test_set_n_jobs_failed_caused_by_zero(self):
+        with self.assertRaises(ValueError):
+            self.pot_anomaly_detector.n_jobs = 0  # type: ignore
+
+    def test_get_pot_data_with_process_pool(self):
+        self.pot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        expected_df = self.pot_anomaly_detector.compute_pot_data(df=self.test_df).to_dataframe()  # type: ignore
+        self.pot_anomaly_detector.n_jobs = 2  # type: ignore
+
+        pot_df = self.pot_anomaly_detector.compute_pot_data(df=self.test_df).to_dataframe()  # type: ignore
+
+        assert pot_df.equals(expected_df)
+
+    def test_compute_anomaly_score_chunked_into_memory_mapped_files(self):
+        self.pot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        self.pot_anomaly_detector.pot_window = 3  # type: ignore
+        expected_df = self.pot_anomaly_detector.compute_pot_data(df=self.test_df).to_dataframe()  # type: ignore
+
+        with TemporaryDirectory() as output_dir:
+            pot_result = self.pot_anomaly_detector.compute_pot_data_chunked(  # type: ignore
+                source=self.test_df.to_numpy(dtype="float64"),
+                features=["col_1", "col_2", "col_3"],
+                output_dir=output_dir,
+                chunk_size=4,
+            )
+            anomaly_score = self.pot_anomaly_detector.compute_anomaly_score_chunked(  # type: ignore
+                source=self.test_df.to_numpy(dtype="float64"),
+                features=["col_1", "col_2", "col_3"],
+                output_dir=output_dir,
+                chunk_size=4,
+            )
+
+            assert pot_result.to_dataframe().equals(expected_df)
+            assert anomaly_score.shape == (4, 3)
+
+    def test_compute_anomaly_score_from_columnar_dataset(self):
+        self.pot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        expected_df = self.pot_anomaly_detector.compute_anomaly_score(df=self.test_df)  # type: ignore
+        dataset = ColumnarDataset(
+            features=["col_1", "col_2", "col_3"],
+            values=self.test_df.to_numpy(dtype="float64"),
+            index=self.test_df.index,
+        )
+
+        anomaly_score_df = self.pot_anomaly_detector.compute_anomaly_score(df=dataset)  # type: ignore
+
+        assert anomaly_score_df.equals(expected_df)
+
+    def test_compute_anomaly_score_batch_matches_single_series(self):
+        self.pot_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        expected_df = self.pot_anomaly_detector.compute_anomaly_score(df=self.test_df)  # type: ignore
+        long_df = self.test_df.melt(var_name="series_id").assign(ts=list(range(10)) * 3)
+
+        batch_result = self.pot_anomaly_detector.compute_anomaly_score_batch(series=long_df)  # type: ignore
+
+        assert batch_result.series_ids == ["col_1", "col_2", "col_3"]
+        assert batch_result.series_per_second > 0.0
+        for feature in ["col_1", "col_2", "col_3"]:
+            assert batch_result.get_anomaly_score(feature).tolist() == expected_df[f"anomaly_score_{feature}"].tolist()
+
     def tearDown(self) -> None:
         return super().tearDown()
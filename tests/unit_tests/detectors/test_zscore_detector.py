@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+from numpy import isclose, sqrt
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+from src.anomaly_detection.models.detectors.interface import AnomalyDetector
+from src.anomaly_detection.models.detectors.zscore import ZScoreAnomalyDetector
+
+
+class TestZScoreAnomalyDetector(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.zscore_anomaly_detector = get_detector("z_score")
+        self.test_df = DataFrame(
+            data={
+                "col_1": [10, 12, 10, 12, 10, 12, 10, 12, 10, 50],
+                "col_2": [15, 25, 35, 45, 55, 65, 75, 85, 95, 105],
+                "col_3": ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"],
+            }
+        )
+
+    def test_construct_zscore_anomaly_detector(self):
+        assert issubclass(type(self.zscore_anomaly_detector), AnomalyDetector)
+        assert isinstance(self.zscore_anomaly_detector, ZScoreAnomalyDetector)
+        assert str(self.zscore_anomaly_detector) == "Z-Score Anomaly Detector"
+
+    def test_default_value_for_z_threshold_and_window_attributes(self):
+        assert self.zscore_anomaly_detector.z_th == 3.0  # type: ignore
+        assert self.zscore_anomaly_detector.window == None  # type: ignore
+
+    def test_set_z_threshold_and_window_failed_caused_by_invalid_values(self):
+        with self.assertRaises(ValueError):
+            self.zscore_anomaly_detector.z_th = 0.0  # type: ignore
+        with self.assertRaises(ValueError):
+            self.zscore_anomaly_detector.window = 1  # type: ignore
+
+    def test_compute_anomaly_score_against_previous_rows(self):
+        self.zscore_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_score_df = self.zscore_anomaly_detector.compute_anomaly_score(self.test_df)
+
+        assert list(anomaly_score_df.columns) == ["anomaly_score_col_1", "anomaly_score_col_2"]
+        assert list(anomaly_score_df.index) == [6, 7, 8, 9]
+        # The last value of `col_1` against the mean 10.888... and std of the 9 values before it.
+        previous = self.test_df["col_1"].iloc[:9]
+        assert isclose(anomaly_score_df["anomaly_score_col_1"].iloc[-1], (50 - previous.mean()) / previous.std())
+        assert isclose(anomaly_score_df["anomaly_score_col_2"].iloc[0], (75 - 40) / (10 * sqrt(3.5)))
+
+    def test_compute_anomaly_score_with_rolling_window(self):
+        self.zscore_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        self.zscore_anomaly_detector.window = 2  # type: ignore
+
+        anomaly_score_df = self.zscore_anomaly_detector.compute_anomaly_score(self.test_df)
+
+        assert isclose(anomaly_score_df["anomaly_score_col_1"].iloc[-1], 39 / sqrt(2))
+
+    def test_detect_anomaly_from_anomaly_score(self):
+        self.zscore_anomaly_detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+
+        anomaly_df = self.zscore_anomaly_detector.detect_anomaly(
+            self.zscore_anomaly_detector.compute_anomaly_score(self.test_df)
+        )
+
+        assert anomaly_df["is_anomaly_col_1"].tolist() == [False, False, False, True]
+        assert not anomaly_df["is_anomaly_col_2"].any()
+
+    def test_update_stream_after_initializing_on_t0_window(self):
+        self.zscore_anomaly_detector.initialize_stream(df=self.test_df)  # type: ignore
+
+        anomaly_df = self.zscore_anomaly_detector.update(batch=self.test_df.iloc[6:])  # type: ignore
+
+        assert anomaly_df["is_anomaly_col_1"].tolist() == [False, False, False, True]
+        assert self.zscore_anomaly_detector.moments.count.tolist() == [10, 10]  # type: ignore
+
+    def test_update_stream_failed_caused_by_missing_initialization(self):
+        with self.assertRaises(ValueError):
+            self.zscore_anomaly_detector.update(batch=self.test_df)  # type: ignore
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,44 @@
+from copy import deepcopy
+from unittest import TestCase
+
+from tests.benchmarks.bench_scaling import bench_scaling, compare_with_baseline
+
+
+class TestBenchScaling(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_bench_scaling_records_every_step_and_skips_too_large_datasets(self):
+        result = bench_scaling(
+            cases=("compute_pot_data", "z_score"), total_rows=(1_000, 2_000), total_cols=(2,), max_cells=2_000
+        )
+
+        measured = [entry for entry in result["results"] if "skipped" not in entry]
+        assert [(entry["case"], entry["step"]) for entry in measured] == [
+            ("compute_pot_data", "compute_pot_data"),
+            ("z_score", "compute_anomaly_score"),
+            ("z_score", "detect_anomaly"),
+        ]
+        assert all(entry["rows_per_second"] > 0 and entry["peak_megabytes"] >= 0 for entry in measured)
+        assert [entry["total_rows"] for entry in result["results"] if "skipped" in entry] == [2_000, 2_000]
+
+    def test_compare_with_baseline_flags_only_regressions_beyond_tolerance(self):
+        baseline = bench_scaling(cases=("z_score",), total_rows=(1_000,), total_cols=(1,))
+        result = deepcopy(baseline)
+        result["results"][0]["seconds"] = baseline["results"][0]["seconds"] * 1.1
+        result["results"][1]["seconds"] = baseline["results"][1]["seconds"] * 2 + 1.0
+
+        regressions = compare_with_baseline(result=result, baseline=baseline, tolerance=0.25)
+
+        assert [(regression["step"], regression["metric"]) for regression in regressions] == [
+            ("detect_anomaly", "seconds")
+        ]
+
+    def test_compare_with_baseline_failed_caused_by_other_format_version(self):
+        baseline = bench_scaling(cases=("z_score",), total_rows=(1_000,), total_cols=(1,))
+
+        with self.assertRaises(ValueError):
+            compare_with_baseline(result=baseline, baseline={"format_version": 0, "results": []})
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from numpy import array_equal, isfinite, isneginf, isposinf, load, zeros
+from pandas import read_csv
+
+from tests.data_gen import DataGenerator, dataset_filename, gen_data
+
+
+class TestDataGenerator(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_data_generator_is_seeded_and_returns_ground_truth_anomalies(self):
+        generated_data = DataGenerator(
+            total_cols=3, total_rows=5_000, max_value=100, anomaly_percentage=0.02, seed=24
+        )()
+
+        assert generated_data.df.equals(
+            gen_data(total_cols=3, total_rows=5_000, max_value=100, anomaly_percentage=0.02, seed=24)
+        )
+        assert list(generated_data.df.columns) == ["col_1", "col_2", "col_3"]
+        for feature, anomaly_idx in generated_data.anomaly_idx.items():
+            assert anomaly_idx.shape == (100,)
+            is_anomaly = zeros(5_000, dtype=bool)
+            is_anomaly[anomaly_idx] = True
+            # Regular values are at most `max_value`, anomalies are drawn up to `max_value ** 2`.
+            assert generated_data.df[feature][~is_anomaly].between(0, 100).all()
+            assert (generated_data.df[feature][is_anomaly] > 100).mean() > 0.9
+
+    def test_data_generator_injects_infinities_into_negative_data(self):
+        generated_data = DataGenerator(
+            total_rows=1_000, anomaly_percentage=0.01, total_pos_inf=2, total_neg_inf=3, is_pos=False, seed=24
+        )()
+
+        assert (generated_data.df.dtypes == "float64").all()
+        # The sign of every value swaps, the infinities included.
+        assert (isneginf(generated_data.df).sum() == 2).all()
+        assert (isposinf(generated_data.df).sum() == 3).all()
+        values = generated_data.df.to_numpy()
+        assert (values[isfinite(values)] < 0).all()
+
+    def test_data_generator_writes_the_same_data_in_chunks(self):
+        data_generator = DataGenerator(total_rows=150_000, is_float=True, seed=24)
+        df = data_generator().df
+
+        with tempfile.TemporaryDirectory() as directory:
+            anomaly_idx = data_generator.write(path=os.path.join(directory, "data.npy"), chunk_size=40_000, n_jobs=2)
+            assert array_equal(load(os.path.join(directory, "data.npy")), df.to_numpy())
+            data_generator.write(path=os.path.join(directory, "data.csv"), chunk_size=70_000)
+            assert read_csv(os.path.join(directory, "data.csv"), float_precision="round_trip").equals(df)
+        assert anomaly_idx is data_generator.anomaly_idx
+
+    def test_data_generator_write_failed_caused_by_unknown_file_format(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                DataGenerator(total_rows=1_000, seed=24).write(path=os.path.join(directory, "data.parquet"))
+
+    def test_dataset_filename_matches_the_conftest_lookup(self):
+        filename = dataset_filename(
+            total_rows=1_000, max_value=10_000, anomaly_percentage=0.03, is_float=False, is_pos=False
+        )
+
+        assert all(part in filename for part in ("int", "row_1000_", "min_10000_", "anomaly_003"))
+
+    def tearDown(self) -> None:
+        return super().tearDown()
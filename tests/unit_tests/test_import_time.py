@@ -0,0 +1,17 @@
+from unittest import TestCase
+
+from tests.benchmarks.bench_import import bench_import, IMPORT_BUDGET_SECONDS
+
+
+class TestImportTime(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_cold_import_of_detecto_stays_lazy_and_within_budget(self):
+        result = bench_import(total_runs=3)
+
+        assert result["lazy_modules_loaded"] == []
+        assert result["import_seconds"] <= IMPORT_BUDGET_SECONDS
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,101 @@
+import os
+import tempfile
+from typing import Any
+from unittest import TestCase
+
+from numpy import array_equal, sort
+
+from tests.conftest import get_test_dataset, init_test_df
+from tests.data_gen import DataGenerator, dataset_filename
+
+
+class TestTestDatasets(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_init_test_df_builds_the_binary_block_once_and_maps_it(self):
+        with tempfile.TemporaryDirectory() as directory:
+            df = init_test_df(
+                dtype="float",
+                total_rows="row_1000_",
+                vals="min_1000_",
+                anomaly_percentage="anomaly_01",
+                directory=directory,
+            )
+            npy_path = (
+                os.path.join(
+                    directory,
+                    dataset_filename(
+                        total_rows=1000, max_value=1000, anomaly_percentage=0.1, is_float=True, is_pos=False
+                    ),
+                ).removesuffix(".csv")
+                + ".npy"
+            )
+
+            assert os.listdir(directory) == [os.path.basename(npy_path)]
+            assert df.shape == (1000, 2) and list(df.columns) == ["col_1", "col_2"]
+            assert (df.to_numpy() < 0).all()
+            modified_at = os.path.getmtime(npy_path)
+            df.iloc[0, 0] = 1.0
+            df_again = init_test_df(
+                dtype="float",
+                total_rows="row_1000_",
+                vals="min_1000_",
+                anomaly_percentage="anomaly_01",
+                directory=directory,
+            )
+            # Writes stay in the copy-on-write pages of the first frame.
+            assert df_again.iloc[0, 0] < 0
+            assert os.path.getmtime(npy_path) == modified_at
+            # The frames map the block, which has to be closed before Windows can remove the directory.
+            del df, df_again
+
+    def test_init_test_df_converts_an_existing_csv(self):
+        dataset: dict[str, Any] = {
+            "total_rows": 1000,
+            "max_value": 10_000,
+            "anomaly_percentage": 0.03,
+            "is_float": False,
+            "is_pos": True,
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            DataGenerator(total_cols=2, seed=7, **dataset).write(
+                path=os.path.join(directory, dataset_filename(**dataset))
+            )
+            df = init_test_df(
+                dtype="int",
+                total_rows="row_1000_",
+                vals="max_10000_",
+                anomaly_percentage="anomaly_003",
+                directory=directory,
+            )
+
+            assert df.equals(DataGenerator(total_cols=2, seed=7, **dataset)().df)
+            del df
+
+    def test_init_test_df_shuffles_every_column_with_a_seed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            kwargs: dict[str, Any] = {
+                "dtype": "int",
+                "total_rows": "row_1000_",
+                "vals": "max_1000_",
+                "anomaly_percentage": "anomaly_003",
+                "directory": directory,
+            }
+            df = init_test_df(**kwargs)
+            shuffled_df = init_test_df(is_shuffled=True, seed=1, **kwargs)
+
+            assert shuffled_df.equals(init_test_df(is_shuffled=True, seed=1, **kwargs))
+            assert not shuffled_df.equals(df)
+            for feature in df.columns:
+                assert array_equal(sort(shuffled_df[feature]), sort(df[feature]))
+            del df, shuffled_df
+
+    def test_get_test_dataset_failed_caused_by_unknown_dataset(self):
+        with self.assertRaises(ValueError):
+            get_test_dataset(
+                dtype="int", total_rows="row_5_", vals="max_1000_", anomaly_percentage="anomaly_003"  # type: ignore
+            )
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from numpy import arange, isnan
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.anomaly_detection.utils.batch import batch_pot_anomaly_score, group_by_length, pad_series, split_long_format
+from src.anomaly_detection.utils.math import compute_peak_over_threshold_block
+
+
+class TestBatch(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=10)
+        self.series = [rng.normal(size=length) for length in [120, 100, 40, 118, 35]]
+
+    def test_group_by_length_keeps_padding_bounded(self):
+        groups = group_by_length(lengths=[120, 100, 40, 118, 35], max_padding=0.25)
+
+        assert [group.tolist() for group in groups] == [[0, 3, 1], [2, 4]]
+
+    def test_group_by_length_respects_max_block_size(self):
+        groups = group_by_length(lengths=[10, 10, 10, 10], max_block_size=20)
+
+        assert [group.tolist() for group in groups] == [[0, 1], [2, 3]]
+
+    def test_pad_series_with_trailing_nan(self):
+        block = pad_series(series=[arange(3, dtype="float64"), arange(1, dtype="float64")])
+
+        assert block.shape == (3, 2)
+        assert block[:, 0].tolist() == [0.0, 1.0, 2.0]
+        assert block[0, 1] == 0.0 and isnan(block[1:, 1]).all()
+
+    def test_batch_pot_thresholds_match_every_series_on_its_own(self):
+        t0 = [int(0.6 * values.shape[0]) for values in self.series]
+        block = pad_series(series=self.series[:2])
+
+        _, pot_data, _ = compute_peak_over_threshold_block(values=block, min_period=t0[:2], quantile=0.97)
+
+        for idx in range(2):
+            _, expected, _ = compute_peak_over_threshold_block(
+                values=self.series[idx][:, None], min_period=t0[idx], quantile=0.97
+            )
+            assert (pot_data[: self.series[idx].shape[0], idx] == expected[:, 0]).all()
+
+    def test_batch_pot_anomaly_score_returns_rows_after_t0(self):
+        t0 = [int(0.6 * values.shape[0]) for values in self.series]
+
+        anomaly_scores = batch_pot_anomaly_score(series=self.series, t0=t0, quantile=0.9)
+
+        assert [anomaly_score.shape[0] for anomaly_score in anomaly_scores] == [48, 40, 16, 48, 14]
+        assert all((anomaly_score >= 0.0).all() for anomaly_score in anomaly_scores)
+
+    def test_split_long_format_orders_every_series_by_timestamp(self):
+        df = DataFrame({"series_id": ["b", "a", "b", "a"], "ts": [2, 1, 1, 0], "value": [4.0, 3.0, 2.0, 1.0]})
+
+        series_ids, timestamps, values = split_long_format(df=df)
+
+        assert series_ids == ["b", "a"]
+        assert [ts.tolist() for ts in timestamps] == [[1, 2], [0, 1]]
+        assert [series_values.tolist() for series_values in values] == [[2.0, 4.0], [1.0, 3.0]]
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,71 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import allclose, array_equal, memmap, nan, save
+from numpy.random import default_rng
+
+from src.anomaly_detection.utils.chunked import chunked_gpd_anomaly_score, chunked_peak_over_threshold
+from src.anomaly_detection.utils.gpd import fit_gpd
+from src.anomaly_detection.utils.math import compute_peak_over_threshold_block
+
+
+class TestChunkedPeakOverThreshold(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp_dir = TemporaryDirectory()
+        self.values = default_rng(seed=9).normal(size=(2000, 3))
+        self.values[::29, 0] = nan
+        self.values[:400, 2] = nan
+        self.source = os.path.join(self.tmp_dir.name, "values.npy")
+        save(self.source, self.values)
+
+    def test_chunked_sliding_window_pot_is_identical_to_in_memory(self):
+        expected = compute_peak_over_threshold_block(values=self.values, min_period=100, quantile=0.97, window=64)
+
+        result = chunked_peak_over_threshold(
+            source=self.source, output_dir=self.tmp_dir.name, min_period=100, quantile=0.97, window=64, chunk_size=150
+        )
+
+        assert isinstance(result[0], memmap)
+        for expected_array, result_array in zip(expected, result):
+            assert array_equal(expected_array, result_array, equal_nan=True)
+
+    def test_chunked_approximate_pot_is_identical_to_in_memory(self):
+        expected = compute_peak_over_threshold_block(
+            values=self.values, min_period=100, quantile=0.97, compression=200.0
+        )
+
+        result = chunked_peak_over_threshold(
+            source=self.source,
+            output_dir=self.tmp_dir.name,
+            min_period=100,
+            quantile=0.97,
+            compression=200.0,
+            chunk_size=333,
+        )
+
+        for expected_array, result_array in zip(expected, result):
+            assert array_equal(expected_array, result_array, equal_nan=True)
+
+    def test_chunked_gpd_anomaly_score_fits_on_calibration_rows(self):
+        _, pot_data, _ = compute_peak_over_threshold_block(values=self.values, min_period=100, quantile=0.9)
+        expected_shape, expected_scale = fit_gpd(exceedances=pot_data[:1200])
+
+        anomaly_score, shape, scale = chunked_gpd_anomaly_score(
+            pot_data=pot_data, output_dir=self.tmp_dir.name, calibration_rows=1200, chunk_size=250
+        )
+
+        assert anomaly_score.shape == (800, 3)
+        assert allclose(shape, expected_shape)
+        assert allclose(scale, expected_scale)
+
+    def test_chunked_pot_failed_caused_by_unbounded_exact_expanding_quantile(self):
+        with self.assertRaises(ValueError):
+            chunked_peak_over_threshold(
+                source=self.source, output_dir=self.tmp_dir.name, min_period=100, quantile=0.97
+            )
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        return super().tearDown()
@@ -0,0 +1,91 @@
+from unittest import TestCase
+
+from numpy import allclose, array, array_equal, column_stack, full, isfinite, isinf, isnan, nan, r_, stack
+from numpy.random import default_rng
+from scipy.stats import genextreme
+
+from src.anomaly_detection.utils.gev import block_maxima, fit_gev, gev_anomaly_score, gev_survival_probability
+
+
+class TestGEV(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=18)
+        # scipy's `c` is the negated shape.
+        self.shape = array([0.2, -0.2, 0.0, 0.1])
+        self.location = array([10.0, -3.0, 0.0, 100.0])
+        self.scale = array([2.0, 0.5, 1.0, 20.0])
+        self.maxima = stack(
+            [
+                genextreme.rvs(-shape, loc=location, scale=scale, size=300, random_state=rng)
+                for shape, location, scale in zip(self.shape, self.location, self.scale)
+            ],
+            axis=1,
+        )
+
+    def test_block_maxima_of_every_block(self):
+        values = array([[1.0, 5.0], [3.0, nan], [2.0, 4.0], [0.0, nan], [7.0, nan]])
+
+        maxima = block_maxima(values=values, block_size=2)
+
+        assert array_equal(maxima, [[3.0, 5.0], [2.0, 4.0], [7.0, nan]], equal_nan=True)
+
+    def test_fit_gev_is_at_least_as_likely_as_scipy(self):
+        shape, location, scale = fit_gev(maxima=self.maxima)
+
+        assert allclose(shape, self.shape, atol=0.1)
+        for idx in range(self.maxima.shape[1]):
+            scipy_parameters = genextreme.fit(self.maxima[:, idx])
+            scipy_log_likelihood = genextreme.logpdf(self.maxima[:, idx], *scipy_parameters).sum()
+            log_likelihood = genextreme.logpdf(self.maxima[:, idx], -shape[idx], location[idx], scale[idx]).sum()
+            assert log_likelihood >= scipy_log_likelihood - 1e-6 * abs(scipy_log_likelihood)
+
+    def test_fit_gev_of_too_few_or_constant_maxima(self):
+        maxima = column_stack((self.maxima[:, 0], full(300, 4.0), r_[1.0, 2.0, full(298, nan)]))
+
+        shape, location, scale = fit_gev(maxima=maxima)
+
+        assert not isnan([shape[0], location[0], scale[0]]).any()
+        assert isnan(shape[1:]).all() and isnan(scale[1:]).all()
+
+    def test_fit_gev_of_few_block_maxima_stays_within_the_bounds(self):
+        # Ten maxima of normal blocks, where the unbounded fit drifts below a shape of -1 or underflows the scale.
+        maxima = column_stack(
+            [
+                block_maxima(values=default_rng(seed).normal(size=(300, 1)), block_size=30)
+                for seed in (37, 177, 257, 263)
+            ]
+        )
+
+        shape, location, scale = fit_gev(maxima=maxima)
+
+        is_fitted = ~isnan(shape)
+        assert is_fitted[1:].all()
+        assert (shape[is_fitted] > -1.0).all() and isfinite(scale[is_fitted]).all() and (scale[is_fitted] > 0.0).all()
+        # A fit that does not converge leaves its column NaN.
+        assert isnan([location[0], scale[0]]).all()
+
+    def test_gev_survival_probability_and_anomaly_score(self):
+        values = array([[12.0, -2.0, 1.5, 150.0]])
+
+        survival = gev_survival_probability(values=values, shape=self.shape, location=self.location, scale=self.scale)
+
+        assert allclose(survival[0], genextreme.sf(values[0], -self.shape, self.location, self.scale))
+        assert allclose(
+            gev_anomaly_score(values=values, shape=self.shape, location=self.location, scale=self.scale), 1 / survival
+        )
+        # A value beyond the upper end point of a bounded (negative shape) GEV can never be exceeded.
+        assert isinf(
+            gev_anomaly_score(values=[[0.0]], shape=array([-0.5]), location=array([-3.0]), scale=array([0.5]))
+        ).all()
+
+    def test_block_maxima_failed_caused_by_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            block_maxima(values=self.maxima, block_size=0)
+        with self.assertRaises(ValueError):
+            block_maxima(values=self.maxima[:, 0], block_size=2)
+        with self.assertRaises(ValueError):
+            fit_gev(maxima=self.maxima[:, 0])
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from numpy import inf, isnan, zeros
+from numpy.random import default_rng
+from scipy.stats import genpareto
+
+from src.anomaly_detection.utils.gpd import fit_gpd, gpd_anomaly_score, gpd_survival_probability
+
+
+class TestGPDFitting(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.rng = default_rng(seed=42)
+        self.shapes = [-0.3, 0.0, 0.25, 0.6]
+        self.exceedances = zeros((2000, len(self.shapes)))
+        for idx, shape in enumerate(self.shapes):
+            rows = self.rng.choice(2000, size=150, replace=False)
+            self.exceedances[rows, idx] = genpareto.rvs(shape, scale=2.0, size=150, random_state=self.rng)
+
+    def test_fit_gpd_is_at_least_as_likely_as_scipy_fit(self):
+        shape, scale = fit_gpd(exceedances=self.exceedances)
+
+        for idx in range(len(self.shapes)):
+            y = self.exceedances[:, idx][self.exceedances[:, idx] > 0]
+            scipy_shape, _, scipy_scale = genpareto.fit(y, floc=0)
+            log_likelihood = genpareto.logpdf(y, shape[idx], 0, scale[idx]).sum()
+            scipy_log_likelihood = genpareto.logpdf(y, scipy_shape, 0, scipy_scale).sum()
+            assert log_likelihood >= scipy_log_likelihood - 1e-6 * abs(scipy_log_likelihood)
+
+    def test_fit_gpd_without_exceedances(self):
+        shape, scale = fit_gpd(exceedances=zeros((10, 2)))
+
+        assert isnan(shape).all()
+        assert isnan(scale).all()
+
+    def test_fit_gpd_failed_caused_by_1d_exceedances(self):
+        with self.assertRaises(ValueError):
+            fit_gpd(exceedances=zeros(10))
+
+    def test_gpd_survival_probability_and_anomaly_score(self):
+        exceedances = [[0.0, 0.0], [1.0, 1.0], [2.0, 5.0]]
+        shape, scale = [0.0, -0.5], [1.0, 2.0]
+
+        survival = gpd_survival_probability(exceedances=exceedances, shape=shape, scale=scale)
+        anomaly_score = gpd_anomaly_score(exceedances=exceedances, shape=shape, scale=scale)
+
+        assert survival[0].tolist() == [1.0, 1.0]
+        assert abs(survival[1, 0] - genpareto.sf(1.0, 0.0, scale=1.0)) < 1e-12
+        assert abs(survival[1, 1] - genpareto.sf(1.0, -0.5, scale=2.0)) < 1e-12
+        assert anomaly_score[0].tolist() == [0.0, 0.0]
+        assert abs(anomaly_score[2, 0] - 1 / genpareto.sf(2.0, 0.0, scale=1.0)) < 1e-9
+        assert anomaly_score[2, 1] == inf
+
+    def tearDown(self) -> None:
+        return super().tearDown()
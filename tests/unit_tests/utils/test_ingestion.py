@@ -0,0 +1,77 @@
+import os
+from importlib.util import find_spec
+from tempfile import TemporaryDirectory
+from unittest import skipUnless, TestCase
+from unittest.mock import patch
+
+from numpy import arange, isnan
+
+from src.anomaly_detection.utils.ingestion import ColumnarDataset, read_columnar
+
+HAS_PYARROW = find_spec("pyarrow") is not None
+
+
+class TestColumnarDataset(TestCase):
+    def test_construct_columnar_dataset_with_default_index(self):
+        dataset = ColumnarDataset(features=["col_1", "col_2"], values=arange(10, dtype="float64").reshape(5, 2))
+
+        assert len(dataset) == 5
+        assert dataset.index.tolist() == [0, 1, 2, 3, 4]
+
+    def test_construct_columnar_dataset_failed_caused_by_mismatched_features(self):
+        with self.assertRaises(ValueError):
+            ColumnarDataset(features=["col_1"], values=arange(10, dtype="float64").reshape(5, 2))
+
+    def test_read_columnar_failed_caused_by_missing_pyarrow(self):
+        # A `None` entry in `sys.modules` makes the import fail whether pyarrow is installed or not.
+        with patch.dict("sys.modules", {"pyarrow": None}), self.assertRaises(ImportError):
+            read_columnar(path="metrics.parquet")
+
+
+@skipUnless(HAS_PYARROW, "pyarrow is not installed")
+class TestReadColumnar(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        import pyarrow
+
+        self.pyarrow = pyarrow
+        self.tmp_dir = TemporaryDirectory()
+        self.table = pyarrow.table(
+            {
+                "host": ["a", "b", "c", "d"],
+                "col_1": pyarrow.array([1.0, 2.0, 3.0, 4.0], type=pyarrow.float64()),
+                "col_2": pyarrow.array([1, None, 3, 4], type=pyarrow.int64()),
+            }
+        )
+
+    def test_read_parquet_prunes_non_numeric_columns(self):
+        import pyarrow.parquet
+
+        path = os.path.join(self.tmp_dir.name, "metrics.parquet")
+        pyarrow.parquet.write_table(self.table, path)
+
+        dataset = read_columnar(path=path)
+
+        assert dataset.features == ["col_1", "col_2"]
+        assert dataset.values[:, 0].tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert isnan(dataset.values[1, 1])
+
+    def test_read_arrow_file_hands_over_single_float64_column_without_copy(self):
+        import pyarrow.ipc
+
+        path = os.path.join(self.tmp_dir.name, "metrics.arrow")
+        with pyarrow.ipc.new_file(path, self.table.schema) as writer:
+            writer.write_table(self.table)
+
+        dataset = read_columnar(path=path, features=["col_1"])
+
+        assert dataset.values[:, 0].tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert not dataset.values.flags.writeable
+
+    def test_read_columnar_failed_caused_by_unsupported_file_type(self):
+        with self.assertRaises(ValueError):
+            read_columnar(path=os.path.join(self.tmp_dir.name, "metrics.csv"))
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        return super().tearDown()
@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+from numpy import (
+    allclose,
+    array,
+    array_equal,
+    concatenate,
+    flatnonzero,
+    full,
+    inf,
+    isclose,
+    isnan,
+    log,
+    nan,
+    power,
+    quantile,
+)
+from numpy.random import default_rng, SeedSequence
+
+from src.anomaly_detection.utils.isolation import average_path_length, build_isolation_tree, IsolationForest
+
+
+class TestIsolationForest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=14)
+        self.values = rng.normal(size=(2000, 3))
+        self.outliers = full((5, 3), 8.0)
+
+    def test_average_path_length(self):
+        assert list(average_path_length([0, 1, 2])) == [0.0, 0.0, 1.0]
+        assert isclose(average_path_length(256), 2.0 * (log(255) + 0.5772156649015329) - 2.0 * 255 / 256)
+
+    def test_build_isolation_tree_into_flat_node_arrays(self):
+        sample = default_rng(seed=1).normal(size=(64, 2))
+
+        feature, split, left, size, depth = build_isolation_tree(sample=sample, max_depth=6, seed=SeedSequence(1))
+
+        is_leaf = isnan(split)
+        assert size[0] == 64
+        assert (left[is_leaf] == flatnonzero(is_leaf)).all()
+        # The two children of every split node hold all of its rows, one level deeper.
+        assert (size[left[~is_leaf]] + size[left[~is_leaf] + 1] == size[~is_leaf]).all()
+        assert (depth[left[~is_leaf]] == depth[~is_leaf] + 1).all()
+        assert size[is_leaf].sum() == 64
+
+    def test_isolation_forest_scores_outliers_higher(self):
+        forest = IsolationForest(seed=3).fit(values=self.values)
+
+        inlier_score = forest.score(values=self.values)
+        outlier_score = forest.score(values=self.outliers)
+
+        assert (outlier_score > 0.7).all()
+        assert outlier_score.min() > quantile(inlier_score, 0.99)
+
+    def test_isolation_forest_does_not_depend_on_n_jobs(self):
+        forest = IsolationForest(total_trees=8, seed=3).fit(values=self.values)
+        parallel_forest = IsolationForest(total_trees=8, seed=3).fit(values=self.values, n_jobs=2)
+
+        assert array_equal(forest.split, parallel_forest.split, equal_nan=True)
+        assert array_equal(forest.score(values=self.values), parallel_forest.score(values=self.values, n_jobs=2))
+
+    def test_single_feature_step_function_matches_tree_traversal(self):
+        forest = IsolationForest(seed=5).fit(values=self.values[:, :1])
+        values = concatenate((array([[-inf], [inf], [nan]]), forest.breakpoints[:10, None], self.values[:, :1]))
+
+        traversal = power(2.0, -forest._mean_path_length(chunk=values) / forest.c_sample_size)
+        traversal[2] = nan
+
+        assert allclose(forest.score(values=values), traversal, equal_nan=True)
+
+    def test_isolation_forest_failed_caused_by_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            IsolationForest(total_trees=0)
+        with self.assertRaises(ValueError):
+            IsolationForest().score(values=self.values)
+        with self.assertRaises(ValueError):
+            IsolationForest().fit(values=full((3, 2), nan))
+        with self.assertRaises(ValueError):
+            IsolationForest().fit(values=self.values).score(values=self.values[:, :2])
+
+    def tearDown(self) -> None:
+        return super().tearDown()
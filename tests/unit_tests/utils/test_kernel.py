@@ -0,0 +1,58 @@
+from unittest import TestCase
+
+from numpy import absolute, array_equal, exp, isnan, nan
+from numpy.random import default_rng
+
+from src.anomaly_detection.utils.kernel import OneClassSVM, RandomFourierFeatures
+
+
+class TestKernel(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=16)
+        self.values = rng.normal(size=(5000, 2))
+
+    def test_random_fourier_features_approximate_the_rbf_kernel(self):
+        features = RandomFourierFeatures(total_dimensions=2, total_components=20_000, gamma=0.5, seed=1)
+        points = self.values[:5]
+
+        components = features.transform(values=points)
+        kernel = exp(-0.5 * ((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+
+        assert components.shape == (5, 20_000)
+        assert absolute(components @ components.T - kernel).max() < 0.05
+
+    def test_one_class_svm_keeps_about_nu_of_the_training_rows_outside(self):
+        svm = OneClassSVM(nu=0.1, gamma=0.5, seed=2).fit(values=self.values)
+
+        share_outside = (svm.score(values=self.values) > 0).mean()
+
+        assert 0.02 < share_outside < 0.2
+
+    def test_one_class_svm_scores_outliers_outside(self):
+        svm = OneClassSVM(nu=0.05, gamma=0.5, seed=3).fit(values=self.values)
+
+        anomaly_score = svm.score(values=[[0.0, 0.0], [6.0, 6.0], [-5.0, 4.0], [nan, 0.0]])
+
+        assert anomaly_score[0] < 0
+        assert (anomaly_score[1:3] > 0).all()
+        assert isnan(anomaly_score[3])
+
+    def test_one_class_svm_is_reproducible_with_a_seed(self):
+        first = OneClassSVM(seed=4).fit(values=self.values).score(values=self.values)
+        second = OneClassSVM(seed=4).fit(values=self.values).score(values=self.values)
+
+        assert array_equal(first, second)
+
+    def test_one_class_svm_failed_caused_by_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            OneClassSVM(nu=0.0)
+        with self.assertRaises(ValueError):
+            OneClassSVM(batch_size=0)
+        with self.assertRaises(ValueError):
+            OneClassSVM().score(values=self.values)
+        with self.assertRaises(ValueError):
+            OneClassSVM().fit(values=self.values).score(values=self.values[:, :1])
+
+    def tearDown(self) -> None:
+        return super().tearDown()
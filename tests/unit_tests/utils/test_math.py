@@ -3,7 +3,11 @@ from unittest import TestCase
 from numpy import allclose
 from pandas import DataFrame
 
-from src.anomaly_detection.utils.math import calculate_peak_over_threshold, get_data_over_threshold
+from src.anomaly_detection.utils.math import (
+    calculate_peak_over_threshold,
+    compute_peak_over_threshold_block,
+    get_data_over_threshold,
+)
 
 
 class TestPOTCalculation(TestCase):
@@ -102,5 +106,41 @@ class TestPOTCalculation(TestCase):
         assert not pot_data_df["pot_data_col_2"].equals(expected_pot_data_df["pot_data_col_2"])
         assert not pot_data_df["pot_data_col_3"].equals(expected_pot_data_df["pot_data_col_3"])
 
+    def test_compute_peak_over_threshold_block_097_quantile(self):
+        expected_pot_th_df = DataFrame(
+            data={
+                "col_1": [58.5, 58.5, 58.5, 58.5, 58.5, 58.5, 58.5, 68.2, 77.9, 87.6],
+                "col_2": [63.5, 63.5, 63.5, 63.5, 63.5, 63.5, 63.5, 73.2, 82.9, 92.6],
+                "col_3": [60.5, 60.5, 60.5, 60.5, 60.5, 60.5, 60.5, 70.2, 79.9, 89.6],
+            }
+        )
+        expected_pot_data = [0.0, 0.0, 0.0, 0.0, 0.0, 1.5, 11.5, 11.8, 12.1, 12.4]
+
+        pot_th, pot_data, rank_error = compute_peak_over_threshold_block(
+            values=self.test_df[self.features].to_numpy(), min_period=6, quantile=0.97
+        )
+
+        assert allclose(pot_th, expected_pot_th_df.to_numpy())
+        for idx in range(len(self.features)):
+            assert allclose(pot_data[:, idx], expected_pot_data)
+        assert (rank_error == 0.0).all()
+        assert "pot_th_col_1" not in self.test_df.columns
+
+    def test_compute_peak_over_threshold_block_matches_dataframe_functions(self):
+        pot_th, pot_data, _ = compute_peak_over_threshold_block(
+            values=self.test_df[self.features].to_numpy(), min_period=6, quantile=0.5
+        )
+        pot_df = get_data_over_threshold(
+            df=calculate_peak_over_threshold(df=self.test_df, features=self.features, min_period=6, quantile=0.5),
+            features=self.features,
+        )
+
+        assert (pot_th == pot_df[[f"pot_th_{feature}" for feature in self.features]].to_numpy()).all()
+        assert (pot_data == pot_df[[f"pot_data_{feature}" for feature in self.features]].to_numpy()).all()
+
+    def test_compute_peak_over_threshold_block_failed_caused_by_1d_values(self):
+        with self.assertRaises(ValueError):
+            compute_peak_over_threshold_block(values=self.test_df["col_1"].to_numpy(), min_period=6, quantile=0.97)
+
     def tearDown(self) -> None:
         return super().tearDown()
@@ -0,0 +1,58 @@
+from unittest import TestCase
+
+from numpy import absolute, allclose, full, isnan, median as numpy_median, nan, ndarray, round as numpy_round, zeros
+from numpy.random import default_rng
+
+from src.anomaly_detection.utils.median import median_absolute_deviation
+
+
+def _brute_force(values: ndarray, window: int | None, min_period: int) -> tuple[ndarray, ndarray]:
+    expected_median = full(values.shape, nan)
+    expected_mad = full(values.shape, nan)
+    for row in range(values.shape[0]):
+        start = 0 if window is None else max(row + 1 - window, 0)
+        for col in range(values.shape[1]):
+            window_values = values[start : row + 1, col]
+            window_values = window_values[~isnan(window_values)]
+            if window_values.shape[0] >= min_period:
+                expected_median[row, col] = numpy_median(window_values)
+                expected_mad[row, col] = numpy_median(absolute(window_values - expected_median[row, col]))
+    return expected_median, expected_mad
+
+
+class TestMedianAbsoluteDeviation(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        generator = default_rng(seed=7)
+        self.values = numpy_round(generator.standard_normal(size=(300, 3)) * 10, 1)
+        self.values[generator.random(size=self.values.shape) < 0.05] = nan
+
+    def test_expanding_median_absolute_deviation_matches_brute_force(self):
+        median, mad = median_absolute_deviation(values=self.values, min_period=3)
+        expected_median, expected_mad = _brute_force(values=self.values, window=None, min_period=3)
+
+        assert allclose(median, expected_median, equal_nan=True)
+        assert allclose(mad, expected_mad, equal_nan=True)
+
+    def test_rolling_median_absolute_deviation_matches_brute_force(self):
+        for window in (1, 2, 7, 50):
+            median, mad = median_absolute_deviation(values=self.values, window=window)
+            expected_median, expected_mad = _brute_force(values=self.values, window=window, min_period=1)
+
+            assert allclose(median, expected_median, equal_nan=True)
+            assert allclose(mad, expected_mad, equal_nan=True)
+
+    def test_median_absolute_deviation_of_1d_values(self):
+        median, mad = median_absolute_deviation(values=[1.0, 2.0, 3.0, 4.0, 100.0], window=3)
+
+        assert list(median) == [1.0, 1.5, 2.0, 3.0, 4.0]
+        assert list(mad) == [0.0, 0.5, 1.0, 1.0, 1.0]
+
+    def test_median_absolute_deviation_failed_caused_by_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            median_absolute_deviation(values=self.values, window=0)
+        with self.assertRaises(ValueError):
+            median_absolute_deviation(values=zeros((2, 2, 2)))
+
+    def tearDown(self) -> None:
+        return super().tearDown()
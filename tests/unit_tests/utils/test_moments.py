@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+from numpy import array_equal, concatenate, full, isinf, isnan, nan, nanmax
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.anomaly_detection.utils.moments import (
+    absolute_z_score,
+    compensated_cumsum,
+    expanding_mean_std,
+    rolling_mean_std,
+    RunningMoments,
+)
+
+
+class TestMoments(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=12)
+        self.values = rng.normal(loc=100.0, scale=5.0, size=(3000, 3))
+        self.values[rng.random(size=self.values.shape) < 0.1] = nan
+        self.df = DataFrame(self.values)
+
+    def test_compensated_cumsum_does_not_drift_on_long_series(self):
+        values = full((1_000_000, 1), 0.1)
+
+        result = compensated_cumsum(block=values)
+
+        assert abs(result[-1, 0] - 100_000.0) < 1e-9
+        assert abs(result[499_999, 0] - 50_000.0) < 1e-9
+
+    def test_expanding_mean_std_matches_pandas(self):
+        mean, std = expanding_mean_std(values=self.values, min_period=2)
+        expected_mean = self.df.expanding(min_periods=2).mean().to_numpy()
+        expected_std = self.df.expanding(min_periods=2).std().to_numpy()
+
+        assert array_equal(isnan(mean), isnan(expected_mean))
+        assert array_equal(isnan(std), isnan(expected_std))
+        assert nanmax(abs(mean - expected_mean)) < 1e-10
+        assert nanmax(abs(std - expected_std)) < 1e-10
+
+    def test_rolling_mean_std_matches_pandas(self):
+        mean, std = rolling_mean_std(values=self.values, window=20, min_period=2)
+
+        assert array_equal(mean, self.df.rolling(20, min_periods=2).mean().to_numpy(), equal_nan=True)
+        assert array_equal(std, self.df.rolling(20, min_periods=2).std().to_numpy(), equal_nan=True)
+
+    def test_running_moments_batches_give_moments_before_every_row(self):
+        moments = RunningMoments(total_features=3)
+
+        batches = [moments.update(values=self.values[start : start + 333]) for start in range(0, 3000, 333)]
+        mean = concatenate([batch[0] for batch in batches])
+        std = concatenate([batch[1] for batch in batches])
+        expected_mean = self.df.expanding(min_periods=1).mean().shift().to_numpy()
+        expected_std = self.df.expanding(min_periods=2).std().shift().to_numpy()
+
+        assert array_equal(isnan(mean), isnan(expected_mean))
+        assert array_equal(isnan(std), isnan(expected_std))
+        assert nanmax(abs(mean - expected_mean)) < 1e-10
+        assert nanmax(abs(std - expected_std)) < 1e-10
+        assert moments.count.tolist() == (~isnan(self.values)).sum(axis=0).tolist()
+
+    def test_running_moments_single_rows_match_batches(self):
+        moments = RunningMoments(total_features=3)
+        moments.update(values=self.values[:1000])
+
+        rows = [moments.update(values=self.values[idx : idx + 1]) for idx in range(1000, 1300)]
+        mean = concatenate([row[0] for row in rows])
+        std = concatenate([row[1] for row in rows])
+        expected_mean = self.df.expanding(min_periods=1).mean().shift().to_numpy()[1000:1300]
+        expected_std = self.df.expanding(min_periods=2).std().shift().to_numpy()[1000:1300]
+
+        assert nanmax(abs(mean - expected_mean)) < 1e-10
+        assert nanmax(abs(std - expected_std)) < 1e-10
+        assert moments.count.tolist() == (~isnan(self.values[:1300])).sum(axis=0).tolist()
+
+    def test_running_moments_failed_caused_by_wrong_number_of_features(self):
+        with self.assertRaises(ValueError):
+            RunningMoments(total_features=2).update(values=self.values)
+
+    def test_absolute_z_score_of_constant_history(self):
+        z_score = absolute_z_score(values=[1.0, 2.0], mean=[1.0, 1.0], std=[0.0, 0.0])
+
+        assert z_score[0] == 0.0
+        assert isinf(z_score[1])
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+from numpy import allclose, array_equal, full, inf, isinf, nan, ndarray, round as numpy_round, sqrt, where, zeros
+from numpy.random import default_rng
+
+from src.anomaly_detection.utils.neighbors import dbscan_core_distance, is_core_point, nearest_distance
+
+
+def _brute_force_core_distance(points: ndarray, eps: float, min_samples: int) -> ndarray:
+    distance = sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+    is_core = (distance <= eps).sum(axis=1) >= min_samples
+    if not is_core.any():
+        return full(points.shape[0], inf)
+    return where(is_core, 0.0, distance[:, is_core].min(axis=1))
+
+
+class TestNeighbors(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=15)
+        self.points = numpy_round(rng.normal(size=(400, 3)), 1)
+
+    def test_is_core_point_matches_brute_force(self):
+        for total_dimensions in (1, 2, 3):
+            points = self.points[:, :total_dimensions]
+            distance = sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+
+            # Rounded points put many neighbors exactly on the boundary, which belongs to the neighborhood.
+            assert array_equal(
+                is_core_point(points=points, eps=0.3, min_samples=6), (distance <= 0.3).sum(axis=1) >= 6
+            )
+
+    def test_nearest_distance_matches_brute_force(self):
+        for total_dimensions in (1, 3):
+            points = self.points[:200, :total_dimensions]
+            references = self.points[200:, :total_dimensions]
+            distance = sqrt(((points[:, None, :] - references[None, :, :]) ** 2).sum(axis=2))
+
+            assert allclose(nearest_distance(points=points, references=references), distance.min(axis=1))
+        assert isinf(nearest_distance(points=[1.0, 2.0], references=zeros(0))).all()
+
+    def test_dbscan_core_distance_matches_brute_force(self):
+        for total_dimensions in (1, 2):
+            points = self.points[:, :total_dimensions]
+
+            assert allclose(
+                dbscan_core_distance(points=points, eps=0.25, min_samples=4),
+                _brute_force_core_distance(points=points, eps=0.25, min_samples=4),
+            )
+
+    def test_dbscan_core_distance_of_points_with_nan(self):
+        core_distance = dbscan_core_distance(points=[1.0, 1.1, nan, 1.2, 5.0], eps=0.15, min_samples=2)
+
+        assert allclose(core_distance, [0.0, 0.0, nan, 0.0, 3.8], equal_nan=True)
+
+    def test_dbscan_core_distance_failed_caused_by_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            dbscan_core_distance(points=self.points, eps=0.0, min_samples=4)
+        with self.assertRaises(ValueError):
+            dbscan_core_distance(points=self.points, eps=0.5, min_samples=0)
+        with self.assertRaises(ValueError):
+            dbscan_core_distance(points=zeros((2, 2, 2)), eps=0.5, min_samples=4)
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from numpy import arange, float32, float64, full, isnan, median as numpy_median, nan, sin, stack
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.random import default_rng
+
+from src.anomaly_detection.utils.network import DenseAutoencoder
+
+
+class TestDenseAutoencoder(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=17)
+        series = sin(arange(5000) / 10) + 0.1 * rng.normal(size=5000)
+        self.windows = sliding_window_view(series, window_shape=16)
+
+    def test_dense_autoencoder_has_float32_weights(self):
+        autoencoder = DenseAutoencoder(layer_sizes=[16, 8, 4, 8, 16], seed=1)
+
+        assert [weight.shape for weight in autoencoder.weights] == [(16, 8), (8, 4), (4, 8), (8, 16)]
+        assert all(weight.dtype == float32 for weight in autoencoder.weights + autoencoder.biases)
+
+    def test_dense_autoencoder_learns_to_reconstruct_the_windows(self):
+        autoencoder = DenseAutoencoder(layer_sizes=[16, 8, 4, 8, 16], learning_rate=1e-2, seed=1)
+
+        losses = autoencoder.fit(inputs=self.windows, total_epochs=10)
+
+        assert losses[-1] < 0.1 * losses[0]
+        assert autoencoder.weights[0].dtype == float32
+        assert numpy_median(autoencoder.reconstruction_error(inputs=self.windows)) < 0.05
+
+    def test_reconstruction_error_is_high_for_an_unusual_window(self):
+        autoencoder = DenseAutoencoder(layer_sizes=[16, 8, 4, 8, 16], learning_rate=1e-2, seed=2)
+        autoencoder.fit(inputs=self.windows, total_epochs=10)
+        unusual_window = self.windows[100].copy()
+        unusual_window[8] += 3.0
+
+        error = autoencoder.reconstruction_error(inputs=stack((self.windows[100], unusual_window, full(16, nan))))
+
+        assert error.dtype == float64
+        assert error[1] > 10 * error[0]
+        assert isnan(error[2])
+
+    def test_dense_autoencoder_failed_caused_by_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            DenseAutoencoder(layer_sizes=[16, 4, 8])
+        with self.assertRaises(ValueError):
+            DenseAutoencoder(layer_sizes=[16, 4, 16]).fit(inputs=self.windows[:, :8])
+        with self.assertRaises(ValueError):
+            DenseAutoencoder(layer_sizes=[16, 4, 16]).fit(inputs=full((4, 16), nan))
+        with self.assertRaises(ValueError):
+            DenseAutoencoder(layer_sizes=[16, 4, 16]).reconstruction_error(inputs=self.windows[:, :8])
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from numpy import array_equal, nan
+from numpy.random import default_rng
+
+from src.anomaly_detection.utils.math import compute_peak_over_threshold_block
+from src.anomaly_detection.utils.parallel import parallel_peak_over_threshold_block, resolve_n_jobs
+
+
+class TestParallelPeakOverThreshold(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.values = default_rng(seed=8).normal(size=(500, 5))
+        self.values[::37, 2] = nan
+
+    def test_parallel_pot_block_is_identical_to_single_process(self):
+        expected = compute_peak_over_threshold_block(values=self.values, min_period=50, quantile=0.97)
+
+        result = parallel_peak_over_threshold_block(values=self.values, min_period=50, quantile=0.97, n_jobs=2)
+
+        for expected_array, result_array in zip(expected, result):
+            assert array_equal(expected_array, result_array, equal_nan=True)
+        assert result[0].flags.c_contiguous
+
+    def test_parallel_pot_block_with_more_jobs_than_features(self):
+        expected = compute_peak_over_threshold_block(values=self.values[:, :2], min_period=50, quantile=0.9, window=40)
+
+        result = parallel_peak_over_threshold_block(
+            values=self.values[:, :2], min_period=50, quantile=0.9, window=40, n_jobs=8
+        )
+
+        for expected_array, result_array in zip(expected, result):
+            assert array_equal(expected_array, result_array, equal_nan=True)
+
+    def test_resolve_n_jobs(self):
+        assert resolve_n_jobs(n_jobs=3) == 3
+        assert resolve_n_jobs(n_jobs=-1) >= 1
+        with self.assertRaises(ValueError):
+            resolve_n_jobs(n_jobs=0)
+
+    def tearDown(self) -> None:
+        return super().tearDown()
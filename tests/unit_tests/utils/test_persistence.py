@@ -0,0 +1,142 @@
+import json
+import mmap
+import os
+import tempfile
+import zipfile
+from unittest import TestCase
+
+from numpy import arange, array_equal, frombuffer, load, ndarray, savez, uint8
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.anomaly_detection.detecto import get_detector
+from src.anomaly_detection.models.detectors.isolation_forest import IsoForestAnomalyDetector
+from src.anomaly_detection.models.detectors.mad import MADAnomalyDetector
+from src.anomaly_detection.utils.isolation import IsolationForest
+from src.anomaly_detection.utils.persistence import FORMAT_VERSION, load_detector, METADATA_KEY, save_detector
+
+
+def is_memory_mapped(array: ndarray) -> bool:
+    base = array.base
+    while base is not None and not isinstance(base, mmap.mmap):
+        base = getattr(base, "base", None)
+    return base is not None
+
+
+class TestPersistence(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "detector.npz")
+        rng = default_rng(seed=20)
+        self.test_df = DataFrame(data={"col_1": rng.normal(size=300), "col_2": rng.gumbel(size=300)})
+
+    def test_every_detector_scores_the_same_after_save_and_load(self):
+        for detector_name in [
+            "autoencoder",
+            "block_maxima",
+            "box_plot",
+            "dbscan",
+            "iso_forest",
+            "mad",
+            "1_class_svm",
+            "pot",
+            "z_score",
+        ]:
+            detector = get_detector(detector_name)  # type: ignore
+            detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+            if hasattr(detector, "seed"):
+                detector.seed = 20  # type: ignore
+            anomaly_score_df = detector.compute_anomaly_score(self.test_df)
+
+            detector.save(path=self.path)
+            loaded_detector = type(detector).load(path=self.path)
+
+            assert vars(loaded_detector).keys() == vars(detector).keys()
+            assert str(loaded_detector) == str(detector)
+            assert loaded_detector.compute_anomaly_score(self.test_df).equals(anomaly_score_df), detector_name
+            # Windows can not replace a bundle that is still memory-mapped.
+            del loaded_detector
+
+    def test_loaded_stream_continues_like_the_saved_one(self):
+        for detector_name in ["pot", "z_score"]:
+            detector = get_detector(detector_name)  # type: ignore
+            detector.initialize_stream(self.test_df.iloc[:200])  # type: ignore
+            detector.save(path=self.path)
+            loaded_detector = type(detector).load(path=self.path)
+
+            for start in range(200, 300, 25):
+                batch = self.test_df.iloc[start : start + 25]
+                assert loaded_detector.update(batch).equals(detector.update(batch))  # type: ignore
+            del loaded_detector
+
+    def test_fitted_models_are_stacked_memory_mapped_and_built_on_access(self):
+        detector = IsoForestAnomalyDetector()
+        forest = IsolationForest(total_trees=5, sample_size=8, seed=20).fit(values=arange(16.0)[:, None])
+        detector.forests = {f"feature_{idx}": forest for idx in range(50)}
+
+        detector.save(path=self.path)
+        loaded_detector = IsoForestAnomalyDetector.load(path=self.path)
+
+        with zipfile.ZipFile(self.path) as bundle:
+            # Every forest attribute of all 50 features is one stacked array, not 50 members.
+            assert len(bundle.namelist()) < 50
+        assert len(loaded_detector.forests) == 50
+        loaded_forest = loaded_detector.forests["feature_49"]
+        assert is_memory_mapped(loaded_forest.split)
+        assert array_equal(loaded_forest.split, forest.split, equal_nan=True)
+        assert array_equal(loaded_forest.score(values=[[-5.0], [7.5]]), forest.score(values=[[-5.0], [7.5]]))
+        del loaded_detector, loaded_forest
+
+    def test_load_without_mmap_reads_the_arrays(self):
+        detector = get_detector("block_maxima")
+        detector.set_timeframe(total_rows=self.test_df.shape[0])  # type: ignore
+        detector.compute_anomaly_score(self.test_df)
+        save_detector(path=self.path, detector=detector)
+
+        loaded_detector = load_detector(path=self.path, mmap=False)
+
+        assert not is_memory_mapped(loaded_detector.gev_shape)
+        assert array_equal(loaded_detector.gev_shape, detector.gev_shape)  # type: ignore
+
+    def test_load_failed_caused_by_another_detector_or_format_version(self):
+        get_detector("mad").save(path=self.path)
+        with self.assertRaises(ValueError):
+            # The raised error keeps the mapped arrays alive, and the bundle is rewritten below.
+            IsoForestAnomalyDetector.load(path=self.path, mmap=False)
+
+        with load(self.path) as bundle:
+            arrays = {key: bundle[key] for key in bundle.files}
+        metadata = json.loads(bytes(arrays[METADATA_KEY]).decode())
+        metadata["format_version"] = FORMAT_VERSION + 1
+        arrays[METADATA_KEY] = frombuffer(json.dumps(metadata).encode(), dtype=uint8)
+        with open(self.path, "wb") as file:
+            savez(file, **arrays)
+        with self.assertRaises(ValueError):
+            MADAnomalyDetector.load(path=self.path)
+
+    def test_load_failed_caused_by_class_outside_the_package(self):
+        for class_path in [
+            "src.anomaly_detection.utils.persistence:zipfile.ZipFile",
+            "src.anomaly_detection.utils.persistence:Mapping",
+            "src.anomaly_detection.utils.persistence:save_detector",
+            "zipfile:ZipFile",
+        ]:
+            metadata = {
+                "format_version": FORMAT_VERSION,
+                "detector": {"kind": "object", "class": class_path, "state": {}},
+            }
+            with open(self.path, "wb") as file:
+                savez(file, **{METADATA_KEY: frombuffer(json.dumps(metadata).encode(), dtype=uint8)})
+            with self.assertRaises(ValueError):
+                load_detector(path=self.path, mmap=False)
+
+    def test_save_failed_caused_by_unsupported_state(self):
+        detector = IsoForestAnomalyDetector()
+        detector.forests = {1: IsolationForest()}  # type: ignore
+        with self.assertRaises(ValueError):
+            detector.save(path=self.path)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        return super().tearDown()
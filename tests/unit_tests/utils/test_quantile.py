@@ -0,0 +1,190 @@
+from unittest import TestCase
+
+from numpy import array, array_equal, isnan, nan, nanmax, searchsorted, sort
+from numpy.random import default_rng
+from pandas import Series
+
+from src.anomaly_detection.utils.quantile import (
+    expanding_quantile,
+    quartiles,
+    rolling_quantile,
+    streaming_quantile,
+    TDigest,
+)
+
+
+def pandas_expanding_quantile(values, quantile: float, min_period: int):
+    return (
+        Series(values, dtype="float64")
+        .expanding(min_periods=min_period)
+        .apply(lambda x: Series(x).quantile(quantile), raw=True)
+        .to_numpy()
+    )
+
+
+class TestExpandingQuantile(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.rng = default_rng(seed=42)
+
+    def test_expanding_quantile_097_quantile(self):
+        values = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+        expected = array([nan, nan, nan, nan, nan, 58.5, 68.2, 77.9, 87.6, 97.3])
+
+        result = expanding_quantile(values=values, quantile=0.97, min_period=6)
+
+        assert array_equal(result.round(2), expected, equal_nan=True)
+
+    def test_expanding_quantile_is_bit_identical_to_pandas(self):
+        for quantile in [0.0, 0.25, 0.5, 0.97, 1.0]:
+            values = self.rng.normal(size=500)
+            assert array_equal(
+                expanding_quantile(values=values, quantile=quantile, min_period=10),
+                pandas_expanding_quantile(values=values, quantile=quantile, min_period=10),
+                equal_nan=True,
+            )
+
+    def test_expanding_quantile_with_ties_and_nan(self):
+        values = self.rng.integers(0, 10, size=300).astype("float64")
+        values[self.rng.random(size=300) < 0.2] = nan
+
+        assert array_equal(
+            expanding_quantile(values=values, quantile=0.97, min_period=5),
+            pandas_expanding_quantile(values=values, quantile=0.97, min_period=5),
+            equal_nan=True,
+        )
+
+    def test_expanding_quantile_with_min_period_above_total_rows(self):
+        result = expanding_quantile(values=[1.0, 2.0, 3.0], quantile=0.5, min_period=4)
+
+        assert array_equal(result, array([nan, nan, nan]), equal_nan=True)
+
+    def test_expanding_quantile_of_2d_block_matches_every_column(self):
+        values = self.rng.normal(size=(200, 7))
+        values[self.rng.random(size=(200, 7)) < 0.1] = nan
+
+        result = expanding_quantile(values=values, quantile=0.97, min_period=20)
+
+        assert result.shape == values.shape
+        for idx in range(values.shape[1]):
+            assert array_equal(
+                result[:, idx],
+                pandas_expanding_quantile(values=values[:, idx], quantile=0.97, min_period=20),
+                equal_nan=True,
+            )
+
+    def test_expanding_quantile_failed_caused_by_3d_values(self):
+        with self.assertRaises(ValueError):
+            expanding_quantile(values=[[[1.0, 2.0], [3.0, 4.0]]], quantile=0.5, min_period=1)
+
+    def tearDown(self) -> None:
+        return super().tearDown()
+
+
+class TestRollingQuantile(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.rng = default_rng(seed=11)
+
+    def test_rolling_quantile_matches_quantile_of_every_window(self):
+        values = self.rng.normal(size=(300, 3))
+        values[self.rng.random(size=(300, 3)) < 0.05] = nan
+
+        result = rolling_quantile(values=values, quantile=0.97, window=25, min_period=10)
+
+        assert result.shape == values.shape
+        for idx in range(values.shape[1]):
+            total_valid = (~isnan(values[:, idx])).cumsum()
+            for row in range(values.shape[0]):
+                if total_valid[row] < 10:
+                    assert isnan(result[row, idx])
+                else:
+                    expected = Series(values[max(row - 24, 0) : row + 1, idx]).quantile(0.97)
+                    assert abs(result[row, idx] - expected) <= 1e-12 * max(abs(expected), 1.0)
+
+    def test_rolling_quantile_forgets_values_outside_the_window(self):
+        result = rolling_quantile(values=[100.0, 1.0, 2.0, 3.0], quantile=1.0, window=2, min_period=1)
+
+        assert result.tolist() == [100.0, 100.0, 2.0, 3.0]
+
+    def test_rolling_quantile_failed_caused_by_non_positive_window(self):
+        with self.assertRaises(ValueError):
+            rolling_quantile(values=[1.0, 2.0], quantile=0.5, window=0, min_period=1)
+
+    def tearDown(self) -> None:
+        return super().tearDown()
+
+
+class TestQuartiles(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.rng = default_rng(seed=19)
+        self.values = self.rng.normal(size=(150, 4))
+        self.values[self.rng.random(size=(150, 4)) < 0.1] = nan
+
+    def test_expanding_quartiles_match_expanding_quantile(self):
+        q1, q3 = quartiles(values=self.values, window=None, min_period=5)
+
+        assert array_equal(q1, expanding_quantile(values=self.values, quantile=0.25, min_period=5), equal_nan=True)
+        assert array_equal(q3, expanding_quantile(values=self.values, quantile=0.75, min_period=5), equal_nan=True)
+
+    def test_rolling_quartiles_match_rolling_quantile(self):
+        q1, q3 = quartiles(values=self.values[:, 0], window=10, min_period=5)
+
+        assert q1.shape == (150,)
+        assert array_equal(
+            q1, rolling_quantile(values=self.values[:, 0], quantile=0.25, window=10, min_period=5), equal_nan=True
+        )
+        assert array_equal(
+            q3, rolling_quantile(values=self.values[:, 0], quantile=0.75, window=10, min_period=5), equal_nan=True
+        )
+
+    def test_quartiles_failed_caused_by_3d_values(self):
+        with self.assertRaises(ValueError):
+            quartiles(values=[[[1.0, 2.0], [3.0, 4.0]]], window=None, min_period=1)
+
+    def tearDown(self) -> None:
+        return super().tearDown()
+
+
+class TestTDigest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.rng = default_rng(seed=42)
+        self.values = self.rng.exponential(size=100_000)
+
+    def test_tdigest_rank_error_holds_for_tail_quantiles(self):
+        digest = TDigest(compression=1000.0)
+        for chunk in self.values.reshape(100, -1):
+            digest.update(chunk)
+        sorted_values = sort(self.values)
+
+        for quantile in [0.5, 0.9, 0.97, 0.99]:
+            estimate = digest.quantile(quantile)
+            lowest_rank = float(searchsorted(sorted_values, estimate, side="left")) / sorted_values.shape[0]
+            highest_rank = float(searchsorted(sorted_values, estimate, side="right")) / sorted_values.shape[0]
+            assert max(0.0, lowest_rank - quantile, quantile - highest_rank) <= digest.rank_error(quantile)
+        assert digest.rank_error(0.97) < digest.rank_error(0.5)
+
+    def test_tdigest_memory_is_bounded_by_compression(self):
+        digest = TDigest(compression=100.0)
+        for chunk in self.values.reshape(1000, -1):
+            digest.update(chunk)
+
+        assert digest.count == 100_000
+        assert digest.nbytes <= 2 * 8 * (100 // 2 + 2)
+
+    def test_tdigest_failed_caused_by_non_positive_compression(self):
+        with self.assertRaises(ValueError):
+            TDigest(compression=0.0)
+
+    def test_streaming_quantile_stays_within_reported_rank_error(self):
+        exact = expanding_quantile(values=self.values, quantile=0.97, min_period=50_000)
+        estimate, rank_error = streaming_quantile(values=self.values, quantile=0.97, min_period=50_000, block_size=128)
+
+        assert array_equal(isnan(estimate), isnan(exact))
+        assert nanmax(rank_error) < 0.01
+        assert nanmax(abs(estimate - exact) / exact) < 0.01
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,58 @@
+from unittest import TestCase
+
+from numpy import arange, zeros
+from pandas import RangeIndex
+
+from src.anomaly_detection.utils.results import BatchResult, POTResult
+
+
+class TestPOTResult(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.pot_result = POTResult(
+            features=["col_1", "col_2"],
+            index=RangeIndex(start=0, stop=5),
+            pot_th=arange(10, dtype="float64").reshape(5, 2),
+            pot_data=zeros((5, 2)),
+            rank_error=zeros(2),
+        )
+
+    def test_get_pot_th_and_pot_data_by_feature(self):
+        assert self.pot_result.get_pot_th("col_2").tolist() == [1.0, 3.0, 5.0, 7.0, 9.0]
+        assert self.pot_result.get_pot_data("col_1").tolist() == [0.0] * 5
+        assert len(self.pot_result) == 5
+        assert self.pot_result.nbytes == 2 * 5 * 2 * 8 + 2 * 8
+
+    def test_to_dataframe_is_built_once(self):
+        pot_df = self.pot_result.to_dataframe()
+
+        assert list(pot_df.columns) == ["pot_th_col_1", "pot_th_col_2", "pot_data_col_1", "pot_data_col_2"]
+        assert pot_df["pot_th_col_1"].tolist() == [0.0, 2.0, 4.0, 6.0, 8.0]
+        assert self.pot_result.to_dataframe() is pot_df
+
+    def test_construct_pot_result_failed_caused_by_mismatched_shape(self):
+        with self.assertRaises(ValueError):
+            POTResult(
+                features=["col_1"],
+                index=RangeIndex(start=0, stop=5),
+                pot_th=zeros((5, 2)),
+                pot_data=zeros((5, 2)),
+                rank_error=zeros(2),
+            )
+
+    def tearDown(self) -> None:
+        return super().tearDown()
+
+
+class TestBatchResult(TestCase):
+    def test_batch_result_to_long_format_dataframe(self):
+        batch_result = BatchResult(
+            series_ids=["a", "b"],
+            timestamps=[arange(2), arange(1)],
+            anomaly_scores=[zeros(2), zeros(1) + 5.0],
+            total_seconds=0.5,
+        )
+
+        assert batch_result.series_per_second == 4.0
+        assert batch_result.get_anomaly_score("b").tolist() == [5.0]
+        assert batch_result.to_dataframe()["series_id"].tolist() == ["a", "a", "b"]
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from numpy import linspace
+from numpy.random import default_rng
+
+from src.anomaly_detection.utils.spot import StreamingPOT
+
+
+class TestStreamingPOT(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.rng = default_rng(seed=42)
+        self.features = ["col_1", "col_2"]
+
+    def test_spot_flags_injected_anomalies(self):
+        spot = StreamingPOT(features=self.features, quantile=0.98, risk=1e-4)
+        spot.initialize(values=self.rng.normal(size=(5000, 2)))
+        batch = self.rng.normal(size=(2000, 2))
+        batch[::500] += 15.0
+
+        is_anomaly = spot.update(values=batch)
+
+        assert is_anomaly[::500].all()
+        assert is_anomaly.sum() <= 8 + 10
+        assert (spot.anomaly_th > spot.init_th).all()
+
+    def test_spot_refits_gpd_only_after_peaks_grew(self):
+        spot = StreamingPOT(features=self.features, quantile=0.98, risk=1e-4, refit_growth=0.5)
+        spot.initialize(values=self.rng.normal(size=(5000, 2)))
+        gpd_scale = spot.gpd_scale.copy()
+
+        spot.update(values=self.rng.normal(size=(100, 2)))
+        assert (spot.gpd_scale == gpd_scale).all()
+
+        spot.update(values=self.rng.normal(size=(5000, 2)))
+        assert (spot.gpd_scale != gpd_scale).all()
+
+    def test_dspot_follows_drift(self):
+        values = linspace(0.0, 500.0, 20000)[:, None] + self.rng.normal(size=(20000, 1))
+        dspot = StreamingPOT(features=["col_1"], quantile=0.98, risk=1e-4, drift_depth=20)
+        spot = StreamingPOT(features=["col_1"], quantile=0.98, risk=1e-4)
+        dspot.initialize(values=values[:5000])
+        spot.initialize(values=values[:5000])
+
+        assert dspot.update(values=values[5000:]).sum() < 20
+        assert spot.update(values=values[5000:]).mean() > 0.9
+
+    def test_update_failed_caused_by_uninitialized_stream(self):
+        with self.assertRaises(ValueError):
+            StreamingPOT(features=self.features).update(values=self.rng.normal(size=(10, 2)))
+
+    def test_update_failed_caused_by_wrong_number_of_features(self):
+        spot = StreamingPOT(features=self.features)
+        spot.initialize(values=self.rng.normal(size=(100, 2)))
+
+        with self.assertRaises(ValueError):
+            spot.update(values=self.rng.normal(size=(10, 3)))
+
+    def tearDown(self) -> None:
+        return super().tearDown()